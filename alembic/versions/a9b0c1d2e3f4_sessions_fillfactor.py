@@ -0,0 +1,34 @@
+"""lower sessions fillfactor for HOT next_seq updates
+
+Revision ID: a9b0c1d2e3f4
+Revises: f8a9b0c1d2e3
+Create Date: 2026-10-17
+
+Every message append bumps sessions.next_seq and updated_at. Neither column
+is indexed, so with free space on the page PostgreSQL can apply the update
+as a heap-only tuple (HOT): no index entries, smaller WAL records, and
+in-page pruning instead of index bloat. fillfactor=70 reserves that space.
+
+UNLOGGED was considered and rejected: sessions also holds leases,
+compaction state and principal ownership, and is referenced by the
+messages foreign key.
+"""
+
+from alembic import op
+
+revision = "a9b0c1d2e3f4"
+down_revision = "f8a9b0c1d2e3"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "neomagi"
+
+
+def upgrade() -> None:
+    """Reserve page space on sessions for HOT updates."""
+    op.execute(f"ALTER TABLE {SCHEMA}.sessions SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    """Restore the default fillfactor."""
+    op.execute(f"ALTER TABLE {SCHEMA}.sessions RESET (fillfactor)")
@@ -0,0 +1,33 @@
+"""add composite (scope_key, search_vector) GIN index on memory_entries
+
+Revision ID: d4e5f6a7b8c9
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-17
+
+Memory search always filters by scope_key together with the tsvector
+match. btree_gin lets a single GIN index cover both predicates instead of
+bitmap-ANDing idx_memory_entries_scope with idx_memory_entries_search.
+"""
+
+from alembic import op
+
+revision = "d4e5f6a7b8c9"
+down_revision = "b2c3d4e5f6a7"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "neomagi"
+
+
+def upgrade() -> None:
+    """Install btree_gin and create the composite index."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_memory_entries_scope_search"
+        f" ON {SCHEMA}.memory_entries USING gin (scope_key, search_vector)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the composite index (btree_gin extension is left installed)."""
+    op.execute(f"DROP INDEX IF EXISTS {SCHEMA}.idx_memory_entries_scope_search")
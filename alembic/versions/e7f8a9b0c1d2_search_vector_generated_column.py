@@ -0,0 +1,79 @@
+"""replace search_vector trigger with a STORED generated column
+
+Revision ID: e7f8a9b0c1d2
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-17
+
+memory_entries.search_vector was maintained by the PL/pgSQL BEFORE trigger
+memory_entries_search_trigger(). A generated column computes the same
+weighted tsvector (title A, COALESCE(search_text, content) B) in C without
+the per-row trigger dispatch. Dropping the column also drops its GIN
+indexes, so both are recreated. Existing rows are recomputed on ADD COLUMN.
+"""
+
+from alembic import op
+
+revision = "e7f8a9b0c1d2"
+down_revision = "d4e5f6a7b8c9"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "neomagi"
+
+_SEARCH_VECTOR_EXPR = (
+    "setweight(to_tsvector('simple', COALESCE(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', COALESCE(search_text, content, '')), 'B')"
+)
+
+
+def _create_search_indexes() -> None:
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_memory_entries_search"
+        f" ON {SCHEMA}.memory_entries USING gin (search_vector)"
+    )
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_memory_entries_scope_search"
+        f" ON {SCHEMA}.memory_entries USING gin (scope_key, search_vector)"
+    )
+
+
+def upgrade() -> None:
+    """Drop the search trigger and re-add search_vector as a generated column."""
+    op.execute(
+        f"DROP TRIGGER IF EXISTS trg_memory_entries_search ON {SCHEMA}.memory_entries"
+    )
+    op.execute(f"DROP FUNCTION IF EXISTS {SCHEMA}.memory_entries_search_trigger()")
+    op.execute(f"ALTER TABLE {SCHEMA}.memory_entries DROP COLUMN search_vector")
+    op.execute(
+        f"ALTER TABLE {SCHEMA}.memory_entries ADD COLUMN search_vector TSVECTOR"
+        f" GENERATED ALWAYS AS ({_SEARCH_VECTOR_EXPR}) STORED"
+    )
+    _create_search_indexes()
+
+
+def downgrade() -> None:
+    """Restore the plain search_vector column and its BEFORE trigger."""
+    op.execute(f"ALTER TABLE {SCHEMA}.memory_entries DROP COLUMN search_vector")
+    op.execute(f"ALTER TABLE {SCHEMA}.memory_entries ADD COLUMN search_vector TSVECTOR")
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION {SCHEMA}.memory_entries_search_trigger()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('simple', COALESCE(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('simple',
+                    COALESCE(NEW.search_text, NEW.content, '')), 'B');
+            NEW.updated_at := now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute(f"""
+        CREATE TRIGGER trg_memory_entries_search
+        BEFORE INSERT OR UPDATE ON {SCHEMA}.memory_entries
+        FOR EACH ROW
+        EXECUTE FUNCTION {SCHEMA}.memory_entries_search_trigger();
+    """)
+    # Backfill: fire the trigger once for every existing row
+    op.execute(f"UPDATE {SCHEMA}.memory_entries SET title = title")
+    _create_search_indexes()
@@ -0,0 +1,33 @@
+"""drop redundant messages.session_id index
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-17
+
+uq_messages_session_seq (session_id, seq) has session_id as its leading
+column, so it already serves per-session lookups, the sessions FK check
+and the ordered history load. The standalone ix_neomagi_messages_session_id
+only adds write amplification on every message INSERT.
+"""
+
+from alembic import op
+
+revision = "f8a9b0c1d2e3"
+down_revision = "e7f8a9b0c1d2"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "neomagi"
+
+
+def upgrade() -> None:
+    """Drop the single-column session_id index."""
+    op.execute(f"DROP INDEX IF EXISTS {SCHEMA}.ix_neomagi_messages_session_id")
+
+
+def downgrade() -> None:
+    """Recreate the single-column session_id index."""
+    op.create_index(
+        "ix_neomagi_messages_session_id", "messages", ["session_id"],
+        unique=False, schema=SCHEMA,
+    )
@@ -14,6 +14,7 @@ from src.agent.tool_history import (
     _safe_parse_args,
     _sanitize_tool_call_history,
 )
+from src.session.manager import Message
 from src.session.scope_resolver import SessionIdentity
 
 if TYPE_CHECKING:
@@ -203,7 +204,7 @@ async def _resolve_skills_for_request(
     from src.skills.task_frame import extract_task_frame
 
     tool_names = (
-        tuple(t.name for t in loop._tool_registry.list_tools(mode))
+        tuple(t["function"]["name"] for t in loop._tool_registry.get_tools_schema(mode))
         if loop._tool_registry
         else ()
     )
@@ -480,10 +481,10 @@ async def _handle_tool_calls(
                 yield outcome.denied_event
             if outcome.failure_signal is not None:
                 state.accumulated_failure_signals.append(outcome.failure_signal)
-            await loop._session_manager.append_message(
-                state.session_id, "tool", json.dumps(outcome.result),
-                tool_call_id=outcome.tool_call["id"], lock_token=state.lock_token,
-            )
+        # One round trip per execution group; persisted before the next group runs
+        await loop._session_manager.append_messages(
+            state.session_id, _tool_result_messages(outcomes), lock_token=state.lock_token,
+        )
     _agent_logger().info(
         "tool_call_iteration", iteration=iteration + 1,
         tools_called=len(tool_calls_result), session_id=state.session_id,
@@ -517,10 +518,11 @@ def _resolve_tools_schema(
     loop: AgentLoop,
     mode: Any,
 ) -> tuple[list[dict[str, Any]] | None, list[dict[str, Any]]]:
-    if not loop._tool_registry or not loop._tool_registry.list_tools(mode):
+    # get_tools_schema is cached per mode; an empty schema means no tools.
+    tools_schema = loop._tool_registry.get_tools_schema(mode) if loop._tool_registry else None
+    if not tools_schema:
         return None, []
-    tools_schema = loop._tool_registry.get_tools_schema(mode)
-    return tools_schema, tools_schema or []
+    return tools_schema, tools_schema
 
 
 async def _load_compaction_state(loop: AgentLoop, session_id: str) -> tuple[int | None, str | None]:
@@ -604,6 +606,17 @@ def _tool_calls_payload(tool_calls_result: list[dict[str, str]]) -> list[dict[st
     ]
 
 
+def _tool_result_messages(outcomes: list[Any]) -> list[Message]:
+    return [
+        Message(
+            role="tool",
+            content=json.dumps(outcome.result),
+            tool_call_id=outcome.tool_call["id"],
+        )
+        for outcome in outcomes
+    ]
+
+
 def _log_parse_result(tool_call: dict[str, str]) -> dict:
     parsed_args, parse_error = _safe_parse_args(tool_call["arguments"])
     if parse_error:
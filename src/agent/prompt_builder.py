@@ -262,7 +262,7 @@ class PromptBuilder:
         """Extract search query from recent user messages for memory recall.
 
         Simple rule-based extraction: concatenate recent messages, no LLM call.
-        PostgreSQL plainto_tsquery('simple', ...) handles tokenization.
+        PostgreSQL websearch_to_tsquery('simple', ...) handles tokenization.
         """
         if not recent_messages:
             return ""
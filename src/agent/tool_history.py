@@ -22,16 +22,26 @@ def _safe_parse_args(raw: str | None) -> tuple[dict, str | None]:
 
 
 def _messages_with_seq_to_openai(messages: list[MessageWithSeq]) -> list[dict[str, Any]]:
-    """Convert MessageWithSeq list to OpenAI chat format dicts."""
-    result: list[dict[str, Any]] = []
-    for message in messages:
-        payload: dict[str, Any] = {"role": message.role, "content": message.content or ""}
-        if message.tool_calls is not None:
-            payload["tool_calls"] = message.tool_calls
-        if message.tool_call_id is not None:
-            payload["tool_call_id"] = message.tool_call_id
-        result.append(payload)
-    return result
+    """Convert MessageWithSeq list to OpenAI chat format dicts.
+
+    Plain messages take the two-key fast path; only tool-bearing messages
+    go through the slower builder.
+    """
+    return [
+        {"role": message.role, "content": message.content or ""}
+        if message.tool_calls is None and message.tool_call_id is None
+        else _tool_message_with_seq_to_openai(message)
+        for message in messages
+    ]
+
+
+def _tool_message_with_seq_to_openai(message: MessageWithSeq) -> dict[str, Any]:
+    payload: dict[str, Any] = {"role": message.role, "content": message.content or ""}
+    if message.tool_calls is not None:
+        payload["tool_calls"] = message.tool_calls
+    if message.tool_call_id is not None:
+        payload["tool_call_id"] = message.tool_call_id
+    return payload
 
 
 def _sanitize_tool_call_history(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
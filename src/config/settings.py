@@ -68,6 +68,7 @@ class SessionSettings(BaseSettings):
 
     default_mode: str = "chat_safe"
     dm_scope: str = "main"
+    cache_max_sessions: int = Field(1024, gt=0)  # in-memory LRU bound (SessionManager)
 
     @field_validator("default_mode")
     @classmethod
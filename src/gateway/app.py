@@ -112,12 +112,18 @@ async def _shutdown_telegram(
 
 
 async def _init_database(settings):
-    """Initialize database engine, schema, and session factory."""
+    """Initialize database engine, schema, session factory, and SessionManager."""
     engine = await create_db_engine(settings.database)
     await ensure_schema(engine, settings.database.schema_)
     db_session_factory = make_session_factory(engine)
+    session_manager = SessionManager(
+        db_session_factory=db_session_factory,
+        default_mode=ToolMode(settings.session.default_mode),
+        max_cached_sessions=settings.session.cache_max_sessions,
+        autocommit_session_factory=make_session_factory(engine, autocommit=True),
+    )
     logger.info("db_connected")
-    return engine, db_session_factory
+    return engine, db_session_factory, session_manager
 
 
 async def _run_startup_preflight(app, settings, engine):
@@ -460,11 +466,6 @@ async def _start_telegram(settings, registry, session_manager, budget_gate,
     return adapter, task
 
 
-def _load_settings():
-    """Load and validate settings."""
-    return get_settings()
-
-
 def _bind_app_state(
     app,
     *,
@@ -509,18 +510,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     from src.memory.query_processor import warmup_jieba
     warmup_jieba()
     try:
-        settings = _load_settings()
+        settings = get_settings()
     except ValidationError as e:
         _log_settings_errors(e)
         raise
 
-    engine, db_session_factory = await _init_database(settings)
+    engine, db_session_factory, session_manager = await _init_database(settings)
     await _run_startup_preflight(app, settings, engine)
 
-    session_manager = SessionManager(
-        db_session_factory=db_session_factory,
-        default_mode=ToolMode(settings.session.default_mode),
-    )
     (
         memory_searcher, memory_writer, evolution_engine, tool_registry,
         skill_resolver, skill_projector, skill_learner,
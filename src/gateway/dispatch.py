@@ -200,7 +200,9 @@ async def dispatch_chat(
 
     reservation = None
     try:
-        await session_manager.load_session_from_db(session_id, force=True)
+        await session_manager.load_session_from_db(
+            session_id, force=True, prefetch_compaction=True,
+        )
         reservation = await _reserve_budget_or_raise(budget_gate, entry, session_id=session_id)
         async for event in _yield_agent_events(
             entry, session_id=session_id, content=content, lock_token=lock_token,
@@ -1,20 +1,33 @@
 """Structured logging configuration using structlog.
 
 Call setup_logging() once at application startup before any log calls.
+The minimum level comes from the LOG_LEVEL env var (default INFO) unless
+passed explicitly.
 """
 
 from __future__ import annotations
 
+import logging
+import os
+
 import structlog
 
 
-def setup_logging(*, json_output: bool = True, log_level: str = "INFO") -> None:
+def setup_logging(*, json_output: bool = True, log_level: str | None = None) -> None:
     """Configure structlog for the application.
 
     Args:
         json_output: If True, render logs as JSON. If False, use dev-friendly console output.
         log_level: Minimum log level to emit (DEBUG, INFO, WARNING, ERROR).
+            Defaults to the LOG_LEVEL env var, else INFO. Filtering happens in
+            the bound logger, so calls below the level return immediately
+            without running the processor chain.
     """
+    level_name = (log_level or os.environ.get("LOG_LEVEL") or "INFO").upper()
+    min_level = logging.getLevelNamesMapping().get(level_name)
+    if min_level is None:
+        raise ValueError(f"Unknown log level: {level_name!r}")
+
     shared_processors: list[structlog.types.Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
@@ -30,7 +43,7 @@ def setup_logging(*, json_output: bool = True, log_level: str = "INFO") -> None:
 
     structlog.configure(
         processors=[*shared_processors, renderer],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(min_level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
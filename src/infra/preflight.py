@@ -306,14 +306,20 @@ async def _check_schema_tables(
 
 
 async def _check_search_trigger(engine: AsyncEngine) -> CheckResult:
-    """C7: Verify search vector trigger exists (WARN, not FAIL)."""
+    """C7: Verify search_vector is maintained by PostgreSQL (WARN, not FAIL).
+
+    The check keeps its historical name; search_vector is now a STORED
+    generated column rather than a trigger-maintained one.
+    """
     try:
         async with engine.connect() as conn:
             result = await conn.execute(
                 text(
-                    "SELECT 1 FROM information_schema.triggers "
-                    "WHERE trigger_schema = :schema "
-                    "AND trigger_name = 'trg_memory_entries_search_vector'"
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_schema = :schema "
+                    "AND table_name = 'memory_entries' "
+                    "AND column_name = 'search_vector' "
+                    "AND is_generated = 'ALWAYS'"
                 ),
                 {"schema": DB_SCHEMA},
             )
@@ -321,23 +327,23 @@ async def _check_search_trigger(engine: AsyncEngine) -> CheckResult:
                 return CheckResult(
                     name="search_trigger",
                     status=CheckStatus.OK,
-                    evidence="Search vector trigger exists",
+                    evidence="search_vector is a generated column",
                     impact="",
                     next_action="",
                 )
         return CheckResult(
             name="search_trigger",
             status=CheckStatus.WARN,
-            evidence="Search vector trigger missing",
+            evidence="search_vector is not a generated column",
             impact="Memory search may return stale or empty results",
-            next_action="Run ensure_schema() to recreate the trigger",
+            next_action="Run ensure_schema() to convert the search_vector column",
         )
     except Exception as e:
         return CheckResult(
             name="search_trigger",
             status=CheckStatus.WARN,
-            evidence=f"Trigger check failed: {type(e).__name__}",
-            impact="Cannot verify search trigger state",
+            evidence=f"search_vector check failed: {type(e).__name__}",
+            impact="Cannot verify search_vector state",
             next_action="Check database connectivity",
         )
 
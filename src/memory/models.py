@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from sqlalchemy import (
     Column,
+    Computed,
     Date,
     DateTime,
     Float,
@@ -24,6 +25,14 @@ from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from src.constants import DB_SCHEMA
 from src.session.models import Base
 
+# Weighted tsvector evaluated by PostgreSQL at write time (STORED generated column,
+# no PL/pgSQL trigger). P2-M3c: Jieba-segmented search_text takes precedence over
+# raw content for weight B; title stays weight A.
+SEARCH_VECTOR_EXPR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(search_text, content, '')), 'B')"
+)
+
 
 class MemoryEntry(Base):
     """Memory entries for full-text search.
@@ -63,7 +72,7 @@ class MemoryEntry(Base):
     search_text = Column(Text, nullable=True)  # P2-M3c: Jieba-segmented content for tsvector
     tags = Column(ARRAY(Text), default=list)
     confidence = Column(Float, nullable=True)
-    search_vector = Column(TSVECTOR, nullable=True)
+    search_vector = Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPR, persisted=True))
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
@@ -22,6 +22,13 @@ _NOISE_RE = re.compile(
     re.UNICODE,
 )
 
+# Query-side noise: additionally keeps '"' (phrase) and '-' (exclusion), which
+# websearch_to_tsquery interprets as operators.
+_QUERY_NOISE_RE = re.compile(
+    r"[^\w\s\u4e00-\u9fff\u3400-\u4dbf\uf900-\ufaff\"-]",
+    re.UNICODE,
+)
+
 
 def _has_cjk(text: str) -> bool:
     """Return True if text contains any CJK character."""
@@ -41,9 +48,9 @@ def _segment_cjk(text: str) -> str:
 
 
 def normalize_query(query: str) -> str:
-    """Normalize a search query for plainto_tsquery.
+    """Normalize a search query for websearch_to_tsquery.
 
-    1. Strip excess whitespace and punctuation noise
+    1. Strip excess whitespace and punctuation noise (keep '"' and '-' operators)
     2. Detect CJK characters → Jieba cut_for_search → join with space
     3. Non-CJK parts: lowercase, preserve as-is
     4. Return normalized query string
@@ -55,7 +62,7 @@ def normalize_query(query: str) -> str:
     text = unicodedata.normalize("NFC", query.strip())
 
     # Remove noise punctuation
-    text = _NOISE_RE.sub(" ", text)
+    text = _QUERY_NOISE_RE.sub(" ", text)
 
     # Collapse whitespace
     text = re.sub(r"\s+", " ", text).strip()
@@ -12,7 +12,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 import structlog
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.constants import DB_SCHEMA
@@ -25,9 +25,12 @@ if TYPE_CHECKING:
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class MemorySearchResult:
-    """Single search result from memory_entries."""
+    """Single search result from memory_entries.
+
+    Field order matches the search SELECT list (constructed positionally).
+    """
 
     entry_id: int
     scope_key: str
@@ -63,65 +66,38 @@ class MemorySearcher:
         min_score: float, source_types: list[str] | None,
         principal_id: str | None,
     ) -> tuple[str, dict]:
-        """Build tsvector search SQL with V1 visibility policy (P2-M3c, D5).
-
-        Unified SQL for both authenticated and anonymous callers:
-        - private_to_principal: own entries + legacy (principal_id IS NULL)
-        - shareable_summary: same-principal only (V1)
-        - shared_in_space / unknown: excluded (not in any OR branch)
+        """Select the precompiled search SQL variant and bind its params.
 
-        Anonymous callers (ctx_principal_id=NULL): SQL NULL comparison semantics
-        ensure = NULL → UNKNOWN → no match, so only the explicit
-        'principal_id IS NULL' branch passes. Do not rewrite as IS NOT DISTINCT FROM.
-        """
-        search_sql = f"""
-            SELECT
-                id, scope_key, source_type, source_path, title, content,
-                ts_rank(search_vector, query) AS score,
-                tags, created_at, principal_id, visibility
-            FROM {DB_SCHEMA}.memory_entries,
-                 plainto_tsquery('simple', :query) AS query
-            WHERE scope_key = :scope_key
-              AND search_vector @@ query
-              AND (
-                  (COALESCE(visibility, 'private_to_principal') = 'private_to_principal'
-                   AND (principal_id = :ctx_principal_id OR principal_id IS NULL))
-                  OR
-                  (visibility = 'shareable_summary'
-                   AND principal_id = :ctx_principal_id)
-              )
+        The SQL text is one of four module-level constants (see
+        ``_compose_search_sql``), so the asyncpg prepared-statement cache
+        hits on every call instead of re-parsing a freshly formatted string.
         """
         params: dict = {
-            "query": query.strip(),
+            "query": query,  # websearch_to_tsquery ignores surrounding whitespace
             "scope_key": scope_key,
             "ctx_principal_id": principal_id,
+            "limit": limit,
         }
         if source_types:
-            search_sql += " AND source_type = ANY(:source_types)"
             params["source_types"] = source_types
         if min_score > 0:
-            search_sql += " AND ts_rank(search_vector, query) >= :min_score"
             params["min_score"] = min_score
-        search_sql += " ORDER BY score DESC LIMIT :limit"
-        params["limit"] = limit
-        return search_sql, params
+        return _SEARCH_SQL[(bool(source_types), min_score > 0)], params
 
     async def _execute_search(
         self, search_sql: str, params: dict,
     ) -> list[MemorySearchResult]:
-        """Execute search SQL and map rows to result objects."""
-        results: list[MemorySearchResult] = []
+        """Execute search SQL and map rows to result objects.
+
+        The SELECT list mirrors MemorySearchResult's field order, so rows are
+        unpacked positionally without building per-row kwargs.
+        """
         async with self._db_factory() as db:
-            rows = await db.execute(text(search_sql), params)
-            for row in rows:
-                results.append(MemorySearchResult(
-                    entry_id=row.id, scope_key=row.scope_key,
-                    source_type=row.source_type, source_path=row.source_path,
-                    title=row.title, content=row.content, score=row.score,
-                    tags=row.tags or [], created_at=row.created_at,
-                    principal_id=row.principal_id, visibility=row.visibility,
-                ))
-        return results
+            stmt = _SEARCH_STATEMENTS.get(search_sql)
+            if stmt is None:
+                stmt = text(search_sql)
+            rows = await db.execute(stmt, params)
+            return [MemorySearchResult(*row) for row in rows]
 
     async def search(
         self,
@@ -137,7 +113,7 @@ class MemorySearcher:
 
         P2-M3c: applies Jieba CJK segmentation via normalize_query before tsquery.
         """
-        if not query or not query.strip():
+        if not query or query.isspace():
             return []
 
         normalized = normalize_query(query)
@@ -159,3 +135,54 @@ class MemorySearcher:
             result_count=len(results),
         )
         return results
+
+
+def _compose_search_sql(*, with_source_types: bool, with_min_score: bool) -> str:
+    """Build tsvector search SQL with V1 visibility policy (P2-M3c, D5).
+
+    websearch_to_tsquery accepts "quoted phrases", ``-term`` and ``or`` and never
+    raises on malformed input, so user text is passed through as-is.
+
+    Unified SQL for both authenticated and anonymous callers:
+    - private_to_principal: own entries + legacy (principal_id IS NULL)
+    - shareable_summary: same-principal only (V1)
+    - shared_in_space / unknown: excluded (not in any OR branch)
+
+    Anonymous callers (ctx_principal_id=NULL): SQL NULL comparison semantics
+    ensure = NULL → UNKNOWN → no match, so only the explicit
+    'principal_id IS NULL' branch passes. Do not rewrite as IS NOT DISTINCT FROM.
+    """
+    search_sql = f"""
+            SELECT
+                id, scope_key, source_type, source_path, title, content,
+                ts_rank(search_vector, query) AS score,
+                COALESCE(tags, ARRAY[]::text[]) AS tags,
+                created_at, principal_id, visibility
+            FROM {DB_SCHEMA}.memory_entries,
+                 websearch_to_tsquery('simple', :query) AS query
+            WHERE scope_key = :scope_key
+              AND search_vector @@ query
+              AND (
+                  (COALESCE(visibility, 'private_to_principal') = 'private_to_principal'
+                   AND (principal_id = :ctx_principal_id OR principal_id IS NULL))
+                  OR
+                  (visibility = 'shareable_summary'
+                   AND principal_id = :ctx_principal_id)
+              )
+        """
+    if with_source_types:
+        search_sql += " AND source_type = ANY(:source_types)"
+    if with_min_score:
+        search_sql += " AND ts_rank(search_vector, query) >= :min_score"
+    search_sql += " ORDER BY score DESC LIMIT :limit"
+    return search_sql
+
+
+# Precompiled once: (has source_types filter, has min_score filter) -> SQL.
+# Stable SQL text lets asyncpg reuse its per-connection prepared statements.
+_SEARCH_SQL: dict[tuple[bool, bool], str] = {
+    (st, ms): _compose_search_sql(with_source_types=st, with_min_score=ms)
+    for st in (False, True)
+    for ms in (False, True)
+}
+_SEARCH_STATEMENTS: dict[str, TextClause] = {sql: text(sql) for sql in _SEARCH_SQL.values()}
@@ -16,6 +16,7 @@ Responsibilities:
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 import uuid
@@ -24,6 +25,7 @@ from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import aiofiles
 import structlog
 
 from src.infra.errors import LedgerWriteError, MemoryWriteError, VisibilityPolicyError
@@ -62,6 +64,16 @@ def _uuid7() -> uuid.UUID:
     return uuid.UUID(int=uuid_int)
 
 
+async def _append_bytes(filepath: Path, data: bytes) -> None:
+    """Append pre-encoded bytes to a daily note in a single write.
+
+    Binary append skips the TextIOWrapper layer (no second UTF-8 encode,
+    no text buffer); aiofiles keeps open/write/close off the event loop.
+    """
+    async with aiofiles.open(filepath, "ab") as f:
+        await f.write(data)
+
+
 @dataclass(frozen=True)
 class MemoryWriteResult:
     """Result of append_daily_note(), reflecting write mode semantics."""
@@ -91,6 +103,8 @@ class MemoryWriter:
         self._settings = settings
         self._indexer = indexer
         self._ledger = ledger
+        # Serializes size check + append per file now that the write awaits.
+        self._path_locks: dict[Path, asyncio.Lock] = {}
 
     async def append_daily_note(
         self,
@@ -116,42 +130,17 @@ class MemoryWriter:
         Raises: LedgerWriteError if ledger write fails (ledger-wired mode).
         Raises: MemoryWriteError if projection write fails.
         """
-        # V1: owner = requester
-        policy_entry = MemoryPolicyEntry(
-            entry_id="pending",
-            owner_principal_id=principal_id,
-            visibility=visibility,
-            scope_key=scope_key,
-        )
-        ctx = PolicyContext(principal_id=principal_id, scope_key=scope_key)
-        decision = can_write(ctx, policy_entry)
-        if not decision.allowed:
-            logger.info(
-                "visibility_policy_denied",
-                principal_id=principal_id, visibility=visibility,
-                scope_key=scope_key, reason=decision.reason,
-            )
-            raise VisibilityPolicyError(decision.reason)
+        _check_write_policy(principal_id, visibility, scope_key)
 
         today = target_date or date.today()
-        filename = f"{today.isoformat()}.md"
-        filepath = self._workspace_path / "memory" / filename
+        filepath = self._daily_note_path(today)
 
         entry_id = str(_uuid7())
-        now = datetime.now(UTC)
-        meta_parts = [
-            f"entry_id: {entry_id}",
-            f"source: {source}",
-            f"scope: {scope_key}",
-        ]
-        if principal_id is not None:
-            meta_parts.append(f"principal: {principal_id}")
-        meta_parts.append(f"visibility: {visibility}")
-        if source_session_id:
-            meta_parts.append(f"source_session_id: {source_session_id}")
-        meta_line = f"[{now.strftime('%H:%M')}] ({', '.join(meta_parts)})"
-        entry = f"---\n{meta_line}\n{text}\n"
-        entry_bytes = entry.encode("utf-8")
+        entry_bytes = _format_entry(
+            text, entry_id=entry_id, source=source, scope_key=scope_key,
+            principal_id=principal_id, visibility=visibility,
+            source_session_id=source_session_id,
+        )
 
         if self._ledger:
             # ── Ledger-wired mode: truth-first ──
@@ -169,14 +158,13 @@ class MemoryWriter:
                 )
 
             # Workspace projection (best-effort)
-            projection_written = self._try_write_projection(filepath, entry, entry_bytes)
+            projection_written = await self._try_write_projection(filepath, entry_bytes)
         else:
             # ── No-ledger fallback mode: projection mandatory ──
             ledger_written = False
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            self._check_size_limit(filepath, entry_bytes, filename)  # raises MemoryWriteError
-            with filepath.open("a", encoding="utf-8") as f:
-                f.write(entry)
+            async with self._path_lock(filepath):
+                self._check_size_limit(filepath, len(entry_bytes))  # raises MemoryWriteError
+                await self._append_mandatory(filepath, entry_bytes)
             projection_written = True
 
         if projection_written:
@@ -203,50 +191,73 @@ class MemoryWriter:
             projection_path=filepath if projection_written else None,
         )
 
-    def _try_write_projection(
-        self, filepath: Path, entry: str, entry_bytes: bytes,
-    ) -> bool:
+    async def _try_write_projection(self, filepath: Path, entry_bytes: bytes) -> bool:
         """Best-effort workspace projection write. Only used in ledger-wired mode.
 
         Never raises. Size limit exceeded → skip + warning.
         """
-        try:
-            current_size = filepath.stat().st_size if filepath.exists() else 0
-            if current_size + len(entry_bytes) > self._settings.max_daily_note_bytes:
-                logger.warning(
-                    "daily_note_projection_size_limit",
-                    path=str(filepath), current_size=current_size,
-                    entry_size=len(entry_bytes),
-                    max_bytes=self._settings.max_daily_note_bytes,
-                )
+        async with self._path_lock(filepath):
+            try:
+                current_size = self._current_size(filepath)
+                if current_size + len(entry_bytes) > self._settings.max_daily_note_bytes:
+                    logger.warning(
+                        "daily_note_projection_size_limit",
+                        path=str(filepath), current_size=current_size,
+                        entry_size=len(entry_bytes),
+                        max_bytes=self._settings.max_daily_note_bytes,
+                    )
+                    return False
+                filepath.parent.mkdir(parents=True, exist_ok=True)
+                await _append_bytes(filepath, entry_bytes)
+                return True
+            except OSError:
+                logger.warning("daily_note_projection_write_failed", path=str(filepath))
                 return False
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            with filepath.open("a", encoding="utf-8") as f:
-                f.write(entry)
-            return True
-        except OSError:
-            logger.warning("daily_note_projection_write_failed", path=str(filepath))
-            return False
-
-    def _check_size_limit(
-        self, filepath: Path, entry_bytes: bytes, filename: str,
-    ) -> None:
+
+    def _path_lock(self, filepath: Path) -> asyncio.Lock:
+        """Return the append lock for a daily note file (one per path)."""
+        lock = self._path_locks.get(filepath)
+        if lock is None:
+            lock = self._path_locks[filepath] = asyncio.Lock()
+        return lock
+
+    @staticmethod
+    def _current_size(filepath: Path) -> int:
+        """Return the daily note size, stat()-ed on every call (caller holds the path lock).
+
+        Not cached: write_file/edit_file and other workers also append to
+        daily notes, so only the file itself knows its current size.
+        """
+        try:
+            return filepath.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _daily_note_path(self, day: date) -> Path:
+        return self._workspace_path / "memory" / f"{day.isoformat()}.md"
+
+    def _check_size_limit(self, filepath: Path, entry_size: int) -> None:
         """Raise MemoryWriteError if appending would exceed daily note size limit.
 
         Only used in no-ledger fallback mode (preserves pre-M2d behavior).
         """
-        current_size = filepath.stat().st_size if filepath.exists() else 0
-        if current_size + len(entry_bytes) > self._settings.max_daily_note_bytes:
+        current_size = self._current_size(filepath)
+        if current_size + entry_size > self._settings.max_daily_note_bytes:
             logger.warning(
                 "daily_note_size_limit", path=str(filepath),
-                current_size=current_size, entry_size=len(entry_bytes),
+                current_size=current_size, entry_size=entry_size,
                 max_bytes=self._settings.max_daily_note_bytes,
             )
             raise MemoryWriteError(
-                f"Daily note {filename} would exceed size limit "
-                f"({current_size + len(entry_bytes)} > {self._settings.max_daily_note_bytes})"
+                f"Daily note {filepath.name} would exceed size limit "
+                f"({current_size + entry_size} > {self._settings.max_daily_note_bytes})"
             )
 
+    async def _append_mandatory(self, filepath: Path, data: bytes) -> None:
+        """No-ledger fallback append (caller holds the path lock). OSError propagates."""
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        await _append_bytes(filepath, data)
+
     async def _try_incremental_index(
         self, filepath: Path | None, text: str, scope_key: str, today: date,
         *, entry_id: str | None = None, source_session_id: str | None = None,
@@ -280,33 +291,24 @@ class MemoryWriter:
     ) -> int:
         """Filter and persist flush candidates to today's daily note.
 
+        Entries are staged one by one (policy check + ledger append), then the
+        projection is written with a single append for the whole batch.
+
         Counting rule (P2-M2d):
-        - result.ledger_written or result.projection_written → written += 1
+        - ledger-wired: ledger_written → written += 1 (projection stays best-effort)
+        - no-ledger fallback: entry included in the projection append → written += 1;
+          the append stops at the first entry that would exceed the file limit
         - LedgerWriteError → break (DB unavailable)
-        - MemoryWriteError → break (no-ledger fallback: file limit reached)
+        - MemoryWriteError → break (visibility policy denied)
         """
-        written = 0
+        today = date.today()
+        filepath = self._daily_note_path(today)
+        staged: list[_StagedEntry] = []
         for candidate in candidates:
-            if candidate.confidence < min_confidence:
-                logger.debug(
-                    "flush_candidate_filtered",
-                    confidence=candidate.confidence,
-                    min_confidence=min_confidence,
-                )
+            if not _is_flushable(candidate, min_confidence):
                 continue
-            if not candidate.candidate_text.strip():
-                continue
-
             try:
-                result = await self.append_daily_note(
-                    text=candidate.candidate_text,
-                    scope_key=candidate.scope_key,
-                    source="compaction_flush",
-                    source_session_id=candidate.source_session_id,
-                    principal_id=candidate.principal_id,
-                )
-                if result.ledger_written or result.projection_written:
-                    written += 1
+                entry = await self._stage_flush_entry(candidate)
             except (MemoryWriteError, LedgerWriteError):
                 logger.warning(
                     "flush_candidate_write_failed",
@@ -314,10 +316,184 @@ class MemoryWriter:
                     source_session_id=candidate.source_session_id,
                 )
                 break
+            if entry is not None:
+                staged.append(entry)
 
+        written = await self._write_flush_batch(filepath, today, staged)
         logger.info(
             "flush_candidates_processed",
             total=len(candidates),
             written=written,
         )
         return written
+
+    async def _stage_flush_entry(
+        self, candidate: ResolvedFlushCandidate,
+    ) -> _StagedEntry | None:
+        """Policy-check, format and (ledger mode) append one candidate to the ledger.
+
+        Returns None for an idempotent ledger no-op. The size limit is checked
+        at write time, under the path lock.
+        """
+        _check_write_policy(candidate.principal_id, "private_to_principal", candidate.scope_key)
+        entry_id = str(_uuid7())
+        entry_bytes = _format_entry(
+            candidate.candidate_text, entry_id=entry_id, source="compaction_flush",
+            scope_key=candidate.scope_key, principal_id=candidate.principal_id,
+            visibility="private_to_principal",
+            source_session_id=candidate.source_session_id,
+        )
+        if self._ledger:
+            ledger_written = await self._ledger.append(
+                entry_id=entry_id, content=candidate.candidate_text,
+                scope_key=candidate.scope_key, source="compaction_flush",
+                source_session_id=candidate.source_session_id,
+                principal_id=candidate.principal_id, visibility="private_to_principal",
+            )  # LedgerWriteError propagates
+            if not ledger_written:
+                return None
+        return _StagedEntry(candidate=candidate, entry_id=entry_id, entry_bytes=entry_bytes)
+
+    async def _write_flush_batch(
+        self, filepath: Path, today: date, staged: list[_StagedEntry],
+    ) -> int:
+        """Append all staged entries in one write, then index each. Returns written count."""
+        if not staged:
+            return 0
+        if self._ledger:
+            projected = await self._try_write_projection_batch(filepath, staged)
+        else:
+            staged = await self._append_fitting_prefix(filepath, staged)
+            projected = {e.entry_id for e in staged}
+
+        logger.info(
+            "daily_note_appended", path=str(filepath), entries=len(projected),
+            source="compaction_flush",
+        )
+        for e in staged:
+            await self._try_incremental_index(
+                filepath if e.entry_id in projected else None,
+                e.candidate.candidate_text, e.candidate.scope_key, today,
+                entry_id=e.entry_id, source_session_id=e.candidate.source_session_id,
+                principal_id=e.candidate.principal_id,
+            )
+        return len(staged)
+
+    async def _append_fitting_prefix(
+        self, filepath: Path, staged: list[_StagedEntry],
+    ) -> list[_StagedEntry]:
+        """No-ledger fallback: append the longest prefix of ``staged`` that fits.
+
+        Size check and append run under one path lock, like append_daily_note.
+        Stopping at the first entry that does not fit keeps the pre-batch
+        MemoryWriteError → break counting. OSError propagates.
+        """
+        max_bytes = self._settings.max_daily_note_bytes
+        async with self._path_lock(filepath):
+            size = self._current_size(filepath)
+            fitting = 0
+            for e in staged:
+                if size + len(e.entry_bytes) > max_bytes:
+                    logger.warning(
+                        "daily_note_size_limit", path=str(filepath),
+                        current_size=size, entry_size=len(e.entry_bytes),
+                        max_bytes=max_bytes,
+                    )
+                    break
+                size += len(e.entry_bytes)
+                fitting += 1
+            chosen = staged[:fitting]
+            if chosen:
+                await self._append_mandatory(filepath, b"".join(e.entry_bytes for e in chosen))
+        return chosen
+
+    async def _try_write_projection_batch(
+        self, filepath: Path, staged: list[_StagedEntry],
+    ) -> set[str]:
+        """Best-effort batch projection (ledger mode). Returns projected entry_ids.
+
+        Entries that would push the file over the size limit are skipped
+        individually, matching the per-entry _try_write_projection semantics.
+        """
+        max_bytes = self._settings.max_daily_note_bytes
+        async with self._path_lock(filepath):
+            try:
+                size = self._current_size(filepath)
+                chosen: list[_StagedEntry] = []
+                for e in staged:
+                    if size + len(e.entry_bytes) > max_bytes:
+                        logger.warning(
+                            "daily_note_projection_size_limit", path=str(filepath),
+                            current_size=size, entry_size=len(e.entry_bytes),
+                            max_bytes=max_bytes,
+                        )
+                        continue
+                    size += len(e.entry_bytes)
+                    chosen.append(e)
+                if chosen:
+                    filepath.parent.mkdir(parents=True, exist_ok=True)
+                    await _append_bytes(filepath, b"".join(e.entry_bytes for e in chosen))
+                return {e.entry_id for e in chosen}
+            except OSError:
+                logger.warning("daily_note_projection_write_failed", path=str(filepath))
+                return set()
+
+
+@dataclass(frozen=True, slots=True)
+class _StagedEntry:
+    """Flush candidate formatted (and ledger-appended) but not yet projected."""
+
+    candidate: ResolvedFlushCandidate
+    entry_id: str
+    entry_bytes: bytes
+
+
+def _is_flushable(candidate: ResolvedFlushCandidate, min_confidence: float) -> bool:
+    if candidate.confidence < min_confidence:
+        logger.debug(
+            "flush_candidate_filtered",
+            confidence=candidate.confidence,
+            min_confidence=min_confidence,
+        )
+        return False
+    text = candidate.candidate_text
+    return bool(text) and not text.isspace()
+
+
+def _check_write_policy(principal_id: str | None, visibility: str, scope_key: str) -> None:
+    """Raise VisibilityPolicyError when can_write() denies the entry (P2-M3c)."""
+    # V1: owner = requester
+    policy_entry = MemoryPolicyEntry(
+        entry_id="pending",
+        owner_principal_id=principal_id,
+        visibility=visibility,
+        scope_key=scope_key,
+    )
+    ctx = PolicyContext(principal_id=principal_id, scope_key=scope_key)
+    decision = can_write(ctx, policy_entry)
+    if not decision.allowed:
+        logger.info(
+            "visibility_policy_denied",
+            principal_id=principal_id, visibility=visibility,
+            scope_key=scope_key, reason=decision.reason,
+        )
+        raise VisibilityPolicyError(decision.reason)
+
+
+def _format_entry(
+    text: str, *, entry_id: str, source: str, scope_key: str,
+    principal_id: str | None, visibility: str, source_session_id: str | None,
+) -> bytes:
+    """Render one daily-note entry (separator + metadata line + text) as UTF-8."""
+    meta_parts = [
+        f"entry_id: {entry_id}",
+        f"source: {source}",
+        f"scope: {scope_key}",
+    ]
+    if principal_id is not None:
+        meta_parts.append(f"principal: {principal_id}")
+    meta_parts.append(f"visibility: {visibility}")
+    if source_session_id:
+        meta_parts.append(f"source_session_id: {source_session_id}")
+    meta_line = f"[{datetime.now(UTC).strftime('%H:%M')}] ({', '.join(meta_parts)})"
+    return f"---\n{meta_line}\n{text}\n".encode()
@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import json
+from functools import partial
 from typing import TYPE_CHECKING
 
 import structlog
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
-import src.memory.models  # noqa: F401 — register memory tables in Base.metadata
 from src.constants import DB_SCHEMA
-from src.session.models import Base
+from src.memory.models import SEARCH_VECTOR_EXPR  # also registers memory tables in Base.metadata
+from src.session.models import SESSIONS_FILLFACTOR, Base
 
 if TYPE_CHECKING:
     from src.config.settings import DatabaseSettings
 
 logger = structlog.get_logger()
 
+# JSONB bind serializer: compact separators and raw UTF-8 instead of \uXXXX escapes
+# (CJK text is 3 bytes instead of 6). JSONB stores a parsed binary form, so only
+# the wire payload and server-side parse input shrink; read-back is unchanged.
+_json_serializer = partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+
 
 async def create_db_engine(settings: DatabaseSettings) -> AsyncEngine:
     """Create an async SQLAlchemy engine from DatabaseSettings."""
@@ -28,6 +36,7 @@ async def create_db_engine(settings: DatabaseSettings) -> AsyncEngine:
         url,
         pool_size=5,
         max_overflow=10,
+        json_serializer=_json_serializer,
         connect_args={"server_settings": {"search_path": f"{settings.schema_}, public"}},
     )
     logger.info("db_engine_created", host=settings.host, database=settings.name)
@@ -35,13 +44,16 @@ async def create_db_engine(settings: DatabaseSettings) -> AsyncEngine:
 
 
 async def ensure_schema(engine: AsyncEngine, schema: str = DB_SCHEMA) -> None:
-    """Ensure the target schema exists, then create all tables and search triggers."""
+    """Ensure the target schema exists, then create all tables and search columns."""
     async with engine.begin() as conn:
         await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
         await conn.run_sync(Base.metadata.create_all)
         await _add_legacy_columns(conn, schema)
+        await _drop_redundant_message_index(conn, schema)
+        await _set_sessions_fillfactor(conn, schema)
         await _add_memory_entry_columns(conn, schema)
-        await _create_search_trigger(conn, schema)
+        await _ensure_search_vector_column(conn, schema)
+        await _create_scope_search_index(conn, schema)
         await _create_skill_tables(conn, schema)
         await _create_procedure_tables(conn, schema)
         await _create_procedure_spec_governance_tables(conn, schema)
@@ -65,10 +77,27 @@ async def _add_legacy_columns(conn, schema: str) -> None:
         "last_compaction_seq INTEGER",
         "memory_flush_candidates JSONB",
     ]
-    for col_def in columns:
-        await conn.execute(
-            text(f"ALTER TABLE {schema}.sessions ADD COLUMN IF NOT EXISTS {col_def}")
-        )
+    await conn.execute(text(_add_columns_sql(f"{schema}.sessions", columns)))
+
+
+async def _drop_redundant_message_index(conn, schema: str) -> None:
+    """Drop the legacy single-column messages.session_id index (idempotent).
+
+    uq_messages_session_seq (session_id, seq) covers every lookup it served;
+    keeping both only doubles index maintenance on each message INSERT.
+    """
+    await conn.execute(text(f"DROP INDEX IF EXISTS {schema}.ix_neomagi_messages_session_id"))
+
+
+async def _set_sessions_fillfactor(conn, schema: str) -> None:
+    """Apply the sessions fillfactor to tables created before it was declared.
+
+    Only affects newly written pages; existing rows pick it up as they are
+    updated (or after a VACUUM FULL).
+    """
+    await conn.execute(
+        text(f"ALTER TABLE {schema}.sessions SET (fillfactor = {SESSIONS_FILLFACTOR})")
+    )
 
 
 async def _add_memory_entry_columns(conn, schema: str) -> None:
@@ -77,53 +106,107 @@ async def _add_memory_entry_columns(conn, schema: str) -> None:
         "entry_id VARCHAR(36)",
         "source_session_id VARCHAR(256)",
     ]
-    for col_def in columns:
-        await conn.execute(
-            text(f"ALTER TABLE {schema}.memory_entries ADD COLUMN IF NOT EXISTS {col_def}")
-        )
+    await conn.execute(text(_add_columns_sql(f"{schema}.memory_entries", columns)))
 
 
-async def _create_search_trigger(conn, schema: str) -> None:
-    """Create or replace the search vector trigger for memory_entries.
+def _add_columns_sql(table: str, columns: list[str]) -> str:
+    """Build one ALTER TABLE adding every column idempotently (single round trip)."""
+    clauses = ",\n    ".join(f"ADD COLUMN IF NOT EXISTS {col_def}" for col_def in columns)
+    return f"ALTER TABLE {table}\n    {clauses}"
 
-    P2-M3c: uses search_text (Jieba-segmented) with fallback to content.
-    Title remains weight A (short, already keyword-friendly).
-    search_text (or content fallback) gets weight B.
+
+async def _ensure_search_vector_column(conn, schema: str) -> None:
+    """Ensure memory_entries.search_vector is a STORED generated column.
+
+    P2-M3c: uses search_text (Jieba-segmented) with fallback to content, see
+    ``SEARCH_VECTOR_EXPR``. Databases created before the switch carry a plain
+    column maintained by a PL/pgSQL trigger; those are converted once.
     """
-    # Add search_text column (P2-M3c, idempotent)
+    # Add search_text column (P2-M3c, idempotent) — the expression references it
     await conn.execute(
         text(
             f"ALTER TABLE {schema}.memory_entries"
             f" ADD COLUMN IF NOT EXISTS search_text TEXT"
         )
     )
-    await conn.execute(
-        text(f"""
-        CREATE OR REPLACE FUNCTION {schema}.memory_entries_search_vector_update()
-        RETURNS trigger AS $$
-        BEGIN
-            NEW.search_vector :=
-                setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
-                setweight(to_tsvector('simple', coalesce(NEW.search_text, NEW.content, '')), 'B');
-            RETURN NEW;
-        END;
-        $$ LANGUAGE plpgsql
-    """)
-    )
-    await conn.execute(
+    result = await conn.execute(
         text(
-            f"DROP TRIGGER IF EXISTS trg_memory_entries_search_vector"
-            f" ON {schema}.memory_entries"
-        )
-    )
-    await conn.execute(
-        text(f"""
-        CREATE TRIGGER trg_memory_entries_search_vector
-        BEFORE INSERT OR UPDATE ON {schema}.memory_entries
-        FOR EACH ROW
-        EXECUTE FUNCTION {schema}.memory_entries_search_vector_update()
-    """)
+            "SELECT is_generated FROM information_schema.columns"
+            " WHERE table_schema = :schema AND table_name = 'memory_entries'"
+            " AND column_name = 'search_vector'"
+        ),
+        {"schema": schema},
     )
+    if result.scalar() == "ALWAYS":
+        return
+    for stmt in _search_vector_conversion_sql(schema):
+        await conn.execute(text(stmt))
+    logger.info("search_vector_converted_to_generated", schema=schema)
+
+
+def _search_vector_conversion_sql(schema: str) -> list[str]:
+    """DDL replacing the trigger-maintained search_vector with a generated column.
+
+    Covers both trigger variants (ensure_schema and Alembic). Dropping the column
+    also drops its GIN indexes, so idx_memory_entries_search is rebuilt here and
+    the composite index by ``_create_scope_search_index``.
+    """
+    table = f"{schema}.memory_entries"
+    return [
+        f"DROP TRIGGER IF EXISTS trg_memory_entries_search_vector ON {table}",
+        f"DROP TRIGGER IF EXISTS trg_memory_entries_search ON {table}",
+        f"DROP FUNCTION IF EXISTS {schema}.memory_entries_search_vector_update()",
+        f"DROP FUNCTION IF EXISTS {schema}.memory_entries_search_trigger()",
+        f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector",
+        f"ALTER TABLE {table} ADD COLUMN search_vector TSVECTOR"
+        f" GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPR}) STORED",
+        f"CREATE INDEX IF NOT EXISTS idx_memory_entries_search"
+        f" ON {table} USING gin (search_vector)",
+    ]
+
+
+async def _create_scope_search_index(conn, schema: str) -> None:
+    """Composite GIN on (scope_key, search_vector) for the scoped FTS predicate.
+
+    Every memory search filters ``scope_key = :scope_key AND search_vector @@ query``;
+    btree_gin lets one GIN index serve both instead of a bitmap-AND of two.
+    Kept out of the ORM model so plain create_all() works without the extension.
+    Skipped (with a warning) when btree_gin cannot be used; Alembic migration
+    d4e5f6a7b8c9 is the supported install path.
+    """
+    if not await _ensure_btree_gin(conn):
+        return
+    await conn.execute(text(
+        f"CREATE INDEX IF NOT EXISTS idx_memory_entries_scope_search"
+        f" ON {schema}.memory_entries USING gin (scope_key, search_vector)"
+    ))
+
+
+async def _ensure_btree_gin(conn) -> bool:
+    """Return True if btree_gin is installed, installing it only when available.
+
+    The install runs in a SAVEPOINT: lacking CREATE privilege on the database
+    must not abort the surrounding ensure_schema transaction.
+    """
+    result = await conn.execute(text(
+        "SELECT installed_version FROM pg_available_extensions WHERE name = 'btree_gin'"
+    ))
+    row = result.first()
+    if row is None:
+        logger.warning("btree_gin_unavailable", index="idx_memory_entries_scope_search")
+        return False
+    if row.installed_version is not None:
+        return True
+    try:
+        async with conn.begin_nested():
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gin"))
+    except DBAPIError as exc:
+        logger.warning(
+            "btree_gin_install_failed",
+            index="idx_memory_entries_scope_search", error=str(exc.orig),
+        )
+        return False
+    return True
 
 
 async def _create_skill_tables(conn, schema: str) -> None:
@@ -378,16 +461,12 @@ async def _add_principal_id_to_sessions(conn, schema: str) -> None:
 
 async def _add_principal_visibility_to_memory(conn, schema: str) -> None:
     """Add principal_id + visibility columns to memory tables (idempotent, P2-M3b)."""
+    columns = [
+        "principal_id VARCHAR(36)",
+        "visibility VARCHAR(32) NOT NULL DEFAULT 'private_to_principal'",
+    ]
     # memory_source_ledger
-    await conn.execute(text(
-        f"ALTER TABLE {schema}.memory_source_ledger"
-        f" ADD COLUMN IF NOT EXISTS principal_id VARCHAR(36)"
-    ))
-    await conn.execute(text(
-        f"ALTER TABLE {schema}.memory_source_ledger"
-        f" ADD COLUMN IF NOT EXISTS visibility VARCHAR(32) NOT NULL"
-        f" DEFAULT 'private_to_principal'"
-    ))
+    await conn.execute(text(_add_columns_sql(f"{schema}.memory_source_ledger", columns)))
     # CHECK constraint (idempotent via IF NOT EXISTS pattern)
     await conn.execute(text(f"""DO $$ BEGIN
         IF NOT EXISTS (
@@ -404,15 +483,7 @@ async def _add_principal_visibility_to_memory(conn, schema: str) -> None:
     END $$"""))
 
     # memory_entries
-    await conn.execute(text(
-        f"ALTER TABLE {schema}.memory_entries"
-        f" ADD COLUMN IF NOT EXISTS principal_id VARCHAR(36)"
-    ))
-    await conn.execute(text(
-        f"ALTER TABLE {schema}.memory_entries"
-        f" ADD COLUMN IF NOT EXISTS visibility VARCHAR(32) NOT NULL"
-        f" DEFAULT 'private_to_principal'"
-    ))
+    await conn.execute(text(_add_columns_sql(f"{schema}.memory_entries", columns)))
     await conn.execute(text(
         f"CREATE INDEX IF NOT EXISTS idx_memory_entries_principal"
         f" ON {schema}.memory_entries (principal_id)"
@@ -423,6 +494,12 @@ async def _add_principal_visibility_to_memory(conn, schema: str) -> None:
     ))
 
 
-def make_session_factory(engine: AsyncEngine) -> async_sessionmaker:
-    """Create an async session factory bound to the engine."""
+def make_session_factory(engine: AsyncEngine, *, autocommit: bool = False) -> async_sessionmaker:
+    """Create an async session factory bound to the engine.
+
+    With ``autocommit=True`` connections run in AUTOCOMMIT mode — for
+    single-statement writes only, skipping the BEGIN/COMMIT round trips.
+    """
+    if autocommit:
+        engine = engine.execution_options(isolation_level="AUTOCOMMIT")
     return async_sessionmaker(engine, expire_on_commit=False)
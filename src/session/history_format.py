@@ -0,0 +1,48 @@
+"""Message list → OpenAI chat / UI display dict conversions for SessionManager."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.session.manager import Message
+
+
+def _messages_to_openai_format(messages: list[Message]) -> list[dict[str, Any]]:
+    """Convert Message list to OpenAI chat format dicts.
+
+    Plain messages (no tool_calls / tool_call_id — the common case) take the
+    two-key fast path; only tool-bearing messages go through the slow builder.
+    """
+    return [
+        {"role": m.role, "content": m.content}
+        if m.tool_calls is None and m.tool_call_id is None
+        else _tool_message_to_openai_format(m)
+        for m in messages
+    ]
+
+
+def _tool_message_to_openai_format(m: Message) -> dict[str, Any]:
+    msg_dict: dict[str, Any] = {"role": m.role, "content": m.content}
+    if m.tool_calls is not None:
+        msg_dict["tool_calls"] = m.tool_calls
+    if m.tool_call_id is not None:
+        msg_dict["tool_call_id"] = m.tool_call_id
+    return msg_dict
+
+
+_DISPLAY_ROLES = frozenset({"user", "assistant"})
+
+
+def _messages_to_history_format(messages: list[Message]) -> list[dict[str, Any]]:
+    """Convert Message list to display-friendly format for chat history.
+
+    Only includes user + assistant messages with non-empty content.
+    Strips tool_calls/tool_call_id to avoid leaking internal state.
+    """
+    # [Decision 0019] Minimal display schema: user/assistant + content + timestamp.
+    return [
+        {"role": m.role, "content": m.content, "timestamp": m.timestamp.isoformat()}
+        for m in messages
+        if m.content and m.role in _DISPLAY_ROLES
+    ]
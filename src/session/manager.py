@@ -1,32 +1,52 @@
 from __future__ import annotations
 
+import sys
 import uuid
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from operator import attrgetter
 from typing import Any, Literal
 
 import structlog
-from sqlalchemy import or_, select, text, update
+from sqlalchemy import or_, select, update
 from sqlalchemy.ext.asyncio import async_sessionmaker
-from sqlalchemy.sql import func
 
+from src.session.history_format import (
+    _messages_to_history_format,
+    _messages_to_openai_format,
+)
 from src.session.models import MessageRecord, SessionRecord
+from src.session.seq_alloc import build_message_insert, build_messages_insert
+from src.session.statements import (
+    CLAIM_UPSERT,
+    LOCK_RELEASE,
+    MODE_SELECT,
+    PRINCIPAL_CLAIM_UPSERT,
+)
 from src.tools.base import ToolMode
 
 logger = structlog.get_logger()
 
+_utcnow = partial(datetime.now, UTC)
+_NOT_PREFETCHED = object()
+_LOAD_BATCH_ROWS = 1000  # full-reload streaming batch (server-side cursor)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Message:
     role: Literal["user", "assistant", "system", "tool"]
     content: str
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = field(default_factory=_utcnow)
     tool_calls: list[dict[str, Any]] | None = None
     tool_call_id: str | None = None
-    seq: int | None = None  # Populated when loaded from DB or after persist
+    seq: int | None = None  # Populated when loaded from DB or after persist (via replace)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MessageWithSeq:
     """Message with guaranteed seq for compaction operations (ADR 0031)."""
 
@@ -37,7 +57,7 @@ class MessageWithSeq:
     tool_call_id: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompactionState:
     """Compaction state loaded from session record."""
 
@@ -46,7 +66,7 @@ class CompactionState:
     compaction_metadata: dict | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClaimResult:
     """Result of claim_session_for_principal() (P2-M3a D7)."""
 
@@ -54,12 +74,29 @@ class ClaimResult:
     error_code: str | None  # None = success
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     id: str
     messages: list[Message] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime | None = None  # defaults to created_at (one clock read)
+    # UI display view of messages, built lazily by get_history_for_display and
+    # extended in place by _extend_session (messages are append-only). A full
+    # reload from DB creates a fresh Session, resetting it.
+    _display_cache: list[dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    # Compaction state read by the claimed per-turn reload (see
+    # load_session_from_db(prefetch_compaction=True)); consumed once by
+    # get_compaction_state. Scoped to the claim: cleared by release_session and
+    # by any unclaimed reload, so it never outlives the turn that read it.
+    _compaction_prefetch: CompactionState | None | object = field(
+        default=_NOT_PREFETCHED, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        if self.updated_at is None:
+            self.updated_at = self.created_at
 
 
 class SessionManager:
@@ -69,28 +106,70 @@ class SessionManager:
         self,
         db_session_factory: async_sessionmaker,
         default_mode: ToolMode = ToolMode.chat_safe,
+        max_cached_sessions: int = 1024,
+        autocommit_session_factory: async_sessionmaker | None = None,
     ) -> None:
-        self._sessions: dict[str, Session] = {}
+        # LRU order: least recently used first. Every cached message is already
+        # persisted (Decision 0021), so eviction is a plain drop; dispatch
+        # force-reloads the session from DB at the start of each turn.
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self._max_cached_sessions = max_cached_sessions
+        # Sessions this worker holds a claim on (mid-turn); never evicted, so
+        # an in-flight turn keeps appending to the object dispatch loaded.
+        self._claimed: set[str] = set()
         self._db: async_sessionmaker = db_session_factory
+        # Single-statement work (message persist, lock release, per-turn reads)
+        # needs no explicit transaction; an AUTOCOMMIT factory saves the
+        # BEGIN and COMMIT/ROLLBACK round trips around it.
+        self._db_autocommit: async_sessionmaker = (
+            autocommit_session_factory or db_session_factory
+        )
         self._default_mode = default_mode
 
     def get_or_create(self, session_id: str) -> Session:
         """Get existing session or create a new one (in-memory)."""
-        if session_id not in self._sessions:
+        session = self._sessions.get(session_id)
+        if session is None:
             logger.info("session_created", session_id=session_id)
-            self._sessions[session_id] = Session(id=session_id)
-        return self._sessions[session_id]
+            session = Session(id=session_id)
+            self._cache_session(session)
+        else:
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def _cache_session(self, session: Session) -> None:
+        """Insert/refresh a session as most recently used; evict beyond the bound.
+
+        Victims are taken in LRU order, skipping claimed sessions and the one
+        just inserted. If nothing is evictable the cache stays over the bound
+        until a later insert finds a released session.
+        """
+        self._sessions[session.id] = session
+        self._sessions.move_to_end(session.id)
+        while len(self._sessions) > self._max_cached_sessions:
+            evicted_id = next(
+                (
+                    sid for sid in self._sessions
+                    if sid not in self._claimed and sid != session.id
+                ),
+                None,
+            )
+            if evicted_id is None:
+                break
+            del self._sessions[evicted_id]
+            logger.debug("session_cache_evicted", session_id=evicted_id)
 
     async def get_mode(self, session_id: str) -> ToolMode:
         """Get the effective ToolMode for a session.
 
-        Reads from DB. On any error or invalid value, fail-closed to chat_safe.
+        Reads from DB on every call (never cached: set_mode on another worker
+        must take effect on the next turn) as one autocommit SELECT.
+        On any error or invalid value, fail-closed to chat_safe.
         Respects per-session coding mode set via set_mode() (ADR 0058).
         """
         try:
-            async with self._db() as db_session:
-                stmt = select(SessionRecord.mode).where(SessionRecord.id == session_id)
-                result = await db_session.execute(stmt)
+            async with self._db_autocommit() as db_session:
+                result = await db_session.execute(MODE_SELECT, {"sid": session_id})
                 mode_str = result.scalar_one_or_none()
 
             if mode_str is None:
@@ -173,37 +252,19 @@ class SessionManager:
 
         Returns lock_token (str) if claimed, None if session is busy.
         """
-        from sqlalchemy.dialects.postgresql import insert as pg_insert
-
         lock_token = str(uuid.uuid4())
 
         async with self._db() as db_session:
-            stmt = (
-                pg_insert(SessionRecord)
-                .values(
-                    id=session_id,
-                    lock_token=lock_token,
-                    processing_since=func.now(),
-                    next_seq=0,
-                )
-                .on_conflict_do_update(
-                    index_elements=["id"],
-                    set_={
-                        "lock_token": lock_token,
-                        "processing_since": func.now(),
-                    },
-                    where=or_(
-                        SessionRecord.processing_since.is_(None),
-                        SessionRecord.processing_since
-                        < func.now() - text(f"interval '{ttl_seconds} seconds'"),
-                    ),
-                )
-                .returning(SessionRecord.id)
-            )
-            result = await db_session.execute(stmt)
+            result = await db_session.execute(CLAIM_UPSERT, {
+                "sid": session_id, "token": lock_token,
+                "ttl": timedelta(seconds=ttl_seconds),
+            })
             claimed = result.scalar_one_or_none() is not None
             await db_session.commit()
-            return lock_token if claimed else None
+        if not claimed:
+            return None
+        self._claimed.add(session_id)
+        return lock_token
 
     async def claim_session_for_principal(
         self,
@@ -218,45 +279,19 @@ class SessionManager:
         Combines lock acquisition + principal_id assignment in one SQL.
         See D7 ownership matrix in p2-m3a plan.
         """
-
         # Entry guard: auth_mode + no principal → reject before SQL
         if auth_mode and principal_id is None:
             return ClaimResult(lock_token=None, error_code="SESSION_AUTH_REQUIRED")
 
-        from sqlalchemy.dialects.postgresql import insert as pg_insert
-
         lock_token = str(uuid.uuid4())
 
         async with self._db() as db_session:
             # Atomic upsert: insert new session or claim existing
-            # principal_id CASE: claim NULL→principal, preserve existing
-            stmt = (
-                pg_insert(SessionRecord)
-                .values(
-                    id=session_id,
-                    principal_id=principal_id,
-                    lock_token=lock_token,
-                    processing_since=func.now(),
-                    next_seq=0,
-                )
-                .on_conflict_do_update(
-                    index_elements=["id"],
-                    set_={
-                        "lock_token": lock_token,
-                        "processing_since": func.now(),
-                        "principal_id": func.coalesce(
-                            SessionRecord.principal_id, principal_id,
-                        ),
-                    },
-                    where=or_(
-                        SessionRecord.processing_since.is_(None),
-                        SessionRecord.processing_since
-                        < func.now() - text(f"interval '{ttl_seconds} seconds'"),
-                    ),
-                )
-                .returning(SessionRecord.id, SessionRecord.principal_id)
-            )
-            result = await db_session.execute(stmt)
+            # principal_id COALESCE: claim NULL→principal, preserve existing
+            result = await db_session.execute(PRINCIPAL_CLAIM_UPSERT, {
+                "sid": session_id, "token": lock_token, "principal": principal_id,
+                "ttl": timedelta(seconds=ttl_seconds),
+            })
             row = result.first()
 
             if row is None:
@@ -285,7 +320,8 @@ class SessionManager:
                 return ClaimResult(lock_token=None, error_code="SESSION_AUTH_REQUIRED")
 
             await db_session.commit()
-            return ClaimResult(lock_token=lock_token, error_code=None)
+        self._claimed.add(session_id)
+        return ClaimResult(lock_token=lock_token, error_code=None)
 
     async def release_session(self, session_id: str, lock_token: str) -> None:
         """Release session processing claim. Only succeeds if lock_token matches.
@@ -294,22 +330,19 @@ class SessionManager:
         expiry), this is a no-op — prevents cascading release where Worker A
         clears Worker B's lock.
         """
-        async with self._db() as db_session:
-            await db_session.execute(
-                update(SessionRecord)
-                .where(
-                    SessionRecord.id == session_id,
-                    SessionRecord.lock_token == lock_token,
-                )
-                .values(processing_since=None, lock_token=None)
-            )
+        self._claimed.discard(session_id)
+        cached = self._sessions.get(session_id)
+        if cached is not None:
+            cached._compaction_prefetch = _NOT_PREFETCHED  # unconsumed if the turn never ran
+        async with self._db_autocommit() as db_session:
+            await db_session.execute(LOCK_RELEASE, {"sid": session_id, "token": lock_token})
             await db_session.commit()
 
     async def get_session_principal(self, session_id: str) -> str | None | object:
         """Get session principal_id. Returns sentinel if session not found."""
         from src.gateway.auth_guard import _SESSION_NOT_FOUND
 
-        async with self._db() as db_session:
+        async with self._db_autocommit() as db_session:
             stmt = select(SessionRecord.principal_id).where(SessionRecord.id == session_id)
             result = await db_session.execute(stmt)
             row = result.first()
@@ -319,7 +352,7 @@ class SessionManager:
 
     async def stamp_session_principal(self, session_id: str, principal_id: str) -> None:
         """Stamp principal_id on a NULL-principal session (idempotent, no lock)."""
-        async with self._db() as db_session:
+        async with self._db_autocommit() as db_session:
             await db_session.execute(
                 update(SessionRecord)
                 .where(
@@ -333,11 +366,7 @@ class SessionManager:
     @staticmethod
     async def _release_lock_in_session(db_session, session_id: str, lock_token: str) -> None:
         """Release lock within an existing DB session (for claim rollback)."""
-        await db_session.execute(
-            update(SessionRecord)
-            .where(SessionRecord.id == session_id, SessionRecord.lock_token == lock_token)
-            .values(processing_since=None, lock_token=None)
-        )
+        await db_session.execute(LOCK_RELEASE, {"sid": session_id, "token": lock_token})
 
     async def append_message(
         self,
@@ -368,15 +397,34 @@ class SessionManager:
         )
 
         # [Decision 0021] Persist first — no memory pollution on failure
-        seq = await self._persist_message(session_id, msg, lock_token=lock_token)
-        msg.seq = seq
+        seq = await self._persist_message(
+            session_id, msg, lock_token=lock_token, session_exists=bool(session.messages),
+        )
+        msg = replace(msg, seq=seq)
 
         # Only reach here if persist succeeded
-        session.messages.append(msg)
-        session.updated_at = msg.timestamp
+        _extend_session(session, [msg])
         logger.debug("message_appended", role=role, session_id=session_id)
         return msg
 
+    async def append_messages(
+        self, session_id: str, messages: list[Message], *, lock_token: str | None = None,
+    ) -> list[Message]:
+        """Append several messages in one DB round trip; returns them with seq set.
+
+        Same guarantees as append_message ([Decision 0021] persist first, fencing
+        via lock_token); seqs form one contiguous block in list order.
+        """
+        if not messages:
+            return []
+        session = self.get_or_create(session_id)
+        base_seq = await self._persist_messages(session_id, messages, lock_token=lock_token)
+        persisted = [replace(m, seq=base_seq + i) for i, m in enumerate(messages)]
+
+        _extend_session(session, persisted)
+        logger.debug("messages_appended", count=len(persisted), session_id=session_id)
+        return persisted
+
     def get_history(self, session_id: str) -> list[dict[str, Any]]:
         """Get message history in OpenAI chat format.
 
@@ -390,18 +438,7 @@ class SessionManager:
 
         Messages without seq (not yet persisted) are excluded.
         """
-        session = self.get_or_create(session_id)
-        return [
-            MessageWithSeq(
-                seq=m.seq,
-                role=m.role,
-                content=m.content,
-                tool_calls=m.tool_calls,
-                tool_call_id=m.tool_call_id,
-            )
-            for m in session.messages
-            if m.seq is not None
-        ]
+        return _messages_with_seq(self.get_or_create(session_id).messages)
 
     def get_effective_history(
         self, session_id: str, last_compaction_seq: int | None
@@ -409,37 +446,30 @@ class SessionManager:
         """Unique rebuild entry point (ADR 0031).
 
         Returns messages WHERE seq > last_compaction_seq (or all if None).
-        In-memory cache preferred.
+        In-memory cache preferred. Cached messages are persisted in seq order
+        (Decision 0021), so the compaction cut is found by bisection.
         """
-        all_msgs = self.get_history_with_seq(session_id)
-        if last_compaction_seq is None:
-            return all_msgs
-        return [m for m in all_msgs if m.seq > last_compaction_seq]
+        messages = self.get_or_create(session_id).messages
+        if last_compaction_seq is not None:
+            start = bisect_right(messages, last_compaction_seq, key=_message_seq)
+            messages = messages[start:]
+        return _messages_with_seq(messages)
 
     async def get_compaction_state(self, session_id: str) -> CompactionState | None:
         """Load compacted_context + last_compaction_seq + compaction_metadata.
 
-        Returns None if session has no compaction history.
+        Returns None if session has no compaction history. Served without a
+        query when the claimed per-turn reload already fetched it.
         """
-        async with self._db() as db_session:
-            stmt = select(
-                SessionRecord.compacted_context,
-                SessionRecord.last_compaction_seq,
-                SessionRecord.compaction_metadata,
-            ).where(SessionRecord.id == session_id)
+        cached = self._sessions.get(session_id)
+        if cached is not None and cached._compaction_prefetch is not _NOT_PREFETCHED:
+            state, cached._compaction_prefetch = cached._compaction_prefetch, _NOT_PREFETCHED
+            return state
+        async with self._db_autocommit() as db_session:
+            stmt = select(*_COMPACTION_COLUMNS).where(SessionRecord.id == session_id)
             result = await db_session.execute(stmt)
             row = result.one_or_none()
-
-        if row is None:
-            return None
-        if row[0] is None and row[1] is None and row[2] is None:
-            return None
-
-        return CompactionState(
-            compacted_context=row[0],
-            last_compaction_seq=row[1],
-            compaction_metadata=row[2],
-        )
+        return None if row is None else _compaction_state_from_row(row)
 
     async def store_compaction_result(
         self,
@@ -454,6 +484,9 @@ class SessionManager:
         """
         from src.infra.errors import SessionFencingError
 
+        cached = self._sessions.get(session_id)
+        if cached is not None:
+            cached._compaction_prefetch = _NOT_PREFETCHED
         async with self._db() as db_session:
             stmt = (
                 update(SessionRecord)
@@ -479,33 +512,34 @@ class SessionManager:
         logger.info("compaction_stored", session_id=session_id,
                      new_compaction_seq=result.new_compaction_seq, status=result.status)
 
-    async def load_session_from_db(self, session_id: str, *, force: bool = False) -> bool:
+    async def load_session_from_db(
+        self, session_id: str, *, force: bool = False, prefetch_compaction: bool = False,
+    ) -> bool:
         """Load a session from DB into memory cache. Returns True if found.
 
         [Decision 0021] force=True: DB errors propagate instead of returning False.
+        prefetch_compaction: the caller holds the session claim and is about to
+        run a turn; the incremental refresh also stashes the compaction state
+        for the next get_compaction_state (no extra round trip).
         """
-        if session_id in self._sessions and not force:
+        cached = self._sessions.get(session_id)
+        if cached is not None and not force:
+            self._sessions.move_to_end(session_id)
             return True
 
         try:
             async with self._db() as db_session:
-                stmt = select(SessionRecord).where(SessionRecord.id == session_id)
-                record = (await db_session.execute(stmt)).scalar_one_or_none()
-                if record is None:
+                if cached is not None and await self._refresh_cached(
+                    db_session, cached, prefetch_compaction=prefetch_compaction,
+                ):
+                    self._sessions.move_to_end(session_id)
+                    return True
+                session = await self._load_full(db_session, session_id)
+                if session is None:
                     return False
-
-                msg_stmt = (
-                    select(MessageRecord)
-                    .where(MessageRecord.session_id == session_id)
-                    .order_by(MessageRecord.seq)
-                )
-                msg_records = (await db_session.execute(msg_stmt)).scalars().all()
-
-                self._sessions[session_id] = self._build_session_from_records(
-                    session_id, record, msg_records,
-                )
+                self._cache_session(session)
                 logger.info("session_loaded_from_db", session_id=session_id,
-                            message_count=len(msg_records))
+                            message_count=len(session.messages))
                 return True
         except Exception:
             if force:
@@ -513,44 +547,130 @@ class SessionManager:
             logger.exception("session_load_failed", session_id=session_id)
             return False
 
+    @classmethod
+    async def _load_full(cls, db_session: Any, session_id: str) -> Session | None:
+        """Load a session and all its messages; None if the session does not exist.
+
+        Session timestamps LEFT JOIN its messages, seq-ordered (only the narrow
+        session columns repeat per row). Rows are streamed in batches and
+        converted as they arrive, so ORM records of long histories are never
+        all alive at once.
+        """
+        stmt = (
+            select(SessionRecord.created_at, SessionRecord.updated_at, MessageRecord)
+            .outerjoin(MessageRecord, MessageRecord.session_id == SessionRecord.id)
+            .where(SessionRecord.id == session_id)
+            .order_by(MessageRecord.seq)
+            .execution_options(yield_per=_LOAD_BATCH_ROWS)
+        )
+        record = None
+        messages: list[Message] = []
+        async for batch in (await db_session.stream(stmt)).partitions():
+            record = record or batch[0]
+            messages.extend(_message_from_record(row[2]) for row in batch if row[2] is not None)
+        if record is None:
+            return None
+        return cls._build_session_from_records(session_id, record, messages)
+
+    @staticmethod
+    async def _refresh_cached(
+        db_session: Any, session: Session, *, prefetch_compaction: bool = False,
+    ) -> bool:
+        """Bring a cached session up to date incrementally; False → full reload needed.
+
+        sessions.next_seq is bumped in the same statement that inserts each
+        message, so it versions the history (updated_at does not: neither seq
+        allocation path touches it). A cache holding seqs 0..n-1 is current when next_seq == n;
+        when next_seq > n only the tail rows (seq >= n) are fetched and appended.
+        The probe row also carries the (single-row) compaction columns.
+        """
+        n = len(session.messages)
+        if n and session.messages[-1].seq != n - 1:
+            return False  # non-contiguous (legacy) seqs — cannot tail-fetch
+        probe = (await db_session.execute(
+            select(SessionRecord.next_seq, *_COMPACTION_COLUMNS)
+            .where(SessionRecord.id == session.id)
+        )).first()
+        next_seq = None if probe is None else probe[0]
+        if next_seq is None or next_seq < n:
+            return False
+        session._compaction_prefetch = (
+            _compaction_state_from_row(probe[1:]) if prefetch_compaction else _NOT_PREFETCHED
+        )
+        if next_seq > n:
+            tail = (await db_session.execute(
+                select(MessageRecord)
+                .where(MessageRecord.session_id == session.id, MessageRecord.seq >= n)
+                .order_by(MessageRecord.seq)
+            )).scalars().all()
+            _extend_session(session, [_message_from_record(mr) for mr in tail])
+        return True
+
     async def get_history_for_display(self, session_id: str) -> list[dict[str, Any]]:
         """Get filtered history for chat UI. Only user + assistant with content."""
         # [Decision 0019] chat.history is a UI history API, not an internal context export API.
         # Always force-reload from DB to avoid returning stale cache when
-        # another worker wrote new messages since our last load.
+        # another worker wrote new messages since our last load (a cached
+        # session is refreshed incrementally from its next_seq, see _refresh_cached).
         await self.load_session_from_db(session_id, force=True)
         session = self._sessions.get(session_id)
         if session is None:
             return []
-        return _messages_to_history_format(session.messages)
+        if session._display_cache is None:
+            session._display_cache = _messages_to_history_format(session.messages)
+        # Per-message copies: a caller mutating the result must not corrupt the cache.
+        return [dict(m) for m in session._display_cache]
 
     async def _persist_message(
-        self, session_id: str, msg: Message, *, lock_token: str | None = None
+        self, session_id: str, msg: Message, *,
+        lock_token: str | None = None, session_exists: bool = False,
     ) -> int:
         """Persist a single message to DB with atomic seq allocation and fencing.
 
-        [Decision 0021] Raises on failure — no silent drop.
+        ``session_exists`` (cached messages imply a sessions row) tries the
+        plain UPDATE allocation first; no row back means the session is gone
+        or fenced out, and the upsert path settles which.
+
         Returns the allocated seq number.
         """
-        from src.infra.errors import SessionFencingError
+        if session_exists:
+            stmt, params = build_message_insert(session_id, msg, lock_token, session_exists=True)
+            seqs = await self._run_seq_insert(stmt, params)
+            if seqs:
+                return seqs[0]
+        stmt, params = build_message_insert(session_id, msg, lock_token)
+        return await self._execute_seq_insert(session_id, stmt, params)
+
+    async def _persist_messages(
+        self, session_id: str, msgs: list[Message], *, lock_token: str | None = None
+    ) -> int:
+        """Persist a batch of messages in one statement; returns the first seq."""
+        stmt = build_messages_insert(session_id, msgs, lock_token)
+        return await self._execute_seq_insert(session_id, stmt)
 
-        async with self._db() as db_session:
-            stmt = self._build_session_upsert(session_id, lock_token)
-            seq = (await db_session.execute(stmt)).scalar_one_or_none()
+    async def _execute_seq_insert(
+        self, session_id: str, stmt: Any, params: dict | None = None,
+    ) -> int:
+        """Run a seq-allocating message INSERT and return the lowest seq written.
 
-            if seq is None:
-                raise SessionFencingError(
-                    f"Lock token mismatch for session {session_id}: another worker has taken over"
-                )
+        [Decision 0021] Raises on failure — no silent drop. A fenced-out upsert
+        inserts no rows, which surfaces as SessionFencingError.
+        """
+        from src.infra.errors import SessionFencingError
 
-            db_session.add(MessageRecord(
-                session_id=session_id, seq=seq, role=msg.role,
-                content=msg.content, tool_calls=msg.tool_calls,
-                tool_call_id=msg.tool_call_id,
-            ))
-            await db_session.commit()
-            return seq
+        seqs = await self._run_seq_insert(stmt, params)
+        if not seqs:
+            raise SessionFencingError(
+                f"Lock token mismatch for session {session_id}: another worker has taken over"
+            )
+        return min(seqs)
 
+    async def _run_seq_insert(self, stmt: Any, params: dict | None) -> Sequence[int]:
+        """Execute a seq-allocating INSERT and return the seqs it wrote (maybe none)."""
+        async with self._db_autocommit() as db_session:
+            seqs = (await db_session.execute(stmt, params)).scalars().all()
+            await db_session.commit()
+            return seqs
 
     @staticmethod
     def _build_compaction_values(result: Any) -> dict:
@@ -567,20 +687,12 @@ class SessionManager:
 
     @staticmethod
     def _build_session_from_records(
-        session_id: str, record: SessionRecord, msg_records: list,
+        session_id: str, record: Any, messages: list[Message],
     ) -> Session:
-        """Convert DB records to a Session object."""
-        messages = [
-            Message(
-                role=mr.role, content=mr.content,
-                timestamp=(
-                    mr.created_at.replace(tzinfo=UTC)
-                    if mr.created_at else datetime.now(UTC)
-                ),
-                tool_calls=mr.tool_calls, tool_call_id=mr.tool_call_id, seq=mr.seq,
-            )
-            for mr in msg_records
-        ]
+        """Build a Session from its DB timestamps and already-converted messages.
+
+        ``record`` only needs ``created_at`` / ``updated_at`` (SessionRecord or row).
+        """
         return Session(
             id=session_id, messages=messages,
             created_at=(
@@ -593,62 +705,61 @@ class SessionManager:
             ),
         )
 
-    @staticmethod
-    def _build_session_upsert(session_id: str, lock_token: str | None):
-        """Build atomic session upsert statement for seq allocation."""
-        from sqlalchemy.dialects.postgresql import insert as pg_insert
-
-        update_set = {"next_seq": SessionRecord.next_seq + 1}
-        stmt = pg_insert(SessionRecord).values(id=session_id, next_seq=1)
-
-        if lock_token is not None:
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["id"], set_=update_set,
-                where=or_(
-                    SessionRecord.lock_token == lock_token,
-                    SessionRecord.lock_token.is_(None),
-                ),
-            )
-        else:
-            stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=update_set)
-
-        return stmt.returning(SessionRecord.next_seq - 1)
-
-
-def _messages_to_openai_format(messages: list[Message]) -> list[dict[str, Any]]:
-    """Convert Message list to OpenAI chat format dicts."""
-    result: list[dict[str, Any]] = []
-    for m in messages:
-        msg_dict: dict[str, Any] = {"role": m.role, "content": m.content}
-        if m.tool_calls is not None:
-            msg_dict["tool_calls"] = m.tool_calls
-        if m.tool_call_id is not None:
-            msg_dict["tool_call_id"] = m.tool_call_id
-        result.append(msg_dict)
-    return result
-
 
-def _messages_to_history_format(messages: list[Message]) -> list[dict[str, Any]]:
-    """Convert Message list to display-friendly format for chat history.
+def _message_from_record(mr: Any) -> Message:
+    """Convert a MessageRecord (or row with the same attributes) to a Message.
 
-    Only includes user + assistant messages with non-empty content.
-    Strips tool_calls/tool_call_id to avoid leaking internal state.
+    role is interned: the driver returns a fresh str per row, and there are only
+    four distinct values across the whole history.
     """
-    # [Decision 0019] Minimal display schema: user/assistant + content + timestamp.
-    result: list[dict[str, Any]] = []
-    for m in messages:
-        if m.role not in ("user", "assistant"):
-            continue
-        if not m.content:
-            continue
-        result.append(
-            {
-                "role": m.role,
-                "content": m.content,
-                "timestamp": m.timestamp.isoformat(),
-            }
+    return Message(
+        role=sys.intern(mr.role), content=mr.content,
+        timestamp=mr.created_at.replace(tzinfo=UTC) if mr.created_at else datetime.now(UTC),
+        tool_calls=mr.tool_calls, tool_call_id=mr.tool_call_id, seq=mr.seq,
+    )
+
+
+_message_seq = attrgetter("seq")
+
+_COMPACTION_COLUMNS = (
+    SessionRecord.compacted_context,
+    SessionRecord.last_compaction_seq,
+    SessionRecord.compaction_metadata,
+)
+
+
+def _compaction_state_from_row(row: Sequence[Any]) -> CompactionState | None:
+    """(compacted_context, last_compaction_seq, compaction_metadata) → state or None."""
+    if row[0] is None and row[1] is None and row[2] is None:
+        return None
+    return CompactionState(
+        compacted_context=row[0], last_compaction_seq=row[1], compaction_metadata=row[2],
+    )
+
+
+def _messages_with_seq(messages: list[Message]) -> list[MessageWithSeq]:
+    """Project persisted messages to MessageWithSeq (unpersisted ones skipped)."""
+    return [
+        MessageWithSeq(
+            seq=m.seq,
+            role=m.role,
+            content=m.content,
+            tool_calls=m.tool_calls,
+            tool_call_id=m.tool_call_id,
         )
-    return result
+        for m in messages
+        if m.seq is not None
+    ]
+
+
+def _extend_session(session: Session, messages: list[Message]) -> None:
+    """Append persisted messages to a cached session, keeping its display view warm."""
+    if not messages:
+        return
+    session.messages.extend(messages)
+    if session._display_cache is not None:
+        session._display_cache.extend(_messages_to_history_format(messages))
+    session.updated_at = messages[-1].timestamp
 
 
 def resolve_session(channel_type: str, channel_id: str) -> str:
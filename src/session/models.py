@@ -21,6 +21,8 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from src.constants import DB_SCHEMA
 
+SESSIONS_FILLFACTOR = 70
+
 
 class Base(DeclarativeBase):
     pass
@@ -28,7 +30,9 @@ class Base(DeclarativeBase):
 
 class SessionRecord(Base):
     __tablename__ = "sessions"
-    __table_args__ = {"schema": DB_SCHEMA}
+    # next_seq/updated_at change on every append; free page space keeps those
+    # updates HOT (no index maintenance, smaller WAL records).
+    __table_args__ = {"schema": DB_SCHEMA, "postgresql_with": {"fillfactor": SESSIONS_FILLFACTOR}}
 
     id: Mapped[str] = mapped_column(String(128), primary_key=True)
     mode: Mapped[str] = mapped_column(String(16), nullable=False, default="chat_safe")
@@ -67,8 +71,10 @@ class MessageRecord(Base):
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # No standalone index: uq_messages_session_seq (session_id, seq) already serves
+    # session_id lookups, FK checks and the ordered per-session history scan.
     session_id: Mapped[str] = mapped_column(
-        String(128), ForeignKey(f"{DB_SCHEMA}.sessions.id"), index=True
+        String(128), ForeignKey(f"{DB_SCHEMA}.sessions.id")
     )
     seq: Mapped[int] = mapped_column(Integer)
     role: Mapped[str] = mapped_column(String(16))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionIdentity:
     """Minimal identity for scope resolution.
 
@@ -19,6 +20,30 @@ class SessionIdentity:
     principal_id: str | None = None  # P2-M3a: authenticated principal
 
 
+def _main_scope(identity: SessionIdentity) -> str:
+    return "main"
+
+
+def _per_channel_peer_scope(identity: SessionIdentity) -> str:
+    if identity.peer_id is None:
+        raise ValueError("peer_id required for per-channel-peer")
+    return f"{identity.channel_type}:peer:{identity.peer_id}"
+
+
+def _per_peer_scope(identity: SessionIdentity) -> str:
+    if identity.peer_id is None:
+        raise ValueError("peer_id required for per-peer")
+    return f"peer:{identity.peer_id}"
+
+
+# dm_scope → resolver: one dict probe instead of a string-compare chain.
+_SCOPE_RESOLVERS: dict[str, Callable[[SessionIdentity], str]] = {
+    "main": _main_scope,
+    "per-channel-peer": _per_channel_peer_scope,
+    "per-peer": _per_peer_scope,
+}
+
+
 def resolve_scope_key(identity: SessionIdentity, dm_scope: str = "main") -> str:
     """Pure function: identity + dm_scope → scope_key.
 
@@ -27,17 +52,10 @@ def resolve_scope_key(identity: SessionIdentity, dm_scope: str = "main") -> str:
     - 'per-channel-peer' → "{channel_type}:peer:{peer_id}" (M4 Telegram default)
     - 'per-peer' → "peer:{peer_id}" (cross-channel peer isolation)
     """
-    if dm_scope == "main":
-        return "main"
-    if dm_scope == "per-channel-peer":
-        if identity.peer_id is None:
-            raise ValueError("peer_id required for per-channel-peer")
-        return f"{identity.channel_type}:peer:{identity.peer_id}"
-    if dm_scope == "per-peer":
-        if identity.peer_id is None:
-            raise ValueError("peer_id required for per-peer")
-        return f"peer:{identity.peer_id}"
-    raise ValueError(f"Unsupported dm_scope: '{dm_scope}'")
+    resolver = _SCOPE_RESOLVERS.get(dm_scope)
+    if resolver is None:
+        raise ValueError(f"Unsupported dm_scope: '{dm_scope}'")
+    return resolver(identity)
 
 
 def resolve_session_key(identity: SessionIdentity, dm_scope: str = "main") -> str:
@@ -0,0 +1,159 @@
+"""Seq-allocating message INSERT statements for SessionManager persistence.
+
+Each statement runs the session upsert (or, for a session known to exist, a
+plain UPDATE) as a data-modifying CTE (``seq_alloc``) and inserts the message
+rows from its RETURNING: one round trip per append, and a fenced-out upsert
+(lock_token mismatch → no row) inserts nothing.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    Integer,
+    bindparam,
+    column,
+    insert,
+    literal,
+    or_,
+    select,
+    true,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.session.models import MessageRecord, SessionRecord
+
+if TYPE_CHECKING:
+    from src.session.manager import Message
+
+_MESSAGE_COLUMNS = ["session_id", "seq", "role", "content", "tool_calls", "tool_call_id"]
+
+
+def build_session_upsert(session_id: Any, lock_token: Any, count: int = 1):
+    """Build atomic session upsert statement allocating ``count`` seqs.
+
+    ``session_id``/``lock_token`` may be plain values or bindparams; a
+    ``lock_token`` of None builds the unfenced variant. RETURNING yields the
+    first allocated seq.
+    """
+    update_set = {"next_seq": SessionRecord.next_seq + count}
+    stmt = pg_insert(SessionRecord).values(id=session_id, next_seq=count)
+
+    if lock_token is not None:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["id"], set_=update_set,
+            where=or_(
+                SessionRecord.lock_token == lock_token,
+                SessionRecord.lock_token.is_(None),
+            ),
+        )
+    else:
+        stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=update_set)
+
+    return stmt.returning((SessionRecord.next_seq - count).label("seq"))
+
+
+def build_session_bump(session_id: Any, lock_token: Any, count: int = 1):
+    """Plain UPDATE form of ``build_session_upsert`` for sessions known to exist.
+
+    Skips the INSERT attempt and conflict check; yields no row when the
+    session is missing or fenced out, so callers fall back to the upsert.
+    Like the upsert, it leaves ``updated_at`` untouched: the explicit
+    self-assignment suppresses the model's ``onupdate``.
+    """
+    stmt = update(SessionRecord).where(SessionRecord.id == session_id)
+    if lock_token is not None:
+        stmt = stmt.where(
+            or_(SessionRecord.lock_token == lock_token, SessionRecord.lock_token.is_(None))
+        )
+    return stmt.values(
+        next_seq=SessionRecord.next_seq + count, updated_at=SessionRecord.updated_at,
+    ).returning(
+        (SessionRecord.next_seq - count).label("seq")
+    )
+
+
+def _compose_message_insert(*, fenced: bool, exists: bool):
+    """Build the single-message INSERT once, with every value a named bindparam."""
+    cols = MessageRecord.__table__.c
+    session_id = bindparam("session_id", type_=cols.session_id.type)
+    lock_token = bindparam("lock_token", type_=SessionRecord.lock_token.type) if fenced else None
+    allocate = build_session_bump if exists else build_session_upsert
+    alloc = allocate(session_id, lock_token).cte("seq_alloc")
+    return (
+        insert(MessageRecord)
+        .from_select(
+            _MESSAGE_COLUMNS,
+            select(
+                session_id,
+                alloc.c.seq,
+                bindparam("role", type_=cols.role.type),
+                bindparam("content", type_=cols.content.type),
+                bindparam("tool_calls", type_=cols.tool_calls.type),
+                bindparam("tool_call_id", type_=cols.tool_call_id.type),
+            ),
+        )
+        .returning(MessageRecord.seq)
+    )
+
+
+# Built once per (fenced, session known to exist) variant: SQLAlchemy's
+# compiled cache and asyncpg's per-connection prepared statements are hit
+# without rebuilding the expression tree on every append.
+_MESSAGE_INSERT = {
+    (fenced, exists): _compose_message_insert(fenced=fenced, exists=exists)
+    for fenced in (False, True)
+    for exists in (False, True)
+}
+
+
+def build_message_insert(
+    session_id: str, msg: Message, lock_token: str | None, *, session_exists: bool = False,
+):
+    """Return the prebuilt seq allocation + message INSERT and its params.
+
+    ``session_exists`` selects the UPDATE-based allocation (see
+    ``build_session_bump``) instead of the upsert.
+    """
+    params = {
+        "session_id": session_id,
+        "role": msg.role,
+        "content": msg.content,
+        "tool_calls": msg.tool_calls,
+        "tool_call_id": msg.tool_call_id,
+    }
+    if lock_token is not None:
+        params["lock_token"] = lock_token
+    return _MESSAGE_INSERT[lock_token is not None, session_exists], params
+
+
+def build_messages_insert(session_id: str, msgs: list[Message], lock_token: str | None):
+    """Batch form of ``build_message_insert``: VALUES row i gets ``first_seq + i``."""
+    alloc = build_session_upsert(session_id, lock_token, len(msgs)).cte("seq_alloc")
+    cols = MessageRecord.__table__.c
+    batch = values(
+        column("ord", Integer),
+        column("role", cols.role.type),
+        column("content", cols.content.type),
+        column("tool_calls", cols.tool_calls.type),
+        column("tool_call_id", cols.tool_call_id.type),
+        name="batch",
+    ).data([(i, m.role, m.content, m.tool_calls, m.tool_call_id) for i, m in enumerate(msgs)])
+    return (
+        insert(MessageRecord)
+        .from_select(
+            _MESSAGE_COLUMNS,
+            select(
+                literal(session_id, cols.session_id.type),
+                alloc.c.seq + batch.c.ord,
+                batch.c.role,
+                batch.c.content,
+                batch.c.tool_calls,
+                batch.c.tool_call_id,
+            ).select_from(alloc).join(batch, true()),
+        )
+        .returning(MessageRecord.seq)
+    )
@@ -0,0 +1,76 @@
+"""Prebuilt Core statements for SessionManager's single-statement paths.
+
+Built once at import with named bindparams, so each call only binds values:
+no per-call expression construction or cache-key generation, and a stable
+SQL text for asyncpg's per-connection prepared-statement cache.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Interval, bindparam, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.session.models import SessionRecord
+
+
+def claim_available(ttl: Any):
+    """Unclaimed, or claimed longer ago than ``ttl`` (an Interval bindparam)."""
+    return or_(
+        SessionRecord.processing_since.is_(None),
+        SessionRecord.processing_since < func.now() - ttl,
+    )
+
+
+# Params: sid
+MODE_SELECT = select(SessionRecord.mode).where(SessionRecord.id == bindparam("sid"))
+
+# Params: sid, token, ttl (timedelta). RETURNING yields a row only if claimed.
+CLAIM_UPSERT = (
+    pg_insert(SessionRecord)
+    .values(
+        id=bindparam("sid"),
+        lock_token=bindparam("token"),
+        processing_since=func.now(),
+        next_seq=0,
+    )
+    .on_conflict_do_update(
+        index_elements=["id"],
+        set_={"lock_token": bindparam("token"), "processing_since": func.now()},
+        where=claim_available(bindparam("ttl", type_=Interval)),
+    )
+    .returning(SessionRecord.id)
+)
+
+# Params: sid, token, principal, ttl (timedelta). Claims NULL principal_id for
+# ``principal`` and preserves an existing owner; RETURNING (id, principal_id)
+# yields a row only if claimed.
+_principal = bindparam("principal", type_=SessionRecord.principal_id.type)
+PRINCIPAL_CLAIM_UPSERT = (
+    pg_insert(SessionRecord)
+    .values(
+        id=bindparam("sid"),
+        principal_id=_principal,
+        lock_token=bindparam("token"),
+        processing_since=func.now(),
+        next_seq=0,
+    )
+    .on_conflict_do_update(
+        index_elements=["id"],
+        set_={
+            "lock_token": bindparam("token"),
+            "processing_since": func.now(),
+            "principal_id": func.coalesce(SessionRecord.principal_id, _principal),
+        },
+        where=claim_available(bindparam("ttl", type_=Interval)),
+    )
+    .returning(SessionRecord.id, SessionRecord.principal_id)
+)
+
+# Params: sid, token. No-op unless the caller still holds the lock.
+LOCK_RELEASE = (
+    update(SessionRecord)
+    .where(SessionRecord.id == bindparam("sid"), SessionRecord.lock_token == bindparam("token"))
+    .values(processing_since=None, lock_token=None)
+)
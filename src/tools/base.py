@@ -19,6 +19,12 @@ class ToolMode(StrEnum):
     coding = "coding"
 
 
+# Shared allowed_modes values, so mode checks don't allocate a set per access.
+CHAT_AND_CODING_MODES: frozenset[ToolMode] = frozenset({ToolMode.chat_safe, ToolMode.coding})
+CODING_MODES: frozenset[ToolMode] = frozenset({ToolMode.coding})
+_EMPTY_MODES: frozenset[ToolMode] = frozenset()
+
+
 class RiskLevel(StrEnum):
     """Tool-level risk classification for guardrail gating (ADR 0035).
 
@@ -60,7 +66,7 @@ class BaseTool(ABC):
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
         """Modes in which this tool is available. Fail-closed: empty by default."""
-        return frozenset()
+        return _EMPTY_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -1,15 +1,36 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, tzinfo
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from src.tools.base import BaseTool, RiskLevel, ToolGroup, ToolMode
+from src.tools.base import CHAT_AND_CODING_MODES, BaseTool, RiskLevel, ToolGroup, ToolMode
 
 if TYPE_CHECKING:
     from src.tools.context import ToolContext
 
 
+@lru_cache(maxsize=64)
+def _get_zoneinfo(name: str) -> tzinfo:
+    """Resolve a timezone name once per process; unknown names raise and are not cached."""
+    if name == "UTC":
+        return UTC
+    return ZoneInfo(name)
+
+
+_PARAMETERS: dict = {
+    "type": "object",
+    "properties": {
+        "timezone": {
+            "type": "string",
+            "description": ("IANA timezone name, e.g. 'Asia/Shanghai'. Defaults to UTC."),
+        },
+    },
+    "required": [],
+}
+
+
 class CurrentTimeTool(BaseTool):
     """Returns the current date and time."""
 
@@ -27,7 +48,7 @@ class CurrentTimeTool(BaseTool):
 
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
-        return frozenset({ToolMode.chat_safe, ToolMode.coding})
+        return CHAT_AND_CODING_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -43,24 +64,12 @@ class CurrentTimeTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "timezone": {
-                    "type": "string",
-                    "description": ("IANA timezone name, e.g. 'Asia/Shanghai'. Defaults to UTC."),
-                },
-            },
-            "required": [],
-        }
+        return _PARAMETERS
 
     async def execute(self, arguments: dict, context: ToolContext | None = None) -> dict:
         tz_name = arguments.get("timezone", "UTC")
         try:
-            if tz_name == "UTC":
-                tz = UTC
-            else:
-                tz = ZoneInfo(tz_name)
+            tz = _get_zoneinfo(tz_name)
         except (ZoneInfoNotFoundError, KeyError):
             return {"error_code": "INVALID_TIMEZONE", "message": f"Unknown timezone: {tz_name}"}
 
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 
 import structlog
 
-from src.tools.base import BaseTool, RiskLevel, ToolGroup, ToolMode
+from src.tools.base import CODING_MODES, BaseTool, RiskLevel, ToolGroup, ToolMode
 from src.tools.read_state import (
     ReadStateStore,
     coerce_bool,
@@ -63,6 +63,33 @@ def _match_and_replace(
     return file_content.replace(old_string, new_string, -1 if replace_all else 1)
 
 
+_PARAMETERS: dict = {
+    "type": "object",
+    "properties": {
+        "file_path": {
+            "type": "string",
+            "description": "Absolute or relative path within workspace.",
+        },
+        "old_string": {
+            "type": "string",
+            "description": "Exact string to find in the file.",
+        },
+        "new_string": {
+            "type": "string",
+            "description": "Replacement string.",
+        },
+        "replace_all": {
+            "type": "boolean",
+            "description": (
+                "Replace all occurrences. "
+                "Default: false (unique match required)."
+            ),
+        },
+    },
+    "required": ["file_path", "old_string", "new_string"],
+}
+
+
 class EditFileTool(BaseTool):
     """Edit a file via exact string replacement within the workspace."""
 
@@ -81,7 +108,7 @@ class EditFileTool(BaseTool):
 
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
-        return frozenset({ToolMode.coding})
+        return CODING_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -105,31 +132,7 @@ class EditFileTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "file_path": {
-                    "type": "string",
-                    "description": "Absolute or relative path within workspace.",
-                },
-                "old_string": {
-                    "type": "string",
-                    "description": "Exact string to find in the file.",
-                },
-                "new_string": {
-                    "type": "string",
-                    "description": "Replacement string.",
-                },
-                "replace_all": {
-                    "type": "boolean",
-                    "description": (
-                        "Replace all occurrences. "
-                        "Default: false (unique match required)."
-                    ),
-                },
-            },
-            "required": ["file_path", "old_string", "new_string"],
-        }
+        return _PARAMETERS
 
     async def execute(self, arguments: dict, context: ToolContext | None = None) -> dict:
         old_string = arguments.get("old_string")
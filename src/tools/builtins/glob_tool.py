@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING
 
 import structlog
 
-from src.tools.base import BaseTool, RiskLevel, ToolGroup, ToolMode
+from src.tools.base import CODING_MODES, BaseTool, RiskLevel, ToolGroup, ToolMode
 from src.tools.read_state import resolve_search_dir
 
 if TYPE_CHECKING:
@@ -22,6 +22,28 @@ logger = structlog.get_logger()
 _DEFAULT_MAX_RESULTS = 200
 
 
+_PARAMETERS: dict = {
+    "type": "object",
+    "properties": {
+        "pattern": {
+            "type": "string",
+            "description": (
+                "Glob pattern, e.g. '**/*.py', 'src/**/*.ts', '*.md'. "
+                "Relative to workspace root."
+            ),
+        },
+        "path": {
+            "type": "string",
+            "description": (
+                "Subdirectory to search in (relative to workspace). "
+                "Default: workspace root."
+            ),
+        },
+    },
+    "required": ["pattern"],
+}
+
+
 class GlobTool(BaseTool):
     """Find files matching a glob pattern within the workspace."""
 
@@ -35,7 +57,7 @@ class GlobTool(BaseTool):
 
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
-        return frozenset({ToolMode.coding})
+        return CODING_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -62,26 +84,7 @@ class GlobTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "pattern": {
-                    "type": "string",
-                    "description": (
-                        "Glob pattern, e.g. '**/*.py', 'src/**/*.ts', '*.md'. "
-                        "Relative to workspace root."
-                    ),
-                },
-                "path": {
-                    "type": "string",
-                    "description": (
-                        "Subdirectory to search in (relative to workspace). "
-                        "Default: workspace root."
-                    ),
-                },
-            },
-            "required": ["pattern"],
-        }
+        return _PARAMETERS
 
     async def execute(self, arguments: dict, context: ToolContext | None = None) -> dict:
         pattern = arguments.get("pattern", "")
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 
 import structlog
 
-from src.tools.base import BaseTool, RiskLevel, ToolGroup, ToolMode
+from src.tools.base import CODING_MODES, BaseTool, RiskLevel, ToolGroup, ToolMode
 from src.tools.read_state import resolve_search_dir
 
 if TYPE_CHECKING:
@@ -43,6 +43,36 @@ def _grep_file(resolved: Path, regex: re.Pattern, rel_path: str, cap: int) -> li
     return hits
 
 
+_PARAMETERS: dict = {
+    "type": "object",
+    "properties": {
+        "pattern": {
+            "type": "string",
+            "description": "Search pattern (regex supported).",
+        },
+        "glob": {
+            "type": "string",
+            "description": (
+                "File glob to filter files, e.g. '**/*.py'. "
+                "Default: '**/*'."
+            ),
+        },
+        "path": {
+            "type": "string",
+            "description": (
+                "Subdirectory to search in (relative to workspace). "
+                "Default: workspace root."
+            ),
+        },
+        "case_insensitive": {
+            "type": "boolean",
+            "description": "Case-insensitive search. Default: false.",
+        },
+    },
+    "required": ["pattern"],
+}
+
+
 class GrepTool(BaseTool):
     """Search for text or regex patterns within workspace files."""
 
@@ -58,7 +88,7 @@ class GrepTool(BaseTool):
 
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
-        return frozenset({ToolMode.coding})
+        return CODING_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -85,34 +115,7 @@ class GrepTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "pattern": {
-                    "type": "string",
-                    "description": "Search pattern (regex supported).",
-                },
-                "glob": {
-                    "type": "string",
-                    "description": (
-                        "File glob to filter files, e.g. '**/*.py'. "
-                        "Default: '**/*'."
-                    ),
-                },
-                "path": {
-                    "type": "string",
-                    "description": (
-                        "Subdirectory to search in (relative to workspace). "
-                        "Default: workspace root."
-                    ),
-                },
-                "case_insensitive": {
-                    "type": "boolean",
-                    "description": "Case-insensitive search. Default: false.",
-                },
-            },
-            "required": ["pattern"],
-        }
+        return _PARAMETERS
 
     async def execute(self, arguments: dict, context: ToolContext | None = None) -> dict:
         pattern_str = arguments.get("pattern", "")
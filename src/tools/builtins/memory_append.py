@@ -4,13 +4,25 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from src.tools.base import BaseTool, RiskLevel, ToolGroup, ToolMode
+from src.tools.base import CHAT_AND_CODING_MODES, BaseTool, RiskLevel, ToolGroup, ToolMode
 
 if TYPE_CHECKING:
     from src.memory.writer import MemoryWriter
     from src.tools.context import ToolContext
 
 
+_PARAMETERS: dict = {
+    "type": "object",
+    "properties": {
+        "text": {
+            "type": "string",
+            "description": "The memory content to save.",
+        },
+    },
+    "required": ["text"],
+}
+
+
 class MemoryAppendTool(BaseTool):
     """Save a memory note to today's daily notes file.
 
@@ -35,7 +47,7 @@ class MemoryAppendTool(BaseTool):
 
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
-        return frozenset({ToolMode.chat_safe, ToolMode.coding})
+        return CHAT_AND_CODING_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -43,16 +55,7 @@ class MemoryAppendTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "text": {
-                    "type": "string",
-                    "description": "The memory content to save.",
-                },
-            },
-            "required": ["text"],
-        }
+        return _PARAMETERS
 
     async def execute(self, arguments: dict, context: ToolContext | None = None) -> dict:
         text = arguments.get("text", "")
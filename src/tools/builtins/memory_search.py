@@ -4,13 +4,29 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from src.tools.base import BaseTool, RiskLevel, ToolGroup, ToolMode
+from src.tools.base import CHAT_AND_CODING_MODES, BaseTool, RiskLevel, ToolGroup, ToolMode
 
 if TYPE_CHECKING:
     from src.memory.searcher import MemorySearcher
     from src.tools.context import ToolContext
 
 
+_PARAMETERS: dict = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "The search query.",
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of results (default 10).",
+        },
+    },
+    "required": ["query"],
+}
+
+
 class MemorySearchTool(BaseTool):
     """Search through long-term memory using full-text search.
 
@@ -35,7 +51,7 @@ class MemorySearchTool(BaseTool):
 
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
-        return frozenset({ToolMode.chat_safe, ToolMode.coding})
+        return CHAT_AND_CODING_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -51,20 +67,7 @@ class MemorySearchTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "The search query.",
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of results (default 10).",
-                },
-            },
-            "required": ["query"],
-        }
+        return _PARAMETERS
 
     async def execute(self, arguments: dict, context: ToolContext | None = None) -> dict:
         if self._searcher is None:
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 
 import structlog
 
-from src.tools.base import BaseTool, RiskLevel, ToolGroup, ToolMode
+from src.tools.base import CODING_MODES, BaseTool, RiskLevel, ToolGroup, ToolMode
 from src.tools.read_state import (
     ReadScope,
     ReadState,
@@ -70,6 +70,39 @@ def _format_numbered_lines(lines: list[str], offset: int) -> str:
     return "\n".join(content_lines)
 
 
+_PARAMETERS: dict = {
+    "type": "object",
+    "properties": {
+        "file_path": {
+            "type": "string",
+            "description": (
+                "Absolute path within the workspace, or relative path. "
+                "Preferred parameter name."
+            ),
+        },
+        "path": {
+            "type": "string",
+            "description": (
+                "Legacy alias for file_path. Relative path within workspace."
+            ),
+        },
+        "offset": {
+            "type": "integer",
+            "description": "Starting line number (0-based). Default: 0.",
+            "minimum": 0,
+        },
+        "limit": {
+            "type": "integer",
+            "description": (
+                f"Max lines to return. Default/max: {_DEFAULT_MAX_LINES}."
+            ),
+            "minimum": 1,
+        },
+    },
+    "required": [],
+}
+
+
 class ReadFileTool(BaseTool):
     """Read a text/code file from the workspace directory with path safety enforcement."""
 
@@ -90,7 +123,7 @@ class ReadFileTool(BaseTool):
 
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
-        return frozenset({ToolMode.coding})
+        return CODING_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -113,37 +146,7 @@ class ReadFileTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "file_path": {
-                    "type": "string",
-                    "description": (
-                        "Absolute path within the workspace, or relative path. "
-                        "Preferred parameter name."
-                    ),
-                },
-                "path": {
-                    "type": "string",
-                    "description": (
-                        "Legacy alias for file_path. Relative path within workspace."
-                    ),
-                },
-                "offset": {
-                    "type": "integer",
-                    "description": "Starting line number (0-based). Default: 0.",
-                    "minimum": 0,
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": (
-                        f"Max lines to return. Default/max: {_DEFAULT_MAX_LINES}."
-                    ),
-                    "minimum": 1,
-                },
-            },
-            "required": [],
-        }
+        return _PARAMETERS
 
     async def execute(self, arguments: dict, context: ToolContext | None = None) -> dict:
         raw_path = arguments.get("file_path") or arguments.get("path", "")
@@ -4,13 +4,37 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from src.tools.base import BaseTool, RiskLevel, ToolGroup, ToolMode
+from src.tools.base import CHAT_AND_CODING_MODES, BaseTool, RiskLevel, ToolGroup, ToolMode
 
 if TYPE_CHECKING:
     from src.memory.evolution import EvolutionEngine
     from src.tools.context import ToolContext
 
 
+_PARAMETERS: dict = {
+    "type": "object",
+    "properties": {
+        "intent": {
+            "type": "string",
+            "description": "What the change aims to achieve.",
+        },
+        "new_content": {
+            "type": "string",
+            "description": "The proposed full SOUL.md content.",
+        },
+        "risk_notes": {
+            "type": "string",
+            "description": "Potential risks of this change.",
+        },
+        "diff_summary": {
+            "type": "string",
+            "description": "Human-readable summary of what changed.",
+        },
+    },
+    "required": ["intent", "new_content"],
+}
+
+
 class SoulProposeTool(BaseTool):
     """Agent proposes a SOUL.md change with intent and evidence.
 
@@ -36,7 +60,7 @@ class SoulProposeTool(BaseTool):
 
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
-        return frozenset({ToolMode.chat_safe, ToolMode.coding})
+        return CHAT_AND_CODING_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -44,28 +68,7 @@ class SoulProposeTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "intent": {
-                    "type": "string",
-                    "description": "What the change aims to achieve.",
-                },
-                "new_content": {
-                    "type": "string",
-                    "description": "The proposed full SOUL.md content.",
-                },
-                "risk_notes": {
-                    "type": "string",
-                    "description": "Potential risks of this change.",
-                },
-                "diff_summary": {
-                    "type": "string",
-                    "description": "Human-readable summary of what changed.",
-                },
-            },
-            "required": ["intent", "new_content"],
-        }
+        return _PARAMETERS
 
     async def execute(self, arguments: dict, context: ToolContext | None = None) -> dict:
         if self._engine is None:
@@ -4,13 +4,30 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from src.tools.base import BaseTool, RiskLevel, ToolGroup, ToolMode
+from src.tools.base import CHAT_AND_CODING_MODES, BaseTool, RiskLevel, ToolGroup, ToolMode
 
 if TYPE_CHECKING:
     from src.memory.evolution import EvolutionEngine
     from src.tools.context import ToolContext
 
 
+_PARAMETERS: dict = {
+    "type": "object",
+    "properties": {
+        "action": {
+            "type": "string",
+            "enum": ["rollback", "veto"],
+            "description": "rollback: restore previous; veto: reject a version",
+        },
+        "version": {
+            "type": "integer",
+            "description": "Target version (optional for rollback, required for veto).",
+        },
+    },
+    "required": ["action"],
+}
+
+
 class SoulRollbackTool(BaseTool):
     """User-triggered rollback or veto of SOUL.md changes.
 
@@ -35,7 +52,7 @@ class SoulRollbackTool(BaseTool):
 
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
-        return frozenset({ToolMode.chat_safe, ToolMode.coding})
+        return CHAT_AND_CODING_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -43,21 +60,7 @@ class SoulRollbackTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": ["rollback", "veto"],
-                    "description": "rollback: restore previous; veto: reject a version",
-                },
-                "version": {
-                    "type": "integer",
-                    "description": "Target version (optional for rollback, required for veto).",
-                },
-            },
-            "required": ["action"],
-        }
+        return _PARAMETERS
 
     async def execute(self, arguments: dict, context: ToolContext | None = None) -> dict:
         if self._engine is None:
@@ -4,13 +4,29 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from src.tools.base import BaseTool, RiskLevel, ToolGroup, ToolMode
+from src.tools.base import CHAT_AND_CODING_MODES, BaseTool, RiskLevel, ToolGroup, ToolMode
 
 if TYPE_CHECKING:
     from src.memory.evolution import EvolutionEngine
     from src.tools.context import ToolContext
 
 
+_PARAMETERS: dict = {
+    "type": "object",
+    "properties": {
+        "include_history": {
+            "type": "boolean",
+            "description": "Include recent version history (default false).",
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Max history entries (default 5).",
+        },
+    },
+    "required": [],
+}
+
+
 class SoulStatusTool(BaseTool):
     """Query current SOUL.md version and pending proposals."""
 
@@ -31,7 +47,7 @@ class SoulStatusTool(BaseTool):
 
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
-        return frozenset({ToolMode.chat_safe, ToolMode.coding})
+        return CHAT_AND_CODING_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -47,20 +63,7 @@ class SoulStatusTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "include_history": {
-                    "type": "boolean",
-                    "description": "Include recent version history (default false).",
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Max history entries (default 5).",
-                },
-            },
-            "required": [],
-        }
+        return _PARAMETERS
 
     async def execute(self, arguments: dict, context: ToolContext | None = None) -> dict:
         if self._engine is None:
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING
 
 import structlog
 
-from src.tools.base import BaseTool, RiskLevel, ToolGroup, ToolMode
+from src.tools.base import CODING_MODES, BaseTool, RiskLevel, ToolGroup, ToolMode
 from src.tools.read_state import (
     ReadStateStore,
     coerce_bool,
@@ -59,6 +59,29 @@ def _check_overwrite_preconditions(
     return None
 
 
+_PARAMETERS: dict = {
+    "type": "object",
+    "properties": {
+        "file_path": {
+            "type": "string",
+            "description": "Absolute or relative path within workspace.",
+        },
+        "content": {
+            "type": "string",
+            "description": "Content to write to the file.",
+        },
+        "overwrite": {
+            "type": "boolean",
+            "description": (
+                "If true, allow replacing an existing file. "
+                "Default: false."
+            ),
+        },
+    },
+    "required": ["file_path", "content"],
+}
+
+
 class WriteFileTool(BaseTool):
     """Write or create a text/code file within the workspace."""
 
@@ -77,7 +100,7 @@ class WriteFileTool(BaseTool):
 
     @property
     def allowed_modes(self) -> frozenset[ToolMode]:
-        return frozenset({ToolMode.coding})
+        return CODING_MODES
 
     @property
     def risk_level(self) -> RiskLevel:
@@ -101,27 +124,7 @@ class WriteFileTool(BaseTool):
 
     @property
     def parameters(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "file_path": {
-                    "type": "string",
-                    "description": "Absolute or relative path within workspace.",
-                },
-                "content": {
-                    "type": "string",
-                    "description": "Content to write to the file.",
-                },
-                "overwrite": {
-                    "type": "boolean",
-                    "description": (
-                        "If true, allow replacing an existing file. "
-                        "Default: false."
-                    ),
-                },
-            },
-            "required": ["file_path", "content"],
-        }
+        return _PARAMETERS
 
     async def execute(self, arguments: dict, context: ToolContext | None = None) -> dict:
         raw_path = arguments.get("file_path", "")
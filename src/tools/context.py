@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from src.procedures.roles import AgentRole
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolContext:
     """Runtime context injected into tool execution by AgentLoop.
 
@@ -152,14 +152,12 @@ def validate_workspace_path(
     else:
         target = (workspace_dir / raw).resolve()
 
-    # Workspace boundary check (blocks symlink escape and ..)
-    if not target.is_relative_to(workspace_dir):
-        logger.warning("path_escape_blocked", raw_path=raw_path, resolved=str(target))
-        return {"error_code": "ACCESS_DENIED", "message": "Path escapes workspace boundary."}
-
+    # Workspace boundary check (blocks symlink escape and ..); relative_to raises
+    # for anything outside, so one call both checks and yields the relative path.
     try:
         relative_path = str(target.relative_to(workspace_dir))
     except ValueError:
+        logger.warning("path_escape_blocked", raw_path=raw_path, resolved=str(target))
         return {"error_code": "ACCESS_DENIED", "message": "Path escapes workspace boundary."}
 
     return target, relative_path
@@ -13,6 +13,12 @@ class ToolRegistry:
     def __init__(self) -> None:
         self._tools: dict[str, BaseTool] = {}
         self._mode_overrides: dict[str, frozenset[ToolMode]] = {}
+        # mode -> OpenAI schema list; tool definitions are static, so this only
+        # changes when the registry itself does (see _invalidate).
+        self._schema_cache: dict[ToolMode, list[dict]] = {}
+
+    def _invalidate(self) -> None:
+        self._schema_cache.clear()
 
     def register(self, tool: BaseTool) -> None:
         """Register a tool. Raises ValueError if name already registered."""
@@ -26,6 +32,7 @@ class ToolRegistry:
                 "it will not be available in any mode.",
             )
         self._tools[tool.name] = tool
+        self._invalidate()
         logger.info("tool_registered", tool_name=tool.name)
 
     def unregister(self, name: str) -> None:
@@ -37,6 +44,7 @@ class ToolRegistry:
             raise KeyError(f"Tool not registered: {name}")
         del self._tools[name]
         self._mode_overrides.pop(name, None)
+        self._invalidate()
         logger.info("tool_unregistered", tool_name=name)
 
     def replace(self, tool: BaseTool) -> None:
@@ -44,6 +52,7 @@ class ToolRegistry:
         old = self._tools.get(tool.name)
         self._tools[tool.name] = tool
         self._mode_overrides.pop(tool.name, None)
+        self._invalidate()
         if old:
             logger.info("tool_replaced", tool_name=tool.name)
         else:
@@ -62,23 +71,23 @@ class ToolRegistry:
         tool = self._tools.get(tool_name)
         if tool is None:
             raise KeyError(f"Tool not registered: {tool_name}")
-        extra = modes - tool.allowed_modes
-        if extra:
+        if not modes <= tool.allowed_modes:
+            extra = modes - tool.allowed_modes
             raise ValueError(
                 f"Cannot expand modes for '{tool_name}': "
                 f"{extra} not in allowed_modes {tool.allowed_modes}"
             )
         self._mode_overrides[tool_name] = modes
+        self._invalidate()
 
     def get_effective_modes(self, tool_name: str) -> frozenset[ToolMode]:
         """Return effective modes: allowed_modes intersected with any override."""
         tool = self._tools.get(tool_name)
         if tool is None:
             return frozenset()
-        override = self._mode_overrides.get(tool_name)
-        if override is None:
-            return tool.allowed_modes
-        return tool.allowed_modes & override
+        # set_mode_override only accepts subsets of allowed_modes and replace()
+        # drops overrides, so a stored override already is the intersection.
+        return self._mode_overrides.get(tool_name, tool.allowed_modes)
 
     def check_mode(self, tool_name: str, mode: ToolMode) -> bool:
         """Check if a tool is available in the given mode. False for unknown tools."""
@@ -95,15 +104,21 @@ class ToolRegistry:
 
         Output format:
         [{"type": "function", "function": {"name": ..., "description": ..., "parameters": ...}}]
+
+        Built once per mode and cached until the registry changes. Callers get
+        a fresh list, but the schema dicts are shared — do not mutate them.
         """
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.parameters,
-                },
-            }
-            for tool in self.list_tools(mode)
-        ]
+        schema = self._schema_cache.get(mode)
+        if schema is None:
+            schema = self._schema_cache[mode] = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "parameters": tool.parameters,
+                    },
+                }
+                for tool in self.list_tools(mode)
+            ]
+        return list(schema)
@@ -87,15 +87,15 @@ def pg_url(_pg_container) -> str:
 
 @pytest_asyncio.fixture(scope="session")
 async def db_engine(pg_url: str):
-    """Create async engine, set up schema + tables + triggers. Tear down after session."""
-    from src.session.database import _create_search_trigger
+    """Create async engine, set up schema + tables + search columns. Tear down after session."""
+    from src.session.database import _ensure_search_vector_column
 
     engine = create_async_engine(pg_url, echo=False)
 
     async with engine.begin() as conn:
         await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {DB_SCHEMA}"))
         await conn.run_sync(Base.metadata.create_all)
-        await _create_search_trigger(conn, DB_SCHEMA)
+        await _ensure_search_vector_column(conn, DB_SCHEMA)
 
     yield engine
 
@@ -126,7 +126,7 @@ async def _integration_cleanup(request):
     """
     yield
 
-    if not any(m.name == "integration" for m in request.node.iter_markers()):
+    if request.node.get_closest_marker("integration") is None:
         return
 
     # pytest-asyncio auto mode wraps async defs → iscoroutinefunction returns
@@ -144,50 +144,52 @@ async def _integration_cleanup(request):
     await _truncate_integration_tables(factory)
 
 
+_CLEANUP_TABLES = (
+    "messages",
+    "sessions",
+    "principal_bindings",
+    "principals",
+    "memory_entries",
+    "memory_source_ledger",
+    "soul_versions",
+    "budget_reservations",
+    "skill_spec_versions",
+    "skill_evidence",
+    "skill_specs",
+    "wrapper_tool_versions",
+    "wrapper_tools",
+    "active_procedures",
+)
+
+# One server-side block: the existing-table lookup, TRUNCATE and budget reset
+# cost a single round trip. Tables are looked up every time because some are
+# created by per-module fixtures mid-session (budget_*, soul_versions).
+_CLEANUP_SQL = f"""
+DO $$
+DECLARE
+    targets text;
+BEGIN
+    SELECT string_agg(quote_ident(table_schema) || '.' || quote_ident(table_name), ', ')
+      INTO targets
+      FROM information_schema.tables
+     WHERE table_schema = '{DB_SCHEMA}'
+       AND table_name = ANY (ARRAY[{", ".join(f"'{t}'" for t in _CLEANUP_TABLES)}]);
+    IF targets IS NOT NULL THEN
+        EXECUTE 'TRUNCATE ' || targets || ' CASCADE';
+    END IF;
+    IF to_regclass('{DB_SCHEMA}.budget_state') IS NOT NULL THEN
+        UPDATE {DB_SCHEMA}.budget_state
+           SET cumulative_eur = 0, updated_at = NOW()
+         WHERE id = 'global';
+    END IF;
+END $$
+"""
+
+
 async def _truncate_integration_tables(factory) -> None:
     """Truncate test schema tables for integration test isolation."""
     async with factory() as db_session:
-        result = await db_session.execute(
-            text(
-                "SELECT table_name FROM information_schema.tables"
-                f" WHERE table_schema = '{DB_SCHEMA}'"
-            )
-        )
-        existing = {row[0] for row in result.fetchall()}
-
-        truncatable = [
-            t
-            for t in [
-                "messages",
-                "sessions",
-                "principal_bindings",
-                "principals",
-                "memory_entries",
-                "memory_source_ledger",
-                "soul_versions",
-                "budget_reservations",
-                "skill_spec_versions",
-                "skill_evidence",
-                "skill_specs",
-                "wrapper_tool_versions",
-                "wrapper_tools",
-                "active_procedures",
-            ]
-            if t in existing
-        ]
-        if truncatable:
-            qualified = ", ".join(f"{DB_SCHEMA}.{t}" for t in truncatable)
-            await db_session.execute(text(f"TRUNCATE {qualified} CASCADE"))
-
-        if "budget_state" in existing:
-            await db_session.execute(
-                text(
-                    f"UPDATE {DB_SCHEMA}.budget_state"
-                    " SET cumulative_eur = 0, updated_at = NOW()"
-                    " WHERE id = 'global'"
-                )
-            )
-
+        await db_session.execute(text(_CLEANUP_SQL))
         await db_session.commit()
 
 
@@ -17,14 +17,29 @@ from src.gateway.budget_gate import BudgetGate
 
 pytestmark = pytest.mark.integration
 
-
-@pytest_asyncio.fixture
-async def budget_gate(db_engine: AsyncEngine, db_session_factory) -> BudgetGate:
-    """Create budget tables and return a BudgetGate instance.
+_SELECT_CUMULATIVE = text(
+    f"SELECT cumulative_eur FROM {DB_SCHEMA}.budget_state WHERE id = 'global'"
+)
+_SET_CUMULATIVE = text(
+    f"UPDATE {DB_SCHEMA}.budget_state SET cumulative_eur = :eur WHERE id = 'global'"
+)
+_SELECT_SESSION_ID = text(
+    f"SELECT session_id FROM {DB_SCHEMA}.budget_reservations"
+    " WHERE reservation_id = CAST(:rid AS uuid)"
+)
+_SELECT_EVAL_RUN_ID = text(
+    f"SELECT eval_run_id FROM {DB_SCHEMA}.budget_reservations"
+    " WHERE reservation_id = CAST(:rid AS uuid)"
+)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def _budget_schema(db_engine: AsyncEngine) -> None:
+    """Create budget tables once per module.
 
     Budget tables are migration-managed (not ORM), so create via raw SQL.
-    Depends on db_session_factory to force eager session-fixture setup
-    (prevents event loop scope mismatch with autouse _integration_cleanup).
+    Per-test reset (TRUNCATE reservations, zero budget_state) is done by the
+    autouse _integration_cleanup.
     """
     async with db_engine.begin() as conn:
         await conn.execute(text(f"""
@@ -53,17 +68,16 @@ async def budget_gate(db_engine: AsyncEngine, db_session_factory) -> BudgetGate:
             ON CONFLICT DO NOTHING
         """))
 
-    gate = BudgetGate(db_engine, schema=DB_SCHEMA)
 
-    yield gate
+@pytest_asyncio.fixture
+async def budget_gate(db_engine: AsyncEngine, db_session_factory, _budget_schema) -> BudgetGate:
+    """Return a BudgetGate over the shared budget tables.
 
-    # Cleanup
-    async with db_engine.begin() as conn:
-        await conn.execute(text(f"TRUNCATE {DB_SCHEMA}.budget_reservations CASCADE"))
-        await conn.execute(text(f"""
-            UPDATE {DB_SCHEMA}.budget_state SET cumulative_eur = 0, updated_at = NOW()
-            WHERE id = 'global'
-        """))
+    Depends on db_session_factory to force eager session-fixture setup
+    (prevents event loop scope mismatch with autouse _integration_cleanup)
+    and so that cleanup runs after each test.
+    """
+    return BudgetGate(db_engine, schema=DB_SCHEMA)
 
 
 class TestTryReserve:
@@ -87,9 +101,7 @@ class TestTryReserve:
         """Cumulative €20~€25 → denied=False (with warning log)."""
         # Set cumulative to €19
         async with db_engine.begin() as conn:
-            await conn.execute(text(f"""
-                UPDATE {DB_SCHEMA}.budget_state SET cumulative_eur = 19 WHERE id = 'global'
-            """))
+            await conn.execute(_SET_CUMULATIVE, {"eur": 19})
 
         r = await budget_gate.try_reserve(
             provider="openai", model="gpt-5-mini", estimated_cost_eur=2.0,
@@ -102,9 +114,7 @@ class TestTryReserve:
     ) -> None:
         """Cumulative + estimated >= stop → denied=True."""
         async with db_engine.begin() as conn:
-            await conn.execute(text(f"""
-                UPDATE {DB_SCHEMA}.budget_state SET cumulative_eur = 24 WHERE id = 'global'
-            """))
+            await conn.execute(_SET_CUMULATIVE, {"eur": 24})
 
         r = await budget_gate.try_reserve(
             provider="openai", model="gpt-5-mini", estimated_cost_eur=2.0,
@@ -142,10 +152,7 @@ class TestTryReserve:
         assert not r.denied
 
         async with db_engine.begin() as conn:
-            row = await conn.execute(text(f"""
-                SELECT session_id FROM {DB_SCHEMA}.budget_reservations
-                WHERE reservation_id = CAST(:rid AS uuid)
-            """), {"rid": r.reservation_id})
+            row = await conn.execute(_SELECT_SESSION_ID, {"rid": r.reservation_id})
             assert row.scalar_one() == "main"
 
     async def test_eval_run_id_recorded(
@@ -158,10 +165,7 @@ class TestTryReserve:
         assert not r.denied
 
         async with db_engine.begin() as conn:
-            row = await conn.execute(text(f"""
-                SELECT eval_run_id FROM {DB_SCHEMA}.budget_reservations
-                WHERE reservation_id = CAST(:rid AS uuid)
-            """), {"rid": r.reservation_id})
+            row = await conn.execute(_SELECT_EVAL_RUN_ID, {"rid": r.reservation_id})
             assert row.scalar_one() == "m6_eval_gemini_1740000000"
 
     async def test_eval_run_id_empty_for_online(
@@ -172,10 +176,7 @@ class TestTryReserve:
             estimated_cost_eur=0.01, eval_run_id="",
         )
         async with db_engine.begin() as conn:
-            row = await conn.execute(text(f"""
-                SELECT eval_run_id FROM {DB_SCHEMA}.budget_reservations
-                WHERE reservation_id = CAST(:rid AS uuid)
-            """), {"rid": r.reservation_id})
+            row = await conn.execute(_SELECT_EVAL_RUN_ID, {"rid": r.reservation_id})
             assert row.scalar_one() == ""
 
     async def test_provider_breakdown_queryable(
@@ -235,9 +236,7 @@ class TestSettle:
         await budget_gate.settle(reservation_id=r.reservation_id, actual_cost_eur=3.0)
 
         async with db_engine.begin() as conn:
-            row = await conn.execute(text(f"""
-                SELECT cumulative_eur FROM {DB_SCHEMA}.budget_state WHERE id = 'global'
-            """))
+            row = await conn.execute(_SELECT_CUMULATIVE)
             # 5.0 reserved, then diff = 3.0 - 5.0 = -2.0 → cumulative = 3.0
             assert float(row.scalar_one()) == 3.0
 
@@ -251,9 +250,7 @@ class TestSettle:
         await budget_gate.settle(reservation_id=r.reservation_id, actual_cost_eur=5.0)
 
         async with db_engine.begin() as conn:
-            row = await conn.execute(text(f"""
-                SELECT cumulative_eur FROM {DB_SCHEMA}.budget_state WHERE id = 'global'
-            """))
+            row = await conn.execute(_SELECT_CUMULATIVE)
             # 3.0 reserved, then diff = 5.0 - 3.0 = +2.0 → cumulative = 5.0
             assert float(row.scalar_one()) == 5.0
 
@@ -267,18 +264,14 @@ class TestSettle:
         await budget_gate.settle(reservation_id=r.reservation_id, actual_cost_eur=3.0)
 
         async with db_engine.begin() as conn:
-            row = await conn.execute(text(f"""
-                SELECT cumulative_eur FROM {DB_SCHEMA}.budget_state WHERE id = 'global'
-            """))
+            row = await conn.execute(_SELECT_CUMULATIVE)
             before = float(row.scalar_one())
 
         # Second settle — should be no-op
         await budget_gate.settle(reservation_id=r.reservation_id, actual_cost_eur=10.0)
 
         async with db_engine.begin() as conn:
-            row = await conn.execute(text(f"""
-                SELECT cumulative_eur FROM {DB_SCHEMA}.budget_state WHERE id = 'global'
-            """))
+            row = await conn.execute(_SELECT_CUMULATIVE)
             after = float(row.scalar_one())
 
         assert before == after == 3.0
@@ -289,9 +282,7 @@ class TestSettle:
         """Settle with unknown reservation_id is a no-op."""
         # Get initial cumulative
         async with db_engine.begin() as conn:
-            row = await conn.execute(text(f"""
-                SELECT cumulative_eur FROM {DB_SCHEMA}.budget_state WHERE id = 'global'
-            """))
+            row = await conn.execute(_SELECT_CUMULATIVE)
             before = float(row.scalar_one())
 
         await budget_gate.settle(
@@ -300,9 +291,7 @@ class TestSettle:
         )
 
         async with db_engine.begin() as conn:
-            row = await conn.execute(text(f"""
-                SELECT cumulative_eur FROM {DB_SCHEMA}.budget_state WHERE id = 'global'
-            """))
+            row = await conn.execute(_SELECT_CUMULATIVE)
             after = float(row.scalar_one())
 
         assert before == after
@@ -316,9 +305,7 @@ class TestConcurrency:
         """Two concurrent reserves when only room for one → only one succeeds."""
         # Set cumulative to €22 — room for one €2 reserve (22+2=24 < 25), not two (24+2=26 >= 25)
         async with db_engine.begin() as conn:
-            await conn.execute(text(f"""
-                UPDATE {DB_SCHEMA}.budget_state SET cumulative_eur = 22 WHERE id = 'global'
-            """))
+            await conn.execute(_SET_CUMULATIVE, {"eur": 22})
 
         results = await asyncio.gather(
             budget_gate.try_reserve(
@@ -351,9 +338,7 @@ class TestConcurrency:
 
         # Verify cumulative matches number of grants
         async with db_engine.begin() as conn:
-            row = await conn.execute(text(f"""
-                SELECT cumulative_eur FROM {DB_SCHEMA}.budget_state WHERE id = 'global'
-            """))
+            row = await conn.execute(_SELECT_CUMULATIVE)
             cumulative = float(row.scalar_one())
 
         assert cumulative == len(granted) * 1.0
@@ -6,6 +6,7 @@ through the full WebSocket → RPC dispatch → _handle_chat_send → BudgetGate
 
 from __future__ import annotations
 
+import asyncio
 import json
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -53,40 +54,61 @@ class _FakeModel(ModelClient):
 # ---------------------------------------------------------------------------
 
 
-async def _init_budget_schema(conn, initial_cumulative: float) -> None:
-    """Create budget tables and seed initial state."""
-    await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {DB_SCHEMA}"))
-    await conn.run_sync(Base.metadata.create_all)
-    await conn.execute(text(f"""
-        CREATE TABLE IF NOT EXISTS {DB_SCHEMA}.budget_state (
-            id TEXT PRIMARY KEY DEFAULT 'global',
-            cumulative_eur NUMERIC(10,4) NOT NULL DEFAULT 0,
-            updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
-        )
-    """))
-    await conn.execute(text(f"""
-        CREATE TABLE IF NOT EXISTS {DB_SCHEMA}.budget_reservations (
-            reservation_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-            provider TEXT NOT NULL,
-            model TEXT NOT NULL,
-            session_id TEXT NOT NULL DEFAULT '',
-            eval_run_id TEXT NOT NULL DEFAULT '',
-            reserved_eur NUMERIC(10,4) NOT NULL,
-            actual_eur NUMERIC(10,4),
-            status TEXT NOT NULL DEFAULT 'reserved',
-            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-            settled_at TIMESTAMPTZ
-        )
-    """))
+async def _create_budget_schema(pg_url: str) -> None:
+    """Create the ORM tables and budget tables (idempotent DDL)."""
+    engine = create_async_engine(pg_url, echo=False)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {DB_SCHEMA}"))
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS {DB_SCHEMA}.budget_state (
+                id TEXT PRIMARY KEY DEFAULT 'global',
+                cumulative_eur NUMERIC(10,4) NOT NULL DEFAULT 0,
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            )
+        """))
+        await conn.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS {DB_SCHEMA}.budget_reservations (
+                reservation_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                session_id TEXT NOT NULL DEFAULT '',
+                eval_run_id TEXT NOT NULL DEFAULT '',
+                reserved_eur NUMERIC(10,4) NOT NULL,
+                actual_eur NUMERIC(10,4),
+                status TEXT NOT NULL DEFAULT 'reserved',
+                created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                settled_at TIMESTAMPTZ
+            )
+        """))
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _budget_schema(pg_url: str) -> None:
+    """Run the DDL once per module; each app startup then only seeds and truncates.
+
+    Uses a private event loop so the current loop (used by the tests'
+    run_until_complete checks) is left untouched.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_create_budget_schema(pg_url))
+    finally:
+        loop.close()
+
+
+async def _reset_budget_state(conn, initial_cumulative: float) -> None:
+    """Seed budget_state and clear reservations and sessions."""
     await conn.execute(text(f"""
         INSERT INTO {DB_SCHEMA}.budget_state (id, cumulative_eur)
         VALUES ('global', :cum)
         ON CONFLICT (id) DO UPDATE SET cumulative_eur = :cum, updated_at = NOW()
     """), {"cum": initial_cumulative})
-    await conn.execute(text(f"TRUNCATE {DB_SCHEMA}.budget_reservations CASCADE"))
-    await conn.execute(
-        text(f"TRUNCATE {DB_SCHEMA}.messages, {DB_SCHEMA}.sessions CASCADE")
-    )
+    await conn.execute(text(
+        f"TRUNCATE {DB_SCHEMA}.budget_reservations, {DB_SCHEMA}.messages, {DB_SCHEMA}.sessions"
+        " CASCADE"
+    ))
 
 
 def _make_budget_app(pg_url: str, tmp_path, *, initial_cumulative: float = 0.0):
@@ -99,7 +121,7 @@ def _make_budget_app(pg_url: str, tmp_path, *, initial_cumulative: float = 0.0):
     async def lifespan(app: FastAPI):
         engine = create_async_engine(pg_url, echo=False)
         async with engine.begin() as conn:
-            await _init_budget_schema(conn, initial_cumulative)
+            await _reset_budget_state(conn, initial_cumulative)
 
         db_factory = async_sessionmaker(engine, expire_on_commit=False)
         sm = SessionManager(db_session_factory=db_factory)
@@ -216,8 +238,6 @@ class TestBudgetDenyE2E:
             _collect_until_done(ws)
 
         # Verify no reservations were created (engine was disposed, create a new one)
-        import asyncio
-
         async def _check():
             engine = create_async_engine(pg_url, echo=False)
             async with engine.begin() as conn:
@@ -33,41 +33,13 @@ def _make_settings(workspace: Path) -> MemorySettings:
 
 
 @pytest_asyncio.fixture()
-async def memory_db(db_engine, db_session_factory):
-    """Set up memory_entries trigger and provide shared session factory.
+async def memory_db(db_session_factory):
+    """Provide shared session factory; truncate memory_entries afterwards.
 
     Reuses the session-scoped db_engine/db_session_factory from conftest
     to avoid creating separate engines that corrupt the event loop.
+    search_vector is a generated column, so no trigger setup is needed.
     """
-    async with db_engine.begin() as conn:
-        # Create the search trigger (idempotent via CREATE OR REPLACE)
-        await conn.execute(text(f"""
-            CREATE OR REPLACE FUNCTION {DB_SCHEMA}.memory_entries_search_trigger()
-            RETURNS trigger AS $$
-            BEGIN
-                NEW.search_vector :=
-                    setweight(to_tsvector('simple', COALESCE(NEW.title, '')), 'A') ||
-                    setweight(to_tsvector('simple', COALESCE(NEW.content, '')), 'B');
-                NEW.updated_at := now();
-                RETURN NEW;
-            END;
-            $$ LANGUAGE plpgsql;
-        """))
-
-        # Check if trigger exists before creating
-        result = await conn.execute(text(f"""
-            SELECT 1 FROM pg_trigger
-            WHERE tgname = 'trg_memory_entries_search'
-            AND tgrelid = '{DB_SCHEMA}.memory_entries'::regclass
-        """))
-        if result.fetchone() is None:
-            await conn.execute(text(f"""
-                CREATE TRIGGER trg_memory_entries_search
-                BEFORE INSERT OR UPDATE ON {DB_SCHEMA}.memory_entries
-                FOR EACH ROW
-                EXECUTE FUNCTION {DB_SCHEMA}.memory_entries_search_trigger();
-            """))
-
     yield db_session_factory
 
     async with db_session_factory() as db:
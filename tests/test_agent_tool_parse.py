@@ -102,6 +102,24 @@ class TestSanitizeToolCallHistory:
         ]
 
 
+class TestMessagesWithSeqToOpenAI:
+    def test_plain_and_tool_messages(self):
+        from src.agent.tool_history import _messages_with_seq_to_openai
+        from src.session.manager import MessageWithSeq
+
+        messages = [
+            MessageWithSeq(seq=0, role="user", content=None, tool_calls=None, tool_call_id=None),
+            MessageWithSeq(seq=1, role="assistant", content="", tool_calls=[{"id": "c1"}],
+                           tool_call_id=None),
+            MessageWithSeq(seq=2, role="tool", content="{}", tool_calls=None, tool_call_id="c1"),
+        ]
+        assert _messages_with_seq_to_openai(messages) == [
+            {"role": "user", "content": ""},
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "c1"}]},
+            {"role": "tool", "content": "{}", "tool_call_id": "c1"},
+        ]
+
+
 class TestExecuteToolDictValidation:
     """Test _execute_tool rejects non-dict JSON with INVALID_ARGS."""
 
@@ -179,6 +197,7 @@ class TestHandleMessageWithBadArgs:
         user_msg = MagicMock()
         user_msg.seq = 0
         session_manager.append_message = AsyncMock(return_value=user_msg)
+        session_manager.append_messages = AsyncMock()
         session_manager.get_mode = AsyncMock(return_value=ToolMode.chat_safe)
         session_manager.get_compaction_state = AsyncMock(return_value=None)
         session_manager.get_effective_history = MagicMock(return_value=[])
@@ -226,6 +245,7 @@ class TestHandleMessageWithBadArgs:
         user_msg = MagicMock()
         user_msg.seq = 0
         session_manager.append_message = AsyncMock(return_value=user_msg)
+        session_manager.append_messages = AsyncMock()
         session_manager.get_mode = AsyncMock(return_value=ToolMode.chat_safe)
         session_manager.get_compaction_state = AsyncMock(return_value=None)
         session_manager.get_effective_history = MagicMock(return_value=[])
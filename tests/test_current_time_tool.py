@@ -0,0 +1,23 @@
+"""Tests for CurrentTimeTool timezone resolution."""
+
+from __future__ import annotations
+
+from datetime import UTC
+
+from src.tools.builtins.current_time import CurrentTimeTool, _get_zoneinfo
+
+
+class TestCurrentTimeTool:
+    async def test_named_timezone(self):
+        result = await CurrentTimeTool().execute({"timezone": "Asia/Shanghai"})
+        assert result["timezone"] == "Asia/Shanghai"
+        assert result["iso"].endswith("+08:00")
+
+    async def test_unknown_timezone_returns_error(self):
+        result = await CurrentTimeTool().execute({"timezone": "Nowhere/Nothing"})
+        assert result["error_code"] == "INVALID_TIMEZONE"
+
+    def test_zoneinfo_lookup_cached(self):
+        assert _get_zoneinfo("UTC") is UTC
+        assert _get_zoneinfo("Europe/Berlin") is _get_zoneinfo("Europe/Berlin")
+        assert _get_zoneinfo.cache_info().hits >= 1
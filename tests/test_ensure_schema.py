@@ -1,9 +1,10 @@
-"""Tests for ensure_schema search trigger DDL.
+"""Tests for ensure_schema search column DDL.
 
-Covers: trigger creation is idempotent (can be called multiple times),
-and search_vector is auto-populated on INSERT.
+Covers: ensure_schema is idempotent (can be called multiple times),
+and the generated search_vector is auto-populated on INSERT.
 
-Marked as integration — requires a live PostgreSQL instance.
+Tests marked integration require a live PostgreSQL instance; the unit tests
+for ensure_schema's DDL helpers run without one.
 """
 
 from __future__ import annotations
@@ -18,8 +19,8 @@ from src.session.database import ensure_schema
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_ensure_schema_creates_trigger(db_engine: AsyncEngine) -> None:
-    """Trigger is idempotent and search_vector is populated on INSERT."""
+async def test_ensure_schema_populates_search_vector(db_engine: AsyncEngine) -> None:
+    """ensure_schema is idempotent and search_vector is populated on INSERT."""
     # Run ensure_schema twice — second call must not error (idempotent)
     await ensure_schema(db_engine, DB_SCHEMA)
     await ensure_schema(db_engine, DB_SCHEMA)
@@ -150,12 +151,31 @@ async def test_ensure_schema_adds_search_text_column(
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_search_text_trigger_fallback(db_engine: AsyncEngine) -> None:
-    """P2-M3c: trigger uses search_text when present, falls back to content."""
+async def test_ensure_schema_creates_scope_search_index(
+    db_engine: AsyncEngine,
+) -> None:
+    """Composite (scope_key, search_vector) GIN index exists after ensure_schema."""
     await ensure_schema(db_engine, DB_SCHEMA)
 
     async with db_engine.begin() as conn:
-        # Insert with search_text → trigger should use search_text for B weight
+        result = await conn.execute(text(f"""
+            SELECT indexdef FROM pg_indexes
+            WHERE schemaname = '{DB_SCHEMA}'
+              AND indexname = 'idx_memory_entries_scope_search'
+        """))
+        row = result.first()
+        assert row is not None
+        assert "gin (scope_key, search_vector)" in row.indexdef
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_search_vector_search_text_fallback(db_engine: AsyncEngine) -> None:
+    """P2-M3c: search_vector uses search_text when present, falls back to content."""
+    await ensure_schema(db_engine, DB_SCHEMA)
+
+    async with db_engine.begin() as conn:
+        # Insert with search_text → search_text is used for B weight
         await conn.execute(text(f"""
             INSERT INTO {DB_SCHEMA}.memory_entries
                 (scope_key, source_type, title, content, search_text, tags)
@@ -174,7 +194,7 @@ async def test_search_text_trigger_fallback(db_engine: AsyncEngine) -> None:
         # search_vector should contain tokens from search_text, not content
         assert "jieba" in row.sv or "segment" in row.sv or "token" in row.sv
 
-        # Insert without search_text → trigger falls back to content
+        # Insert without search_text → falls back to content
         await conn.execute(text(f"""
             INSERT INTO {DB_SCHEMA}.memory_entries
                 (scope_key, source_type, title, content, tags)
@@ -201,89 +221,52 @@ async def test_search_text_trigger_fallback(db_engine: AsyncEngine) -> None:
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_alembic_migration_search_text_sql(db_engine: AsyncEngine) -> None:
-    """P2-M3c: Execute Alembic migration SQL and verify via Alembic trigger.
-
-    The test DB normally uses the ensure_schema trigger
-    (trg_memory_entries_search_vector → memory_entries_search_vector_update).
-    To verify the *Alembic* migration path, this test:
-    1. Runs the upgrade SQL (column + function)
-    2. Binds the Alembic-path trigger (trg_memory_entries_search) so INSERTs
-       fire the Alembic function, not the ensure_schema one
-    3. Verifies search_text → search_vector via INSERT
-    4. Runs downgrade SQL
-    5. Restores the ensure_schema trigger for other tests
-    """
-    schema = DB_SCHEMA
+async def test_ensure_schema_converts_trigger_search_vector(
+    db_engine: AsyncEngine,
+) -> None:
+    """Legacy trigger-maintained search_vector is converted to a generated column.
 
+    Recreates the pre-conversion layout (plain tsvector column + Alembic-path
+    trigger), runs ensure_schema, and verifies the trigger is gone, the column
+    is generated, existing rows are recomputed, and the GIN indexes are back.
+    """
+    await _install_legacy_search_trigger(db_engine)
     async with db_engine.begin() as conn:
-        # ── Upgrade ──
-        await conn.execute(text(
-            f"ALTER TABLE {schema}.memory_entries"
-            f" ADD COLUMN IF NOT EXISTS search_text TEXT"
-        ))
         await conn.execute(text(f"""
-            CREATE OR REPLACE FUNCTION {schema}.memory_entries_search_trigger()
-            RETURNS trigger AS $$
-            BEGIN
-                NEW.search_vector :=
-                    setweight(to_tsvector('simple', COALESCE(NEW.title, '')), 'A')
-                    || setweight(to_tsvector('simple',
-                        COALESCE(NEW.search_text, NEW.content, '')), 'B');
-                NEW.updated_at := now();
-                RETURN NEW;
-            END;
-            $$ LANGUAGE plpgsql;
-        """))
-
-        # Verify column exists
-        result = await conn.execute(text(
-            f"SELECT column_name FROM information_schema.columns"
-            f" WHERE table_schema = '{schema}'"
-            f" AND table_name = 'memory_entries'"
-            f" AND column_name = 'search_text'"
-        ))
-        assert result.first() is not None, "search_text column not created"
-
-        # ── Bind the Alembic-path trigger so the INSERT fires it ──
-        # Drop the ensure_schema trigger temporarily
-        await conn.execute(text(
-            f"DROP TRIGGER IF EXISTS trg_memory_entries_search_vector"
-            f" ON {schema}.memory_entries"
-        ))
-        # Create the Alembic-path trigger
-        await conn.execute(text(f"""
-            CREATE TRIGGER trg_memory_entries_search
-            BEFORE INSERT OR UPDATE ON {schema}.memory_entries
-            FOR EACH ROW
-            EXECUTE FUNCTION {schema}.memory_entries_search_trigger()
-        """))
-
-        # Verify: INSERT fires Alembic function (uses search_text, not content)
-        await conn.execute(text(f"""
-            INSERT INTO {schema}.memory_entries
+            INSERT INTO {DB_SCHEMA}.memory_entries
                 (scope_key, source_type, title, content, search_text, tags)
             VALUES
-                ('main', 'daily_note', 'mig_test', 'raw content only',
+                ('main', 'daily_note', 'conv_test', 'raw content only',
                  'segmented tokens here', ARRAY[]::text[])
         """))
+
+    await ensure_schema(db_engine, DB_SCHEMA)
+
+    await _assert_search_vector_converted(db_engine)
+    async with db_engine.begin() as conn:
         result = await conn.execute(text(
             f"SELECT search_vector::text AS sv"
-            f" FROM {schema}.memory_entries WHERE title = 'mig_test'"
+            f" FROM {DB_SCHEMA}.memory_entries WHERE title = 'conv_test'"
         ))
         row = result.first()
         assert row is not None
-        # Must contain tokens from search_text, NOT from content
-        assert "segment" in row.sv or "token" in row.sv
-        assert "raw" not in row.sv, (
-            "search_vector contains content tokens — "
-            "Alembic trigger not active"
-        )
-
-        # ── Downgrade ──
+        assert "segment" in row.sv
+        assert "raw" not in row.sv
+
         await conn.execute(text(
-            f"DROP TRIGGER IF EXISTS trg_memory_entries_search"
-            f" ON {schema}.memory_entries"
+            f"DELETE FROM {DB_SCHEMA}.memory_entries WHERE title = 'conv_test'"
+        ))
+
+
+async def _install_legacy_search_trigger(engine: AsyncEngine) -> None:
+    """Replace the generated column with the pre-conversion trigger layout."""
+    schema = DB_SCHEMA
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            f"ALTER TABLE {schema}.memory_entries DROP COLUMN search_vector"
+        ))
+        await conn.execute(text(
+            f"ALTER TABLE {schema}.memory_entries ADD COLUMN search_vector TSVECTOR"
         ))
         await conn.execute(text(f"""
             CREATE OR REPLACE FUNCTION {schema}.memory_entries_search_trigger()
@@ -292,30 +275,147 @@ async def test_alembic_migration_search_text_sql(db_engine: AsyncEngine) -> None
                 NEW.search_vector :=
                     setweight(to_tsvector('simple', COALESCE(NEW.title, '')), 'A')
                     || setweight(to_tsvector('simple',
-                        COALESCE(NEW.content, '')), 'B');
+                        COALESCE(NEW.search_text, NEW.content, '')), 'B');
                 NEW.updated_at := now();
                 RETURN NEW;
             END;
             $$ LANGUAGE plpgsql;
         """))
-        await conn.execute(text(
-            f"ALTER TABLE {schema}.memory_entries"
-            f" DROP COLUMN IF EXISTS search_text"
-        ))
+        await conn.execute(text(f"""
+            CREATE TRIGGER trg_memory_entries_search
+            BEFORE INSERT OR UPDATE ON {schema}.memory_entries
+            FOR EACH ROW
+            EXECUTE FUNCTION {schema}.memory_entries_search_trigger()
+        """))
 
-        # Verify column gone
+
+async def _assert_search_vector_converted(engine: AsyncEngine) -> None:
+    """search_vector is generated, no user trigger remains, GIN indexes exist."""
+    schema = DB_SCHEMA
+    async with engine.connect() as conn:
         result = await conn.execute(text(
-            f"SELECT column_name FROM information_schema.columns"
+            f"SELECT is_generated FROM information_schema.columns"
             f" WHERE table_schema = '{schema}'"
             f" AND table_name = 'memory_entries'"
-            f" AND column_name = 'search_text'"
+            f" AND column_name = 'search_vector'"
         ))
-        assert result.first() is None, "search_text column not dropped"
+        assert result.scalar() == "ALWAYS"
 
-        # Cleanup test row
-        await conn.execute(text(
-            f"DELETE FROM {schema}.memory_entries WHERE title = 'mig_test'"
+        result = await conn.execute(text(
+            f"SELECT 1 FROM pg_trigger"
+            f" WHERE tgrelid = '{schema}.memory_entries'::regclass"
+            f" AND NOT tgisinternal"
         ))
+        assert result.first() is None, "legacy search trigger not dropped"
+
+        result = await conn.execute(text(
+            f"SELECT indexname FROM pg_indexes"
+            f" WHERE schemaname = '{schema}' AND tablename = 'memory_entries'"
+        ))
+        indexes = {r.indexname for r in result}
+        assert {"idx_memory_entries_search", "idx_memory_entries_scope_search"} <= indexes
+
+
+def test_search_vector_conversion_sql_drops_both_trigger_variants() -> None:
+    """Conversion DDL removes ensure_schema and Alembic triggers before re-adding."""
+    from src.session.database import _search_vector_conversion_sql
+
+    stmts = _search_vector_conversion_sql("neomagi")
+    drops = [s for s in stmts if s.startswith("DROP TRIGGER")]
+    assert any("trg_memory_entries_search_vector" in s for s in drops)
+    assert any("trg_memory_entries_search " in s for s in drops)
+    add_idx = next(i for i, s in enumerate(stmts) if "GENERATED ALWAYS AS" in s)
+    assert add_idx > max(stmts.index(s) for s in drops)
+    assert "STORED" in stmts[add_idx]
+
+
+def _extension_conn(row, *, create_error: Exception | None = None):
+    """Mock AsyncConnection whose pg_available_extensions lookup returns ``row``."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    conn = MagicMock()
+
+    async def execute(stmt, *args):
+        sql = str(stmt)
+        if "CREATE EXTENSION" in sql and create_error is not None:
+            raise create_error
+        result = MagicMock()
+        result.first.return_value = row
+        return result
+
+    conn.execute = AsyncMock(side_effect=execute)
+    conn.begin_nested.return_value.__aenter__ = AsyncMock()
+    conn.begin_nested.return_value.__aexit__ = AsyncMock(return_value=False)
+    return conn
+
+
+def _executed_sql(conn) -> list[str]:
+    return [str(call.args[0]) for call in conn.execute.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_scope_search_index_skips_install_when_extension_present() -> None:
+    """An installed btree_gin is not re-created; the index is built directly."""
+    from types import SimpleNamespace
+
+    from src.session.database import _create_scope_search_index
+
+    conn = _extension_conn(SimpleNamespace(installed_version="1.3"))
+    await _create_scope_search_index(conn, "neomagi")
+
+    sql = _executed_sql(conn)
+    assert not any("CREATE EXTENSION" in s for s in sql)
+    assert "idx_memory_entries_scope_search" in sql[-1]
+
+
+@pytest.mark.asyncio
+async def test_scope_search_index_skipped_when_extension_unavailable() -> None:
+    """No btree_gin on the server: neither the extension nor the index is attempted."""
+    from src.session.database import _create_scope_search_index
+
+    conn = _extension_conn(None)
+    await _create_scope_search_index(conn, "neomagi")
+
+    assert len(_executed_sql(conn)) == 1
+    conn.begin_nested.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_scope_search_index_skipped_when_install_denied() -> None:
+    """A failed CREATE EXTENSION is contained in a savepoint and skips the index."""
+    from types import SimpleNamespace
+
+    from sqlalchemy.exc import ProgrammingError
+
+    from src.session.database import _create_scope_search_index
+
+    denied = ProgrammingError("CREATE EXTENSION", {}, Exception("permission denied"))
+    conn = _extension_conn(SimpleNamespace(installed_version=None), create_error=denied)
+    await _create_scope_search_index(conn, "neomagi")
+
+    sql = _executed_sql(conn)
+    assert "CREATE EXTENSION" in sql[-1]
+    assert not any("idx_memory_entries_scope_search" in s for s in sql)
+    conn.begin_nested.assert_called_once()
+
+
+def test_add_columns_sql_is_single_alter_statement() -> None:
+    """Additive columns for one table are batched into one ALTER TABLE."""
+    from src.session.database import _add_columns_sql
+
+    sql = _add_columns_sql("neomagi.sessions", ["a INTEGER", "b TEXT"])
+    assert sql.count("ALTER TABLE") == 1
+    assert "ADD COLUMN IF NOT EXISTS a INTEGER," in sql
+    assert sql.rstrip().endswith("ADD COLUMN IF NOT EXISTS b TEXT")
+
+
+def test_messages_session_id_has_no_standalone_index() -> None:
+    """session_id lookups are served by uq_messages_session_seq (session_id, seq)."""
+    from src.session.models import MessageRecord
+
+    table = MessageRecord.__table__
+    single = [ix for ix in table.indexes if [c.name for c in ix.columns] == ["session_id"]]
+    assert single == []
+    uq = next(c for c in table.constraints if c.name == "uq_messages_session_seq")
+    assert [c.name for c in uq.columns] == ["session_id", "seq"]
 
-    # Restore ensure_schema state (column + ensure_schema trigger) for other tests
-    await ensure_schema(db_engine, DB_SCHEMA)
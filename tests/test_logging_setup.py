@@ -0,0 +1,47 @@
+"""Tests for structlog setup (src/infra/logging.py)."""
+
+from __future__ import annotations
+
+import pytest
+import structlog
+
+from src.infra.logging import setup_logging
+
+
+@pytest.fixture(autouse=True)
+def _reset_structlog():
+    yield
+    structlog.reset_defaults()
+
+
+def test_debug_is_filtered_at_info_level(capsys):
+    setup_logging(json_output=True, log_level="INFO")
+    log = structlog.get_logger()
+
+    log.debug("message_appended", role="user", session_id="s1")
+    log.info("visible_event")
+
+    out = capsys.readouterr().out
+    assert "message_appended" not in out
+    assert "visible_event" in out
+
+
+def test_debug_level_emits_debug(capsys):
+    setup_logging(json_output=True, log_level="debug")
+    structlog.get_logger().debug("message_appended")
+
+    assert "message_appended" in capsys.readouterr().out
+
+
+def test_level_from_env(capsys, monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    setup_logging(json_output=True)
+    structlog.get_logger().debug("message_appended")
+
+    assert "message_appended" in capsys.readouterr().out
+
+
+def test_unknown_level_rejected(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "chatty")
+    with pytest.raises(ValueError, match="CHATTY"):
+        setup_logging(json_output=True)
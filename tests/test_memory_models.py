@@ -29,3 +29,9 @@ class TestMemoryEntryModel:
     def test_has_search_vector_column(self) -> None:
         col = MemoryEntry.__table__.c.search_vector
         assert col is not None
+
+    def test_search_vector_is_stored_generated(self) -> None:
+        col = MemoryEntry.__table__.c.search_vector
+        assert col.computed is not None
+        assert col.computed.persisted is True
+        assert "coalesce(search_text, content, '')" in str(col.computed.sqltext)
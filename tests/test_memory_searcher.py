@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -61,3 +61,71 @@ class TestMemorySearcher:
 
         results = await searcher.search("   ", scope_key="main")
         assert results == []
+
+
+class TestSearchSqlVariants:
+    def test_sql_text_is_stable_across_calls(self) -> None:
+        """Same filter shape → identical SQL object (prepared-statement cache hit)."""
+        sql_a, params_a = MemorySearcher._build_search_sql(
+            "alpha", scope_key="main", limit=5, min_score=0.0,
+            source_types=None, principal_id="p1",
+        )
+        sql_b, params_b = MemorySearcher._build_search_sql(
+            "beta", scope_key="other", limit=20, min_score=0.0,
+            source_types=None, principal_id=None,
+        )
+        assert sql_a is sql_b
+        assert params_a["query"] == "alpha"
+        assert params_b["limit"] == 20
+
+    def test_uses_websearch_tsquery(self) -> None:
+        sql, _ = MemorySearcher._build_search_sql(
+            "q", scope_key="main", limit=5, min_score=0.0,
+            source_types=None, principal_id=None,
+        )
+        assert "websearch_to_tsquery('simple', :query)" in sql
+        assert "plainto_tsquery" not in sql
+
+    def test_optional_filters_select_variant(self) -> None:
+        sql, params = MemorySearcher._build_search_sql(
+            "q", scope_key="main", limit=5, min_score=0.3,
+            source_types=["daily_note"], principal_id=None,
+        )
+        assert "source_type = ANY(:source_types)" in sql
+        assert "ts_rank(search_vector, query) >= :min_score" in sql
+        assert params["source_types"] == ["daily_note"]
+        assert params["min_score"] == 0.3
+
+        plain, plain_params = MemorySearcher._build_search_sql(
+            "q", scope_key="main", limit=5, min_score=0.0,
+            source_types=None, principal_id=None,
+        )
+        assert ":source_types" not in plain
+        assert ":min_score" not in plain
+        assert "source_types" not in plain_params
+
+
+class TestExecuteSearchRowMapping:
+    @pytest.mark.asyncio
+    async def test_rows_unpack_positionally(self) -> None:
+        now = datetime.now(UTC)
+        row = (7, "main", "daily_note", "memory/x.md", "t", "c", 0.5, ["a"], now,
+               "p1", "shareable_summary")
+        db = AsyncMock()
+        db.execute.return_value = iter([row])
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=db)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        searcher = MemorySearcher(MagicMock(return_value=ctx), _make_settings())
+
+        sql, params = MemorySearcher._build_search_sql(
+            "q", scope_key="main", limit=5, min_score=0.0,
+            source_types=None, principal_id="p1",
+        )
+        [result] = await searcher._execute_search(sql, params)
+
+        assert result.entry_id == 7
+        assert result.score == 0.5
+        assert result.tags == ["a"]
+        assert result.created_at == now
+        assert result.visibility == "shareable_summary"
@@ -5,15 +5,17 @@ Covers both no-ledger fallback mode (pre-M2d behavior) and ledger-wired mode (P2
 
 from __future__ import annotations
 
+import asyncio
 import re
 from datetime import date
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from src.config.settings import MemorySettings
 from src.infra.errors import LedgerWriteError, MemoryWriteError
+from src.memory import writer as writer_module
 from src.memory.contracts import ResolvedFlushCandidate
 from src.memory.writer import MemoryWriter, MemoryWriteResult, _uuid7
 
@@ -102,6 +104,44 @@ class TestAppendDailyNote:
                 target_date=target_date,
             )
 
+    @pytest.mark.asyncio
+    async def test_size_limit_sees_external_appends(self, tmp_path: Path) -> None:
+        """Bytes appended by other writers (tools, workers) count toward the cap."""
+        settings = _make_settings(max_daily_note_bytes=200)
+        writer = MemoryWriter(tmp_path, settings)
+        target_date = date(2026, 2, 22)
+
+        result = await writer.append_daily_note(
+            "First", scope_key="main", source="user", target_date=target_date
+        )
+        with result.projection_path.open("ab") as f:
+            f.write(b"x" * 150)
+
+        with pytest.raises(MemoryWriteError, match="exceed size limit"):
+            await writer.append_daily_note(
+                "Second", scope_key="main", source="user", target_date=target_date
+            )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_appends_respect_size_limit(self, tmp_path: Path) -> None:
+        settings = _make_settings(max_daily_note_bytes=300)
+        writer = MemoryWriter(tmp_path, settings)
+        target_date = date(2026, 2, 22)
+
+        results = await asyncio.gather(
+            *(
+                writer.append_daily_note(
+                    "x" * 100, scope_key="main", source="user", target_date=target_date
+                )
+                for _ in range(2)
+            ),
+            return_exceptions=True,
+        )
+
+        assert sum(isinstance(r, MemoryWriteError) for r in results) == 1
+        path = tmp_path / "memory" / "2026-02-22.md"
+        assert len(path.read_bytes()) <= 300
+
     @pytest.mark.asyncio
     async def test_utf8_cjk(self, tmp_path: Path) -> None:
         settings = _make_settings()
@@ -240,6 +280,58 @@ class TestProcessFlushCandidates:
         written = await writer.process_flush_candidates(candidates)
         assert 0 < written < 10
 
+    @pytest.mark.asyncio
+    async def test_size_limit_checked_at_write_time(self, tmp_path: Path) -> None:
+        """A file grown after staging only takes the prefix that still fits."""
+        settings = _make_settings(max_daily_note_bytes=2000)
+        writer = MemoryWriter(tmp_path, settings)
+        write_batch = writer._write_flush_batch
+
+        async def grow_then_write(filepath, today, staged):
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            filepath.write_bytes(b"x" * (2000 - len(staged[0].entry_bytes)))
+            return await write_batch(filepath, today, staged)
+
+        candidates = [
+            ResolvedFlushCandidate(
+                candidate_text=f"late {i}", scope_key="main",
+                source_session_id="s1", confidence=0.9,
+            )
+            for i in range(3)
+        ]
+
+        with patch.object(writer, "_write_flush_batch", grow_then_write):
+            written = await writer.process_flush_candidates(candidates)
+
+        assert written == 1
+        path = tmp_path / "memory" / f"{date.today().isoformat()}.md"
+        assert path.stat().st_size == 2000
+        assert "late 0" in path.read_text(encoding="utf-8")
+
+    @pytest.mark.asyncio
+    async def test_batch_is_single_append(self, tmp_path: Path) -> None:
+        settings = _make_settings()
+        writer = MemoryWriter(tmp_path, settings)
+
+        candidates = [
+            ResolvedFlushCandidate(
+                candidate_text=f"batched {i}", scope_key="main",
+                source_session_id="s1", confidence=0.9,
+            )
+            for i in range(3)
+        ]
+
+        with patch(
+            "src.memory.writer._append_bytes", wraps=writer_module._append_bytes,
+        ) as append_spy:
+            written = await writer.process_flush_candidates(candidates)
+
+        assert written == 3
+        assert append_spy.await_count == 1
+        path = tmp_path / "memory" / f"{date.today().isoformat()}.md"
+        content = path.read_text(encoding="utf-8")
+        assert content.count("---\n") == 3
+
     @pytest.mark.asyncio
     async def test_flush_propagates_source_session_id(self, tmp_path: Path) -> None:
         settings = _make_settings()
@@ -434,6 +526,29 @@ class TestLedgerWiredMode:
         assert written == 1
         assert ledger.append.await_count == 1
 
+    @pytest.mark.asyncio
+    async def test_flush_batch_skips_oversized_projection(self, tmp_path: Path) -> None:
+        settings = _make_settings(max_daily_note_bytes=400)
+        ledger = _make_mock_ledger(return_value=True)
+        writer = MemoryWriter(tmp_path, settings, ledger=ledger)
+
+        candidates = [
+            ResolvedFlushCandidate(
+                candidate_text=text, scope_key="main",
+                source_session_id="s1", confidence=0.9,
+            )
+            for text in ("small one", "x" * 500, "small two")
+        ]
+
+        written = await writer.process_flush_candidates(candidates)
+        assert written == 3  # ledger is truth; projection is best-effort
+        content = (tmp_path / "memory" / f"{date.today().isoformat()}.md").read_text(
+            encoding="utf-8",
+        )
+        assert "small one" in content
+        assert "small two" in content
+        assert "x" * 500 not in content
+
     @pytest.mark.asyncio
     async def test_flush_stops_on_ledger_error(self, tmp_path: Path) -> None:
         settings = _make_settings()
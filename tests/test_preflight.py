@@ -64,7 +64,7 @@ def _mock_engine_ok() -> AsyncMock:
 def _mock_engine_with_db(
     tables: list[str] | None = None,
     budget_tables: list[str] | None = None,
-    trigger_exists: bool = True,
+    search_vector_generated: bool = True,
 ) -> AsyncMock:
     """Create a mock engine with configurable DB responses."""
     if tables is None:
@@ -85,8 +85,8 @@ def _mock_engine_with_db(
                 result.fetchall.return_value = [(t,) for t in budget_tables]
             else:
                 result.fetchall.return_value = [(t,) for t in tables]
-        elif "information_schema.triggers" in stmt_str:
-            result.fetchone.return_value = (1,) if trigger_exists else None
+        elif "information_schema.columns" in stmt_str:
+            result.fetchone.return_value = (1,) if search_vector_generated else None
         else:
             result.fetchone.return_value = (1,)
         return result
@@ -228,13 +228,13 @@ class TestCheckSchemaTables:
 class TestCheckSearchTrigger:
     @pytest.mark.asyncio
     async def test_exists(self) -> None:
-        engine = _mock_engine_with_db(trigger_exists=True)
+        engine = _mock_engine_with_db(search_vector_generated=True)
         r = await _check_search_trigger(engine)
         assert r.status == CheckStatus.OK
 
     @pytest.mark.asyncio
     async def test_missing(self) -> None:
-        engine = _mock_engine_with_db(trigger_exists=False)
+        engine = _mock_engine_with_db(search_vector_generated=False)
         r = await _check_search_trigger(engine)
         assert r.status == CheckStatus.WARN
 
@@ -427,7 +427,7 @@ class TestRunPreflight:
         settings = _make_settings(workspace_dir=tmp_path, memory_workspace_path=tmp_path)
         settings.telegram.bot_token = ""
 
-        engine = _mock_engine_with_db(trigger_exists=False)
+        engine = _mock_engine_with_db(search_vector_generated=False)
         mock_evo = AsyncMock()
         mock_evo.reconcile_soul_projection = AsyncMock()
 
@@ -44,6 +44,15 @@ class TestNormalizeQuery:
         assert "!" not in result
         assert "？" not in result
 
+    def test_keeps_websearch_operators(self) -> None:
+        result = normalize_query('"Exact Phrase" -skip or other')
+        assert result == '"exact phrase" -skip or other'
+
+    def test_cjk_phrase_quotes_kept(self) -> None:
+        result = normalize_query('"记忆架构"')
+        assert result.startswith('"') and result.endswith('"')
+        assert "记忆" in result
+
     def test_preserves_content(self) -> None:
         result = normalize_query("tsvector search")
         assert "tsvector" in result
@@ -24,6 +24,9 @@ class TestSessionIdentity:
         with pytest.raises(AttributeError):
             si.session_id = "s2"  # type: ignore[misc]
 
+    def test_slotted(self) -> None:
+        assert not hasattr(SessionIdentity(session_id="s1"), "__dict__")
+
 
 class TestResolveScopeKey:
     def test_main_returns_main(self) -> None:
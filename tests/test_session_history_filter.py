@@ -100,6 +100,37 @@ class TestGetHistoryForDisplay:
         assert result[0]["role"] == "user"
         assert result[1]["role"] == "assistant"
 
+    @pytest.mark.asyncio
+    async def test_display_view_cached_and_extended(self):
+        manager = SessionManager(db_session_factory=MagicMock())
+        with patch.object(manager, "_persist_message", side_effect=[0, 1, 2]), patch.object(
+            manager, "load_session_from_db", new_callable=AsyncMock, return_value=True,
+        ):
+            await manager.append_message("s1", "user", "Hi")
+            first = await manager.get_history_for_display("s1")
+            cache = manager.get_or_create("s1")._display_cache
+            await manager.append_message("s1", "tool", "{}", tool_call_id="c1")
+            await manager.append_message("s1", "assistant", "Hello!")
+            second = await manager.get_history_for_display("s1")
+
+        assert manager.get_or_create("s1")._display_cache is cache
+        assert [m["content"] for m in first] == ["Hi"]
+        assert [m["content"] for m in second] == ["Hi", "Hello!"]
+
+    @pytest.mark.asyncio
+    async def test_display_view_mutation_does_not_leak_into_cache(self):
+        manager = SessionManager(db_session_factory=MagicMock())
+        with patch.object(manager, "_persist_message", return_value=0), patch.object(
+            manager, "load_session_from_db", new_callable=AsyncMock, return_value=True,
+        ):
+            await manager.append_message("s1", "user", "Hi")
+            first = await manager.get_history_for_display("s1")
+            first[0]["content"] = "mutated"
+            first.append({"role": "user", "content": "extra"})
+            second = await manager.get_history_for_display("s1")
+
+        assert [m["content"] for m in second] == ["Hi"]
+
 
 class TestHistoryContract:
     """R6c: history contract — duplicate content, role filtering, empty session."""
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.session.manager import SessionManager
+from src.session.seq_alloc import build_message_insert, build_messages_insert
 
 
 class TestConcurrentSessionCreation:
@@ -107,3 +108,379 @@ class TestSeqConflictDetection:
         ):
             with pytest.raises(IntegrityError):
                 await manager.append_message("s1", "user", "dup")
+
+
+class TestSingleStatementPersist:
+    """seq allocation + message INSERT compile to one round trip."""
+
+    def _compile(self, lock_token: str | None) -> str:
+        from sqlalchemy.dialects import postgresql
+
+        from src.session.manager import Message
+
+        stmt, _ = build_message_insert(
+            "s1", Message(role="user", content="hi"), lock_token,
+        )
+        return str(stmt.compile(dialect=postgresql.asyncpg.dialect()))
+
+    def test_upsert_is_cte_feeding_message_insert(self):
+        sql = self._compile(None)
+        assert sql.startswith("WITH seq_alloc AS")
+        assert "INSERT INTO neomagi.messages" in sql
+        assert "FROM seq_alloc RETURNING neomagi.messages.seq" in sql
+
+    def test_fencing_condition_inside_cte(self):
+        sql = self._compile("tok")
+        cte_part = sql.split("INSERT INTO neomagi.messages")[0]
+        assert "lock_token" in cte_part
+
+    def test_statement_is_prebuilt_and_values_are_params(self):
+        from src.session.manager import Message
+
+        msg = Message(role="tool", content="r", tool_calls=[{"id": "c"}], tool_call_id="c")
+        first, params = build_message_insert("s1", msg, "tok")
+        second, _ = build_message_insert("s2", Message(role="user", content="x"), "tok2")
+
+        assert first is second
+        assert params == {
+            "session_id": "s1", "role": "tool", "content": "r",
+            "tool_calls": [{"id": "c"}], "tool_call_id": "c", "lock_token": "tok",
+        }
+        assert "lock_token" not in build_message_insert("s1", msg, None)[1]
+
+
+class TestSessionCacheBound:
+    """In-memory session cache is LRU-bounded."""
+
+    def test_evicts_least_recently_used(self):
+        manager = SessionManager(db_session_factory=MagicMock(), max_cached_sessions=2)
+        manager.get_or_create("a")
+        manager.get_or_create("b")
+        manager.get_or_create("a")  # touch: b is now LRU
+        manager.get_or_create("c")
+
+        assert list(manager._sessions) == ["a", "c"]
+
+    def test_cached_session_identity_preserved(self):
+        manager = SessionManager(db_session_factory=MagicMock(), max_cached_sessions=2)
+        first = manager.get_or_create("a")
+        manager.get_or_create("b")
+
+        assert manager.get_or_create("a") is first
+
+    def test_claimed_session_not_evicted(self):
+        manager = SessionManager(db_session_factory=MagicMock(), max_cached_sessions=2)
+        claimed = manager.get_or_create("a")
+        manager._claimed.add("a")
+        for sid in ("b", "c", "d"):
+            manager.get_or_create(sid)
+
+        assert list(manager._sessions) == ["a", "d"]
+        assert manager.get_or_create("a") is claimed
+
+    def test_all_claimed_overflows_until_release(self):
+        manager = SessionManager(db_session_factory=MagicMock(), max_cached_sessions=1)
+        manager.get_or_create("a")
+        manager._claimed.add("a")
+        manager.get_or_create("b")
+
+        assert list(manager._sessions) == ["a", "b"]
+
+        manager._claimed.discard("a")
+        manager.get_or_create("c")
+
+        assert list(manager._sessions) == ["c"]
+
+    @pytest.mark.asyncio
+    async def test_claim_and_release_track_in_flight(self):
+        from unittest.mock import AsyncMock
+
+        db = AsyncMock()
+        db.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value="s1"))
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=db)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        manager = SessionManager(db_session_factory=factory)
+
+        token = await manager.try_claim_session("s1")
+        assert manager._claimed == {"s1"}
+
+        await manager.release_session("s1", token)
+        assert manager._claimed == set()
+
+
+class TestAppendedMessageImmutable:
+    @pytest.mark.asyncio
+    async def test_append_returns_frozen_message_with_seq(self):
+        import dataclasses
+
+        manager = SessionManager(db_session_factory=MagicMock())
+        with patch.object(manager, "_persist_message", return_value=7):
+            msg = await manager.append_message("s1", "user", "hello")
+
+        assert msg.seq == 7
+        assert manager.get_or_create("s1").messages[-1] is msg
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            msg.content = "changed"
+
+
+class TestPersistSpawnsNoTasks:
+    """[Decision 0021] persist is awaited inline — bursts never pile up background tasks."""
+
+    @pytest.mark.asyncio
+    async def test_burst_append_leaves_no_pending_tasks(self):
+        import asyncio
+
+        manager = SessionManager(db_session_factory=MagicMock())
+        before = asyncio.all_tasks()
+        with patch.object(manager, "_persist_message", side_effect=range(100)):
+            for i in range(100):
+                await manager.append_message("s1", "user", f"m{i}")
+
+        assert asyncio.all_tasks() == before
+        assert [m.seq for m in manager.get_or_create("s1").messages] == list(range(100))
+
+
+class TestBatchPersist:
+    def test_batch_insert_is_single_statement(self):
+        from sqlalchemy.dialects import postgresql
+
+        from src.session.manager import Message
+
+        stmt = build_messages_insert(
+            "s1",
+            [Message(role="assistant", content="a"), Message(role="tool", content="b")],
+            None,
+        )
+        sql = str(stmt.compile(dialect=postgresql.asyncpg.dialect()))
+        assert sql.startswith("WITH seq_alloc AS")
+        assert "seq_alloc.seq + batch.ord" in sql
+        assert sql.count("INSERT INTO neomagi.messages") == 1
+
+    @pytest.mark.asyncio
+    async def test_append_messages_assigns_contiguous_seqs(self):
+        from src.session.manager import Message
+
+        manager = SessionManager(db_session_factory=MagicMock())
+        manager.get_history("s1")  # warm the OpenAI-format cache
+        msgs = [
+            Message(role="tool", content="r1", tool_call_id="c1"),
+            Message(role="tool", content="r2", tool_call_id="c2"),
+        ]
+        with patch.object(manager, "_persist_messages", return_value=5) as persist:
+            persisted = await manager.append_messages("s1", msgs, lock_token="tok")
+
+        persist.assert_awaited_once_with("s1", msgs, lock_token="tok")
+        assert [m.seq for m in persisted] == [5, 6]
+        assert manager.get_or_create("s1").messages == persisted
+        assert [h["tool_call_id"] for h in manager.get_history("s1")] == ["c1", "c2"]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_db(self):
+        manager = SessionManager(db_session_factory=MagicMock())
+        with patch.object(manager, "_persist_messages") as persist:
+            assert await manager.append_messages("s1", []) == []
+        persist.assert_not_called()
+
+
+class TestSlottedRecords:
+    def test_per_message_records_have_no_instance_dict(self):
+        from src.session.manager import Message, MessageWithSeq
+
+        for obj in (
+            Message(role="user", content="x"),
+            MessageWithSeq(seq=0, role="user", content="x", tool_calls=None, tool_call_id=None),
+        ):
+            assert not hasattr(obj, "__dict__")
+
+
+class TestSessionTimestamps:
+    def test_updated_at_defaults_to_created_at(self):
+        from src.session.manager import Session
+
+        session = Session(id="s1")
+        assert session.updated_at is session.created_at
+
+    def test_explicit_updated_at_kept(self):
+        from datetime import UTC, datetime
+
+        from src.session.manager import Session
+
+        created = datetime(2026, 1, 1, tzinfo=UTC)
+        updated = datetime(2026, 1, 2, tzinfo=UTC)
+        assert Session(id="s1", created_at=created, updated_at=updated).updated_at == updated
+
+
+class TestAutocommitPersist:
+    """Single-statement writes use the AUTOCOMMIT factory when one is given."""
+
+    @staticmethod
+    def _factory(seqs: list[int]) -> MagicMock:
+        from unittest.mock import AsyncMock
+
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=MagicMock())
+        db.execute.return_value.scalars.return_value.all.return_value = seqs
+        db.commit = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=db)
+        factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        return factory
+
+    @pytest.mark.asyncio
+    async def test_persist_and_release_use_autocommit_factory(self):
+        tx_factory, ac_factory = MagicMock(), self._factory([3])
+        manager = SessionManager(
+            db_session_factory=tx_factory, autocommit_session_factory=ac_factory,
+        )
+        msg = await manager.append_message("s1", "user", "hi", lock_token="tok")
+        await manager.release_session("s1", "tok")
+
+        assert msg.seq == 3
+        assert ac_factory.call_count == 2
+        tx_factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_mode_reads_through_autocommit_factory(self):
+        from src.tools.base import ToolMode
+
+        ac_factory = self._factory([])
+        db = ac_factory.return_value.__aenter__.return_value
+        db.execute.return_value.scalar_one_or_none.return_value = "coding"
+        tx_factory = MagicMock()
+        manager = SessionManager(
+            db_session_factory=tx_factory, autocommit_session_factory=ac_factory,
+        )
+
+        assert await manager.get_mode("s1") == ToolMode.coding
+        tx_factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_per_turn_reads_use_autocommit_factory(self):
+        ac_factory = self._factory([])
+        db = ac_factory.return_value.__aenter__.return_value
+        db.execute.return_value.one_or_none.return_value = ("ctx", 4, None)
+        db.execute.return_value.first.return_value = ("p1",)
+        tx_factory = MagicMock()
+        manager = SessionManager(
+            db_session_factory=tx_factory, autocommit_session_factory=ac_factory,
+        )
+
+        assert (await manager.get_compaction_state("s1")).last_compaction_seq == 4
+        assert await manager.get_session_principal("s1") == "p1"
+        tx_factory.assert_not_called()
+
+    def test_defaults_to_transactional_factory(self):
+        factory = MagicMock()
+        manager = SessionManager(db_session_factory=factory)
+        assert manager._db_autocommit is factory
+
+    @pytest.mark.asyncio
+    async def test_autocommit_session_factory_binds_autocommit_engine(self):
+        from src.config.settings import DatabaseSettings
+        from src.session.database import create_db_engine, make_session_factory
+
+        engine = await create_db_engine(DatabaseSettings())
+        try:
+            bind = make_session_factory(engine, autocommit=True).kw["bind"]
+            assert bind.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
+        finally:
+            await engine.dispose()
+
+
+class TestEngineJsonSerializer:
+    """JSONB binds use the compact UTF-8 serializer."""
+
+    @pytest.mark.asyncio
+    async def test_engine_json_serializer_is_compact_utf8(self):
+        """JSONB binds are serialized without whitespace or \\uXXXX escapes."""
+        from src.config.settings import DatabaseSettings
+        from src.session.database import create_db_engine
+
+        engine = await create_db_engine(DatabaseSettings())
+        try:
+            payload = engine.dialect._json_serializer([{"name": "记忆", "args": {"k": 1}}])
+            assert payload == '[{"name":"记忆","args":{"k":1}}]'
+        finally:
+            await engine.dispose()
+
+
+class TestSessionsFillfactor:
+    """sessions leaves page space for HOT next_seq/updated_at updates."""
+
+    def test_sessions_table_reserves_space_for_hot_updates(self):
+        """sessions is created WITH (fillfactor) so next_seq bumps stay HOT."""
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateTable
+
+        from src.session.models import SESSIONS_FILLFACTOR, SessionRecord
+
+        ddl = str(CreateTable(SessionRecord.__table__).compile(dialect=postgresql.dialect()))
+        assert f"WITH (fillfactor = {SESSIONS_FILLFACTOR})" in ddl
+        indexed = {c.name for ix in SessionRecord.__table__.indexes for c in ix.columns}
+        assert not indexed & {"next_seq", "updated_at"}
+
+
+class TestKnownSessionUpdatePath:
+    """Sessions with cached messages allocate seq via plain UPDATE, upsert as fallback."""
+
+    def test_known_session_statement_is_update_cte(self):
+        from sqlalchemy.dialects import postgresql
+
+        from src.session.manager import Message
+
+        stmt, _ = build_message_insert(
+            "s1", Message(role="user", content="hi"), "tok", session_exists=True,
+        )
+        sql = str(stmt.compile(dialect=postgresql.asyncpg.dialect()))
+        cte_part = sql.split("INSERT INTO neomagi.messages")[0]
+        assert cte_part.startswith("WITH seq_alloc AS \n(UPDATE neomagi.sessions")
+        assert "ON CONFLICT" not in sql
+        assert "lock_token" in cte_part
+        # Same as the upsert path: updated_at is carried over, not bumped.
+        assert "updated_at=neomagi.sessions.updated_at" in cte_part
+        assert "now()" not in cte_part
+
+    @pytest.mark.asyncio
+    async def test_first_append_upserts_then_update(self):
+        from unittest.mock import AsyncMock
+
+        manager = SessionManager(db_session_factory=MagicMock())
+        with patch.object(manager, "_run_seq_insert", AsyncMock(side_effect=[[0], [1]])) as run:
+            await manager.append_message("s1", "user", "a")
+            await manager.append_message("s1", "user", "b")
+
+        first, second = (c.args[0] for c in run.await_args_list)
+        assert first is build_message_insert("s1", MagicMock(), None)[0]
+        assert second is build_message_insert("s1", MagicMock(), None, session_exists=True)[0]
+
+    @pytest.mark.asyncio
+    async def test_empty_update_falls_back_to_upsert(self):
+        from unittest.mock import AsyncMock
+
+        from src.infra.errors import SessionFencingError
+
+        manager = SessionManager(db_session_factory=MagicMock())
+        with patch.object(manager, "_run_seq_insert", AsyncMock(side_effect=[[0], [], [1]])):
+            await manager.append_message("s1", "user", "a")
+            msg = await manager.append_message("s1", "user", "b")
+        assert msg.seq == 1
+
+        with patch.object(manager, "_run_seq_insert", AsyncMock(side_effect=[[], []])):
+            with pytest.raises(SessionFencingError):
+                await manager.append_message("s1", "user", "c", lock_token="stale")
+
+
+class TestEffectiveHistoryCut:
+    """get_effective_history returns seq > last_compaction_seq (ADR 0031)."""
+
+    @pytest.mark.asyncio
+    async def test_cut_matches_linear_filter(self):
+        manager = SessionManager(db_session_factory=MagicMock())
+        with patch.object(manager, "_persist_message", side_effect=range(6)):
+            for i in range(6):
+                await manager.append_message("s1", "user", f"m{i}")
+
+        for cut in (None, -1, 0, 3, 5, 9):
+            got = [m.seq for m in manager.get_effective_history("s1", cut)]
+            assert got == [s for s in range(6) if cut is None or s > cut]
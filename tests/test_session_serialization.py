@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import namedtuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -239,3 +240,298 @@ class TestForceReloadFailureInterrupts:
 
         result = await manager.load_session_from_db("s1", force=False)
         assert result is False
+
+
+_JoinRow = namedtuple("_JoinRow", "created_at updated_at message")
+
+
+def _streamed(rows: list) -> MagicMock:
+    """AsyncResult stand-in: partitions() yields the rows as one batch."""
+
+    async def partitions(*_args):
+        if rows:
+            yield rows
+
+    result = MagicMock()
+    result.partitions = partitions
+    return result
+
+
+class TestLoadSessionSingleQuery:
+    """load_session_from_db builds the session from one streamed LEFT JOIN result."""
+
+    @staticmethod
+    def _manager_with_rows(rows: list) -> tuple[SessionManager, AsyncMock]:
+        db_session = AsyncMock()
+        db_session.stream.return_value = _streamed(rows)
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=db_session)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        return SessionManager(db_session_factory=MagicMock(return_value=ctx)), db_session
+
+    @pytest.mark.asyncio
+    async def test_messages_loaded_in_one_execute(self):
+        from datetime import UTC, datetime
+
+        now = datetime.now(UTC)
+        msgs = [
+            MagicMock(role="user", content="hi", created_at=now, tool_calls=None,
+                      tool_call_id=None, seq=0),
+            MagicMock(role="assistant", content="yo", created_at=now, tool_calls=None,
+                      tool_call_id=None, seq=1),
+        ]
+        rows = [_JoinRow(now, now, m) for m in msgs]
+        manager, db_session = self._manager_with_rows(rows)
+
+        assert await manager.load_session_from_db("s1") is True
+        assert db_session.stream.await_count == 1
+        stmt = db_session.stream.await_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] > 0
+        assert [m.seq for m in manager.get_or_create("s1").messages] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_session_without_messages(self):
+        from datetime import UTC, datetime
+
+        now = datetime.now(UTC)
+        manager, _ = self._manager_with_rows([_JoinRow(now, now, None)])
+
+        assert await manager.load_session_from_db("s1") is True
+        assert manager.get_or_create("s1").messages == []
+
+    @pytest.mark.asyncio
+    async def test_missing_session_returns_false(self):
+        manager, _ = self._manager_with_rows([])
+
+        assert await manager.load_session_from_db("s1") is False
+
+
+class TestForceReloadVersionProbe:
+    """force reload of a cached session probes next_seq and fetches only the tail."""
+
+    @staticmethod
+    def _manager(results: list) -> tuple[SessionManager, AsyncMock]:
+        db_session = AsyncMock()
+        db_session.execute.side_effect = results
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=db_session)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        return SessionManager(db_session_factory=MagicMock(return_value=ctx)), db_session
+
+    @staticmethod
+    def _probe(next_seq, compaction=(None, None, None)) -> MagicMock:
+        result = MagicMock()
+        result.first.return_value = (next_seq, *compaction)
+        return result
+
+    @pytest.mark.asyncio
+    async def test_current_cache_skips_full_reload(self):
+        manager, db_session = self._manager([self._probe(2)])
+        with patch.object(manager, "_persist_message", side_effect=[0, 1]):
+            await manager.append_message("s1", "user", "a")
+            await manager.append_message("s1", "assistant", "b")
+        session = manager.get_or_create("s1")
+
+        assert await manager.load_session_from_db("s1", force=True) is True
+        assert db_session.execute.await_count == 1
+        assert manager.get_or_create("s1") is session
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_fetches_only_tail(self):
+        from datetime import UTC, datetime
+
+        now = datetime.now(UTC)
+        tail_msg = MagicMock(role="assistant", content="from-B", created_at=now,
+                             tool_calls=None, tool_call_id=None, seq=1)
+        tail = MagicMock()
+        tail.scalars.return_value.all.return_value = [tail_msg]
+        manager, db_session = self._manager([self._probe(2), tail])
+        with patch.object(manager, "_persist_message", return_value=0):
+            await manager.append_message("s1", "user", "from-A")
+        manager.get_history("s1")  # warm the OpenAI-format cache
+        session = manager.get_or_create("s1")
+
+        assert await manager.load_session_from_db("s1", force=True) is True
+        tail_stmt = str(db_session.execute.await_args_list[1].args[0])
+        assert "messages.seq >=" in tail_stmt
+        assert manager.get_or_create("s1") is session
+        assert [m.seq for m in session.messages] == [0, 1]
+        assert manager.get_history("s1")[-1]["content"] == "from-B"
+
+    @pytest.mark.asyncio
+    async def test_non_contiguous_cache_falls_back_to_full_reload(self):
+        from datetime import UTC, datetime
+
+        now = datetime.now(UTC)
+        msgs = [
+            MagicMock(role="user", content=c, created_at=now, tool_calls=None,
+                      tool_call_id=None, seq=seq)
+            for seq, c in enumerate(["a", "b", "c"])
+        ]
+        manager, db_session = self._manager([])
+        db_session.stream.return_value = _streamed([_JoinRow(now, now, m) for m in msgs])
+        with patch.object(manager, "_persist_message", return_value=2):
+            await manager.append_message("s1", "user", "c")  # cache lacks seq 0..1
+
+        assert await manager.load_session_from_db("s1", force=True) is True
+        assert db_session.execute.await_count == 0  # no probe, straight full load
+        assert db_session.stream.await_count == 1
+        assert [m.content for m in manager.get_or_create("s1").messages] == ["a", "b", "c"]
+
+
+class TestCompactionPrefetch:
+    """The claimed per-turn reload serves the next get_compaction_state from its probe."""
+
+    @pytest.mark.asyncio
+    async def test_prefetched_state_consumed_once(self):
+        from src.session.manager import _NOT_PREFETCHED
+
+        probe = TestForceReloadVersionProbe._probe(1, ("summary", 0, {"v": 1}))
+        manager, db_session = TestForceReloadVersionProbe._manager([probe])
+        with patch.object(manager, "_persist_message", return_value=0):
+            await manager.append_message("s1", "user", "a")
+
+        await manager.load_session_from_db("s1", force=True, prefetch_compaction=True)
+        state = await manager.get_compaction_state("s1")
+
+        assert state.compacted_context == "summary"
+        assert state.last_compaction_seq == 0
+        assert db_session.execute.await_count == 1  # probe only, no compaction query
+        assert manager.get_or_create("s1")._compaction_prefetch is _NOT_PREFETCHED
+
+    @pytest.mark.asyncio
+    async def test_unclaimed_reload_does_not_prefetch(self):
+        from src.session.manager import _NOT_PREFETCHED
+
+        probe = TestForceReloadVersionProbe._probe(1, ("summary", 0, None))
+        manager, _ = TestForceReloadVersionProbe._manager([probe])
+        with patch.object(manager, "_persist_message", return_value=0):
+            await manager.append_message("s1", "user", "a")
+
+        await manager.load_session_from_db("s1", force=True)
+        assert manager.get_or_create("s1")._compaction_prefetch is _NOT_PREFETCHED
+
+    @pytest.mark.asyncio
+    async def test_unclaimed_reload_drops_unconsumed_stash(self):
+        from src.session.manager import _NOT_PREFETCHED
+
+        probe = TestForceReloadVersionProbe._probe(1, ("summary", 0, None))
+        manager, _ = TestForceReloadVersionProbe._manager([probe, probe])
+        with patch.object(manager, "_persist_message", return_value=0):
+            await manager.append_message("s1", "user", "a")
+
+        await manager.load_session_from_db("s1", force=True, prefetch_compaction=True)
+        await manager.load_session_from_db("s1", force=True)
+        assert manager.get_or_create("s1")._compaction_prefetch is _NOT_PREFETCHED
+
+    @pytest.mark.asyncio
+    async def test_budget_denied_turn_releases_stash_with_claim(self):
+        """Reservation fails after the prefetch: release drops the unconsumed state."""
+        from src.gateway.budget_gate import Reservation
+        from src.gateway.dispatch import dispatch_chat
+        from src.infra.errors import GatewayError
+        from src.session.manager import _NOT_PREFETCHED, ClaimResult
+
+        probe = TestForceReloadVersionProbe._probe(1, ("summary", 0, None))
+        manager, db_session = TestForceReloadVersionProbe._manager([probe, MagicMock()])
+        with patch.object(manager, "_persist_message", return_value=0):
+            await manager.append_message("s1", "user", "a")
+        gate = MagicMock()
+        gate.try_reserve = AsyncMock(return_value=Reservation(denied=True, message="no"))
+
+        with (
+            patch.object(
+                manager, "claim_session_for_principal",
+                AsyncMock(return_value=ClaimResult(lock_token="tok", error_code=None)),
+            ),
+            pytest.raises(GatewayError, match="no"),
+        ):
+            async for _ in dispatch_chat(
+                registry=MagicMock(), session_manager=manager, budget_gate=gate,
+                session_id="s1", content="hi",
+            ):
+                pass  # pragma: no cover
+
+        assert db_session.execute.await_count == 2  # probe + lock release
+        assert manager.get_or_create("s1")._compaction_prefetch is _NOT_PREFETCHED
+
+
+class TestClaimTtlPredicate:
+    """TTL is bound as a parameter, so claim SQL text does not vary per ttl."""
+
+    def test_ttl_is_bound_not_inlined(self):
+        from sqlalchemy.dialects import postgresql
+
+        from src.session.statements import CLAIM_UPSERT, PRINCIPAL_CLAIM_UPSERT
+
+        dialect = postgresql.asyncpg.dialect()
+        for stmt in (CLAIM_UPSERT, PRINCIPAL_CLAIM_UPSERT):
+            sql = str(stmt.compile(dialect=dialect))
+            assert "interval" not in sql
+            assert "ttl" in stmt.compile().params
+
+
+class TestLoadedRoleInterned:
+    def test_role_from_record_is_interned(self):
+        import sys
+        from datetime import UTC, datetime
+
+        from src.session.manager import _message_from_record
+
+        role = "".join(["assis", "tant"])  # a distinct, non-interned str object
+        record = MagicMock(role=role, content="x", created_at=datetime.now(UTC),
+                           tool_calls=None, tool_call_id=None, seq=0)
+        assert _message_from_record(record).role is sys.intern("assistant")
+
+
+class TestPrebuiltLeaseStatements:
+    """Claim/release/mode statements are built once and only bind values per call."""
+
+    @staticmethod
+    def _factory():
+        db = AsyncMock()
+        db.execute.return_value = MagicMock()
+        db.execute.return_value.scalar_one_or_none.return_value = "s1"
+        ctx = MagicMock()
+        ctx.__aenter__ = AsyncMock(return_value=db)
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        return MagicMock(return_value=ctx), db
+
+    @pytest.mark.asyncio
+    async def test_claim_and_release_bind_params(self):
+        from datetime import timedelta
+
+        from src.session.statements import CLAIM_UPSERT, LOCK_RELEASE
+
+        factory, db = self._factory()
+        manager = SessionManager(db_session_factory=factory)
+        token = await manager.try_claim_session("s1", ttl_seconds=7)
+        await manager.release_session("s1", token)
+
+        (claim_stmt, claim_params), (release_stmt, release_params) = (
+            c.args for c in db.execute.await_args_list
+        )
+        assert claim_stmt is CLAIM_UPSERT
+        assert claim_params == {"sid": "s1", "token": token, "ttl": timedelta(seconds=7)}
+        assert release_stmt is LOCK_RELEASE
+        assert release_params == {"sid": "s1", "token": token}
+
+    @pytest.mark.asyncio
+    async def test_principal_claim_binds_params(self):
+        from datetime import timedelta
+
+        from src.session.statements import PRINCIPAL_CLAIM_UPSERT
+
+        factory, db = self._factory()
+        db.execute.return_value.first.return_value = ("s1", "p1")
+        manager = SessionManager(db_session_factory=factory)
+        result = await manager.claim_session_for_principal(
+            "s1", principal_id="p1", auth_mode=True, ttl_seconds=7,
+        )
+
+        stmt, params = db.execute.await_args.args
+        assert stmt is PRINCIPAL_CLAIM_UPSERT
+        assert params == {
+            "sid": "s1", "token": result.lock_token, "principal": "p1",
+            "ttl": timedelta(seconds=7),
+        }
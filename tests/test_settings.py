@@ -89,3 +89,12 @@ class TestTelegramMessageMaxLength:
     def test_valid_custom_value(self) -> None:
         s = TelegramSettings(message_max_length=2048)
         assert s.message_max_length == 2048
+
+
+class TestSessionSettingsCacheBound:
+    def test_default_cache_bound(self) -> None:
+        assert SessionSettings().cache_max_sessions == 1024
+
+    def test_cache_bound_must_be_positive(self) -> None:
+        with pytest.raises(ValidationError):
+            SessionSettings(cache_max_sessions=0)
@@ -134,6 +134,7 @@ def _make_loop(registry: ToolRegistry | None = None) -> MagicMock:
     loop._execute_tool = AsyncMock(side_effect=_exec_tool)
     loop._session_manager = MagicMock()
     loop._session_manager.append_message = AsyncMock()
+    loop._session_manager.append_messages = AsyncMock()
     return loop
 
 
@@ -429,14 +430,11 @@ class TestHandleToolCallsEventTiming:
 
         events: list = []
         append_order: list[str] = []
-        original_append = loop._session_manager.append_message
 
-        async def tracked_append(*args, **kwargs):
-            await original_append(*args, **kwargs)
-            if len(args) > 1 and args[1] == "tool":
-                append_order.append(f"append_tool:{kwargs.get('tool_call_id', '?')}")
+        async def tracked_append(session_id, messages, **kwargs):
+            append_order.extend(f"append_tool:{m.tool_call_id}" for m in messages)
 
-        loop._session_manager.append_message = AsyncMock(side_effect=tracked_append)
+        loop._session_manager.append_messages = AsyncMock(side_effect=tracked_append)
 
         tool_calls = [_tc("a", call_id="c1"), _tc("b", call_id="c2")]
         async for ev in _handle_tool_calls(
@@ -509,12 +507,10 @@ class TestHandleToolCallsEventTiming:
         ):
             pass
 
-        # First call is assistant message, then tool results in order
-        append_calls = loop._session_manager.append_message.call_args_list
-        tool_calls_appended = [
-            c.kwargs["tool_call_id"] for c in append_calls if "tool_call_id" in c.kwargs
-        ]
-        assert tool_calls_appended == ["c1", "c2"]
+        # Tool results of the group are persisted in one batch, in call order
+        loop._session_manager.append_messages.assert_awaited_once()
+        _, messages = loop._session_manager.append_messages.await_args.args
+        assert [(m.role, m.tool_call_id) for m in messages] == [("tool", "c1"), ("tool", "c2")]
 
 
 class TestExecuteGroup:
@@ -32,3 +32,6 @@ class TestToolContext:
         a = ToolContext(scope_key="main", session_id="s1")
         b = ToolContext(scope_key="main", session_id="s2")
         assert a != b
+
+    def test_slotted(self) -> None:
+        assert not hasattr(ToolContext(), "__dict__")
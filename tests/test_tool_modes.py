@@ -189,6 +189,35 @@ class TestRegistryModeFiltering:
             schema_names = {s["function"]["name"] for s in reg.get_tools_schema(mode)}
             assert tool_names == schema_names, f"Mismatch in mode {mode}"
 
+    def test_schema_cached_per_mode_until_registry_changes(self):
+        reg = self._make_registry()
+        first = reg.get_tools_schema(ToolMode.chat_safe)
+        again = reg.get_tools_schema(ToolMode.chat_safe)
+        assert again == first and again is not first
+        assert again[0] is first[0]  # dicts reused, list copied
+
+        reg.set_mode_override("safe_tool", frozenset({ToolMode.coding}))
+        assert reg.get_tools_schema(ToolMode.chat_safe) == []
+        reg.unregister("coding_tool")
+        assert {s["function"]["name"] for s in reg.get_tools_schema(ToolMode.coding)} == {
+            "safe_tool"
+        }
+
+    def test_turn_schema_resolution_uses_cache_only(self):
+        from unittest.mock import patch
+
+        from src.agent.message_flow import _resolve_tools_schema
+
+        reg = self._make_registry()
+        loop = MagicMock(_tool_registry=reg)
+        reg.get_tools_schema(ToolMode.coding)  # warm the cache
+        with patch.object(reg, "list_tools", side_effect=AssertionError("rebuilt")):
+            schema, fallback = _resolve_tools_schema(loop, ToolMode.coding)
+        assert schema is not None and fallback is schema
+
+        reg.set_mode_override("safe_tool", frozenset({ToolMode.coding}))
+        assert _resolve_tools_schema(loop, ToolMode.chat_safe) == (None, [])
+
 
 class TestRegistryFailClosedDefault:
     def test_bare_stub_invisible_in_chat_safe(self):
@@ -405,6 +434,7 @@ class TestExecutionGateDenial:
         user_msg = MagicMock()
         user_msg.seq = 0
         session_manager.append_message = AsyncMock(return_value=user_msg)
+        session_manager.append_messages = AsyncMock()
         session_manager.get_mode = AsyncMock(return_value=ToolMode.chat_safe)
         session_manager.get_compaction_state = AsyncMock(return_value=None)
         session_manager.get_effective_history = MagicMock(return_value=[])
@@ -583,6 +613,7 @@ class TestUnknownToolHandling:
         user_msg = MagicMock()
         user_msg.seq = 0
         session_manager.append_message = AsyncMock(return_value=user_msg)
+        session_manager.append_messages = AsyncMock()
         session_manager.get_mode = AsyncMock(return_value=ToolMode.chat_safe)
         session_manager.get_compaction_state = AsyncMock(return_value=None)
         session_manager.get_effective_history = MagicMock(return_value=[])
@@ -651,15 +682,15 @@ class TestUnknownToolHandling:
         async for _ in agent.handle_message("s-unknown", "test"):
             pass
 
-        # Find the tool result append_message call by tool_call_id
+        # Find the persisted tool result by tool_call_id
         import json as _json
-        tool_result_calls = [
-            call for call in session_manager.append_message.call_args_list
-            if call.kwargs.get("tool_call_id") == "call_ghost"
+        tool_results = [
+            msg for call in session_manager.append_messages.call_args_list
+            for msg in call.args[1] if msg.tool_call_id == "call_ghost"
         ]
-        assert len(tool_result_calls) == 1
+        assert len(tool_results) == 1
         # Parse the content JSON and verify error_code
-        content_json = _json.loads(tool_result_calls[0].args[2])
+        content_json = _json.loads(tool_results[0].content)
         assert content_json["error_code"] == "UNKNOWN_TOOL"
         assert "nonexistent_tool" in content_json["message"]
 